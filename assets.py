@@ -14,22 +14,96 @@
 ## Original Cactus Canyon software by Matt Coriale
 ##
 
-## This assets file is used to pre-load all the sound and dots when the program launches
-## That way, everything is in ram and readily accessible with no overhead when you need to use it
+## This assets file is used to register all the sounds and pre-load the fonts when the program launches
+## Sounds only get decoded the first time they play - see ep_sound
+## The dmd animations are registered here, but only loaded the first time something asks for them,
+## and the least recently used ones get dropped when they go over the memory budget
 
 from procgame import *
 import os
 import ep
+import time
+import collections
 
 curr_file_path = os.path.dirname(os.path.abspath( __file__ ))
 
+class LazyAnimations(object):
+    """Registry of dmd animations that loads each one on first use, and keeps the
+    most recently used ones in memory up to a byte budget."""
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.paths = {}
+        self.cache = collections.OrderedDict()
+        self.sizes = {}
+        self.bytes = 0
+        # first use latency per animation
+        self.load_times = {}
+        self.hits = 0
+        self.loads = 0
+        self.evictions = 0
+
+    def register(self, name, path):
+        self.paths[name] = path
+
+    def get(self, name):
+        if name in self.cache:
+            # bump it to the most recently used end
+            anim = self.cache.pop(name)
+            self.cache[name] = anim
+            self.hits += 1
+            return anim
+        start = time.time()
+        anim = dmd.Animation().load(self.paths[name])
+        if name not in self.load_times:
+            self.load_times[name] = time.time() - start
+        self.loads += 1
+        size = anim.width * anim.height * len(anim.frames)
+        self.cache[name] = anim
+        self.sizes[name] = size
+        self.bytes += size
+        self.trim()
+        return anim
+
+    def trim(self):
+        # drop the oldest animations until we're under budget - always keep the newest one
+        while self.bytes > self.budget and len(self.cache) > 1:
+            name, anim = self.cache.popitem(last=False)
+            self.bytes -= self.sizes[name]
+            self.evictions += 1
+
+    def warm_up(self, prefixes):
+        """Loads every registered animation whose name starts with one of the given prefixes"""
+        for name in sorted(self.paths):
+            for prefix in prefixes:
+                if name.startswith(prefix):
+                    self.get(name)
+                    break
+
+    def clear(self):
+        self.cache.clear()
+        self.bytes = 0
+
+    def report(self):
+        lines = []
+        lines.append("Animations: %d registered, %d loaded, %d KB of %d KB budget" % (len(self.paths), len(self.cache), self.bytes / 1024, self.budget / 1024))
+        lines.append("Loads: %d Hits: %d Evictions: %d" % (self.loads, self.hits, self.evictions))
+        slowest = sorted(self.load_times.items(), key=lambda item: item[1], reverse=True)
+        for name, seconds in slowest[:10]:
+            lines.append("  %s first use: %.1f ms" % (name, seconds * 1000))
+        return lines
+
 class Assets():
 
     def __init__(self, game):
 
+        start = time.time()
         self.game = game
         color_desktop = self.game.color_desktop
         print "Color Desktop Assets: " + str(color_desktop)
+        # memory budget for loaded animations - in megabytes in the config
+        budget = config.value_for_key_path(keypath='animation_cache_mb', default=48)
+        self.animations = LazyAnimations(budget * 1024 * 1024)
 
         # Paths
         self.lampshows_path = curr_file_path + "/lampshows/"
@@ -1551,342 +1625,296 @@ class Assets():
         self.game.GI_lampctrl.register_show("flasher-show",self.lampshows_path + "flasher-show.lampshow")
 
         # DMD pre-loading
-        self.dmd_blank = dmd.Animation().load(self.dmd_path +'blank.dmd')
-        self.dmd_ballyBanner = dmd.Animation().load(self.dmd_path +'bally-banner.dmd')
-        self.dmd_geckoBorderLeft = dmd.Animation().load(self.dmd_path +'gecko-border.dmd')
-        self.dmd_geckoBorderRight = dmd.Animation().load(self.dmd_path +'right-gecko-border.dmd')
-        self.dmd_procBanner = dmd.Animation().load(self.dmd_path +'splash.dmd')
+        self.animation('dmd_blank', self.dmd_path +'blank.dmd')
+        self.animation('dmd_ballyBanner', self.dmd_path +'bally-banner.dmd')
+        self.animation('dmd_geckoBorderLeft', self.dmd_path +'gecko-border.dmd')
+        self.animation('dmd_geckoBorderRight', self.dmd_path +'right-gecko-border.dmd')
+        self.animation('dmd_procBanner', self.dmd_path +'splash.dmd')
         if color_desktop:
-            self.dmd_cccBanner = dmd.Animation().load(self.dmd_path +'ccc-banner-color.dmd')
-            self.dmd_ccBanner = dmd.Animation().load(self.dmd_path+'cactus-canyon-banner-color.dmd')
+            self.animation('dmd_cccBanner', self.dmd_path +'ccc-banner-color.dmd')
+            self.animation('dmd_ccBanner', self.dmd_path+'cactus-canyon-banner-color.dmd')
         else:
-            self.dmd_cccBanner = dmd.Animation().load(self.dmd_path +'ccc-banner.dmd')
-            self.dmd_ccBanner = dmd.Animation().load(self.dmd_path+'cactus-canyon-banner.dmd')
-
-        self.dmd_quickdrawStill = dmd.Animation().load(self.dmd_path+'quick-draw-still.dmd')
-
-        self.dmd_mayorFeet = dmd.Animation().load(self.dmd_path +'mayor-feet.dmd')
-        self.dmd_mayorPan = dmd.Animation().load(self.dmd_path +'mayor-pan.dmd')
-        self.dmd_bountyCollected = dmd.Animation().load(self.dmd_path +'bounty-collected.dmd')
-        self.dmd_moneybagBorder = dmd.Animation().load(self.dmd_path +'moneybag-border.dmd')
-        self.dmd_moneybagBorderRight = dmd.Animation().load(self.dmd_path+'moneybag-right.dmd')
-        self.dmd_starsBorder = dmd.Animation().load(self.dmd_path +'stars-border.dmd')
-        self.dmd_tracksBorder = dmd.Animation().load(self.dmd_path +'tracks-border.dmd')
-        self.dmd_gunsBorder = dmd.Animation().load(self.dmd_path +'guns-border.dmd')
-        self.dmd_woodcutBorder = dmd.Animation().load(self.dmd_path +'woodcut-border.dmd')
-        self.dmd_cactusBorder = dmd.Animation().load(self.dmd_path +'cactus-border.dmd')
-        self.dmd_singleCactusBorder = dmd.Animation().load(self.dmd_path + 'single-cactus-border.dmd')
-        self.dmd_weaveBorder = dmd.Animation().load(self.dmd_path +'weave-border.dmd')
-        self.dmd_skullsBorder = dmd.Animation().load(self.dmd_path+'skulls-border.dmd')
-        self.dmd_singleCowboyBorder = dmd.Animation().load(self.dmd_path +'single-cowboy-border.dmd')
-        self.dmd_singleCowboyBorderRight = dmd.Animation().load(self.dmd_path+'cowboy-border-right.dmd')
-        self.dmd_singleCowboySidewaysBorder = dmd.Animation().load(self.dmd_path+'single-cowboy-sideways-border.dmd')
-        self.dmd_mineEntranceBorder = dmd.Animation().load(self.dmd_path +'mine-entrance-border.dmd')
-        self.dmd_simpleBorder = dmd.Animation().load(self.dmd_path + 'simple_border.dmd')
-        self.dmd_singlePixelBorder = dmd.Animation().load(self.dmd_path + 'single_pixel_border.dmd')
-        self.dmd_ropeBorder = dmd.Animation().load(self.dmd_path + 'rope-border.dmd')
-        self.dmd_skyline = dmd.Animation().load(self.dmd_path+'skyline.dmd')
-        self.dmd_bartender = dmd.Animation().load(self.dmd_path + 'bartender.dmd')
-        self.dmd_escaped = dmd.Animation().load(self.dmd_path +'escaped.dmd')
-        self.dmd_stringBorder = dmd.Animation().load(self.dmd_path+'string-border.dmd')
-        self.dmd_status_banner_magenta = dmd.Animation().load(self.dmd_path+'message_banner_magenta.dmd')
-
-        self.dmd_tombstone = dmd.Animation().load(self.dmd_path+'tombstone.dmd')
-        self.dmd_beerMug = dmd.Animation().load(self.dmd_path +'beer-mug-1.dmd')
-
-        self.dmd_cashWipe = dmd.Animation().load(self.dmd_path +'cash-wipe.dmd')
-        self.dmd_burstWipe = dmd.Animation().load(self.dmd_path +'burst-wipe.dmd')
-        self.dmd_burstWipe2 = dmd.Animation().load(self.dmd_path +'burst-wipe-2.dmd')
-        self.dmd_horseWipeRight = dmd.Animation().load(self.dmd_path+'horse-wipe-right.dmd')
-
-        self.dmd_blankRiver = dmd.Animation().load(self.dmd_path +'blank-river.dmd')
-        self.dmd_blankRiverLoop = dmd.Animation().load(self.dmd_path + 'blank-river-loop.dmd')
-        self.dmd_rowboat = dmd.Animation().load(self.dmd_path +'rowboat.dmd')
-        self.dmd_rowboatLoop = dmd.Animation().load(self.dmd_path + 'rowboat-cycle.dmd')
-        self.dmd_horseLoop = dmd.Animation().load(self.dmd_path + 'horse-loop.dmd')
-        self.dmd_riverChase = dmd.Animation().load(self.dmd_path +'river-chase.dmd')
-
-        self.dmd_bankExplodes = dmd.Animation().load(self.dmd_path +'bank-explodes.dmd')
-        self.dmd_bankSheriff = dmd.Animation().load(self.dmd_path +'bank-sherrif-arrives.dmd')
-        self.dmd_bankDude = dmd.Animation().load(self.dmd_path + 'dude-shoots-bank.dmd')
-        self.dmd_bankInterior = dmd.Animation().load(self.dmd_path + 'bank-interior.dmd')
-        self.dmd_hatbTitle = dmd.Animation().load(self.dmd_path +'polly-peril-hatb.dmd')
-
-        self.dmd_trainHeadOn = dmd.Animation().load(self.dmd_path+'train-head-on.dmd')
-        self.dmd_cowOnTracks = dmd.Animation().load(self.dmd_path+'cow-on-tracks.dmd')
-        self.dmd_ttttBanner = dmd.Animation().load(self.dmd_path+'polly-peril-tttt.dmd')
-        self.dmd_pollyOnTracks = dmd.Animation().load(self.dmd_path +'train-polly-on-tracks.dmd')
-
-        self.dmd_pollyMurder = dmd.Animation().load(self.dmd_path + 'train-murder.dmd')
-        self.dmd_poutySheriff = dmd.Animation().load(self.dmd_path + 'pouty-sheriff.dmd')
-
-        self.dmd_dudeShotFullBody = dmd.Animation().load(self.dmd_path+'dude-gets-shot-full-body.dmd')
-        self.dmd_dudeShotShouldersUp = dmd.Animation().load(self.dmd_path+'dude-gets-shot-shoulders-up.dmd')
-        self.dmd_dudeShoots = dmd.Animation().load(self.dmd_path+'dude-shoots.dmd')
-
-        self.dmd_trainBoarding = dmd.Animation().load(self.dmd_path +'train-boarding.dmd')
-        self.dmd_trainRunning = dmd.Animation().load(self.dmd_path +'train-running-on-top.dmd')
-        self.dmd_trainBrakes = dmd.Animation().load(self.dmd_path +'train-brake-pull.dmd')
-
-        self.dmd_pollyIntro = dmd.Animation().load(self.dmd_path +'polly-peril.dmd')
-        self.dmd_pollyVictory = dmd.Animation().load(self.dmd_path +'bank-victory-animation.dmd')
-        self.dmd_ourHero = dmd.Animation().load(self.dmd_path+'our-hero.dmd')
-        self.dmd_rotrTitle = dmd.Animation().load(self.dmd_path +'polly-peril-rotr.dmd')
-
-        self.dmd_horseRunLeft = dmd.Animation().load(self.dmd_path + 'horse-run-left.dmd')
-        self.dmd_horseRunRight = dmd.Animation().load(self.dmd_path + 'horse-run-right.dmd')
-        self.dmd_horseDrag = dmd.Animation().load(self.dmd_path + 'horse-drag.dmd')
-        self.dmd_horseChase = dmd.Animation().load(self.dmd_path + 'horse-chase.dmd')
-
-        self.dmd_shotBottles = dmd.Animation().load(self.dmd_path +'shot-bottles-animation.dmd')
-        self.dmd_shotCandles = dmd.Animation().load(self.dmd_path +'shot-candles-animation.dmd')
-        self.dmd_shotCard = dmd.Animation().load(self.dmd_path +'shot-card-animation.dmd')
-        self.dmd_smokingCard = dmd.Animation().load(self.dmd_path +'smoking-card-loop.dmd')
-
-        self.dmd_tumbleweedBanner = dmd.Animation().load(self.dmd_path +'tumbleweed-banner.dmd')
-        self.dmd_tumbleweedRight = dmd.Animation().load(self.dmd_path +'tumbleweed-right.dmd')
-        self.dmd_tumbleweedLeft = dmd.Animation().load(self.dmd_path +'tumbleweed.dmd')
-        self.dmd_tumbleweedAttract = dmd.Animation().load(self.dmd_path +'tumbleweed-attract.dmd')
-
-        self.dmd_superBlink = dmd.Animation().load(self.dmd_path +'super-blink.dmd')
-        self.dmd_superSkillShot = dmd.Animation().load(self.dmd_path +'super-skill-shot.dmd')
-
-        self.dmd_quickdrawStart = dmd.Animation().load(self.dmd_path +'quickdraw-start.dmd')
-        self.dmd_quickdrawHit = dmd.Animation().load(self.dmd_path +'quickdraw-hit.dmd')
-
+            self.animation('dmd_cccBanner', self.dmd_path +'ccc-banner.dmd')
+            self.animation('dmd_ccBanner', self.dmd_path+'cactus-canyon-banner.dmd')
+        self.animation('dmd_quickdrawStill', self.dmd_path+'quick-draw-still.dmd')
+        self.animation('dmd_mayorFeet', self.dmd_path +'mayor-feet.dmd')
+        self.animation('dmd_mayorPan', self.dmd_path +'mayor-pan.dmd')
+        self.animation('dmd_bountyCollected', self.dmd_path +'bounty-collected.dmd')
+        self.animation('dmd_moneybagBorder', self.dmd_path +'moneybag-border.dmd')
+        self.animation('dmd_moneybagBorderRight', self.dmd_path+'moneybag-right.dmd')
+        self.animation('dmd_starsBorder', self.dmd_path +'stars-border.dmd')
+        self.animation('dmd_tracksBorder', self.dmd_path +'tracks-border.dmd')
+        self.animation('dmd_gunsBorder', self.dmd_path +'guns-border.dmd')
+        self.animation('dmd_woodcutBorder', self.dmd_path +'woodcut-border.dmd')
+        self.animation('dmd_cactusBorder', self.dmd_path +'cactus-border.dmd')
+        self.animation('dmd_singleCactusBorder', self.dmd_path + 'single-cactus-border.dmd')
+        self.animation('dmd_weaveBorder', self.dmd_path +'weave-border.dmd')
+        self.animation('dmd_skullsBorder', self.dmd_path+'skulls-border.dmd')
+        self.animation('dmd_singleCowboyBorder', self.dmd_path +'single-cowboy-border.dmd')
+        self.animation('dmd_singleCowboyBorderRight', self.dmd_path+'cowboy-border-right.dmd')
+        self.animation('dmd_singleCowboySidewaysBorder', self.dmd_path+'single-cowboy-sideways-border.dmd')
+        self.animation('dmd_mineEntranceBorder', self.dmd_path +'mine-entrance-border.dmd')
+        self.animation('dmd_simpleBorder', self.dmd_path + 'simple_border.dmd')
+        self.animation('dmd_singlePixelBorder', self.dmd_path + 'single_pixel_border.dmd')
+        self.animation('dmd_ropeBorder', self.dmd_path + 'rope-border.dmd')
+        self.animation('dmd_skyline', self.dmd_path+'skyline.dmd')
+        self.animation('dmd_bartender', self.dmd_path + 'bartender.dmd')
+        self.animation('dmd_escaped', self.dmd_path +'escaped.dmd')
+        self.animation('dmd_stringBorder', self.dmd_path+'string-border.dmd')
+        self.animation('dmd_status_banner_magenta', self.dmd_path+'message_banner_magenta.dmd')
+        self.animation('dmd_tombstone', self.dmd_path+'tombstone.dmd')
+        self.animation('dmd_beerMug', self.dmd_path +'beer-mug-1.dmd')
+        self.animation('dmd_cashWipe', self.dmd_path +'cash-wipe.dmd')
+        self.animation('dmd_burstWipe', self.dmd_path +'burst-wipe.dmd')
+        self.animation('dmd_burstWipe2', self.dmd_path +'burst-wipe-2.dmd')
+        self.animation('dmd_horseWipeRight', self.dmd_path+'horse-wipe-right.dmd')
+        self.animation('dmd_blankRiver', self.dmd_path +'blank-river.dmd')
+        self.animation('dmd_blankRiverLoop', self.dmd_path + 'blank-river-loop.dmd')
+        self.animation('dmd_rowboat', self.dmd_path +'rowboat.dmd')
+        self.animation('dmd_rowboatLoop', self.dmd_path + 'rowboat-cycle.dmd')
+        self.animation('dmd_horseLoop', self.dmd_path + 'horse-loop.dmd')
+        self.animation('dmd_riverChase', self.dmd_path +'river-chase.dmd')
+        self.animation('dmd_bankExplodes', self.dmd_path +'bank-explodes.dmd')
+        self.animation('dmd_bankSheriff', self.dmd_path +'bank-sherrif-arrives.dmd')
+        self.animation('dmd_bankDude', self.dmd_path + 'dude-shoots-bank.dmd')
+        self.animation('dmd_bankInterior', self.dmd_path + 'bank-interior.dmd')
+        self.animation('dmd_hatbTitle', self.dmd_path +'polly-peril-hatb.dmd')
+        self.animation('dmd_trainHeadOn', self.dmd_path+'train-head-on.dmd')
+        self.animation('dmd_cowOnTracks', self.dmd_path+'cow-on-tracks.dmd')
+        self.animation('dmd_ttttBanner', self.dmd_path+'polly-peril-tttt.dmd')
+        self.animation('dmd_pollyOnTracks', self.dmd_path +'train-polly-on-tracks.dmd')
+        self.animation('dmd_pollyMurder', self.dmd_path + 'train-murder.dmd')
+        self.animation('dmd_poutySheriff', self.dmd_path + 'pouty-sheriff.dmd')
+        self.animation('dmd_dudeShotFullBody', self.dmd_path+'dude-gets-shot-full-body.dmd')
+        self.animation('dmd_dudeShotShouldersUp', self.dmd_path+'dude-gets-shot-shoulders-up.dmd')
+        self.animation('dmd_dudeShoots', self.dmd_path+'dude-shoots.dmd')
+        self.animation('dmd_trainBoarding', self.dmd_path +'train-boarding.dmd')
+        self.animation('dmd_trainRunning', self.dmd_path +'train-running-on-top.dmd')
+        self.animation('dmd_trainBrakes', self.dmd_path +'train-brake-pull.dmd')
+        self.animation('dmd_pollyIntro', self.dmd_path +'polly-peril.dmd')
+        self.animation('dmd_pollyVictory', self.dmd_path +'bank-victory-animation.dmd')
+        self.animation('dmd_ourHero', self.dmd_path+'our-hero.dmd')
+        self.animation('dmd_rotrTitle', self.dmd_path +'polly-peril-rotr.dmd')
+        self.animation('dmd_horseRunLeft', self.dmd_path + 'horse-run-left.dmd')
+        self.animation('dmd_horseRunRight', self.dmd_path + 'horse-run-right.dmd')
+        self.animation('dmd_horseDrag', self.dmd_path + 'horse-drag.dmd')
+        self.animation('dmd_horseChase', self.dmd_path + 'horse-chase.dmd')
+        self.animation('dmd_shotBottles', self.dmd_path +'shot-bottles-animation.dmd')
+        self.animation('dmd_shotCandles', self.dmd_path +'shot-candles-animation.dmd')
+        self.animation('dmd_shotCard', self.dmd_path +'shot-card-animation.dmd')
+        self.animation('dmd_smokingCard', self.dmd_path +'smoking-card-loop.dmd')
+        self.animation('dmd_tumbleweedBanner', self.dmd_path +'tumbleweed-banner.dmd')
+        self.animation('dmd_tumbleweedRight', self.dmd_path +'tumbleweed-right.dmd')
+        self.animation('dmd_tumbleweedLeft', self.dmd_path +'tumbleweed.dmd')
+        self.animation('dmd_tumbleweedAttract', self.dmd_path +'tumbleweed-attract.dmd')
+        self.animation('dmd_superBlink', self.dmd_path +'super-blink.dmd')
+        self.animation('dmd_superSkillShot', self.dmd_path +'super-skill-shot.dmd')
+        self.animation('dmd_quickdrawStart', self.dmd_path +'quickdraw-start.dmd')
+        self.animation('dmd_quickdrawHit', self.dmd_path +'quickdraw-hit.dmd')
         #self.dmd_gunfightTop = dmd.Animation().load(self.dmd_path+'gunfight-top.dmd')
-        self.dmd_gunfightMask = dmd.Animation().load(self.dmd_path +'gunfight-mask.dmd')
+        self.animation('dmd_gunfightMask', self.dmd_path +'gunfight-mask.dmd')
         if self.game.user_settings['Gameplay (Feature)']['Gunfight Mountain'] == 'Green':
-            self.dmd_gunfightPan = dmd.Animation().load(self.dmd_path+'gunfight-pan.dmd')
+            self.animation('dmd_gunfightPan', self.dmd_path+'gunfight-pan.dmd')
         else:
-            self.dmd_gunfightPan = dmd.Animation().load(self.dmd_path+'gunfight-pan-brown.dmd')
-        self.dmd_gunfightEyes = dmd.Animation().load(self.dmd_path+'gunfight-eyes.dmd')
-        self.dmd_gunfightHands = dmd.Animation().load(self.dmd_path+'gunfight-hands.dmd')
-        self.dmd_gunfightBoots = dmd.Animation().load(self.dmd_path+'gunfight-boots.dmd')
-
-        self.dmd_ambush = dmd.Animation().load(self.dmd_path +'ambush.dmd')
-        self.dmd_showdown = dmd.Animation().load(self.dmd_path +'showdown.dmd')
-        self.dmd_cloudLightning = dmd.Animation().load(self.dmd_path +'cloud-lightning.dmd')
-        self.dmd_townPan = dmd.Animation().load(self.dmd_path +'town-pan.dmd')
-
-        self.dmd_stampede = dmd.Animation().load(self.dmd_path + 'stampede-animation.dmd')
-        self.dmd_cowsParading = dmd.Animation().load(self.dmd_path +'cows-parading.dmd')
-        self.dmd_stampedeJackpot = dmd.Animation().load(self.dmd_path +'stampede-jackpot.dmd')
-        self.dmd_cowsLeft = dmd.Animation().load(self.dmd_path + 'cows-left.dmd')
-        self.dmd_cowsRight = dmd.Animation().load(self.dmd_path + 'cows-right.dmd')
-        self.dmd_stampedeBannerLeft = dmd.Animation().load(self.dmd_path +'stampede-banner-left.dmd')
-        self.dmd_stampedeBannerRight = dmd.Animation().load(self.dmd_path + 'stampede-banner-right.dmd')
-
-        self.dmd_shootAgain = dmd.Animation().load(self.dmd_path+'shoot-again.dmd')
-        self.dmd_ball = dmd.Animation().load(self.dmd_path +'ball.dmd')
-        self.dmd_extraBall = dmd.Animation().load(self.dmd_path +'extra-ball.dmd')
-        self.dmd_bonusCactus = dmd.Animation().load(self.dmd_path+'bonus-cactus-mash.dmd')
-        self.dmd_bonusTrain = dmd.Animation().load(self.dmd_path+'bonus-train.dmd')
-
-        self.dmd_lockOne = dmd.Animation().load(self.dmd_path +'ball-one-locked.dmd')
-        self.dmd_lockTwo = dmd.Animation().load(self.dmd_path +'ball-two-locked.dmd')
-        self.dmd_multiballStart = dmd.Animation().load(self.dmd_path+'multiball-start.dmd')
-        self.dmd_multiballBannerInverse = dmd.Animation().load(self.dmd_path +'multiball-banner-inverse.dmd')
-        self.dmd_multiballBanner = dmd.Animation().load(self.dmd_path +'multiball-banner.dmd')
-        self.dmd_multiballFrame = dmd.Animation().load(self.dmd_path +'multiball-frame.dmd')
-        self.dmd_mineCarCrash = dmd.Animation().load(self.dmd_path +'mine-car-crash.dmd')
-        self.dmd_goldmineJackpot = dmd.Animation().load(self.dmd_path +'jackpot.dmd')
-
-        self.dmd_bamBanner = dmd.Animation().load(self.dmd_path + 'bam-banner.dmd')
-        self.dmd_biffBanner = dmd.Animation().load(self.dmd_path + 'biff-banner.dmd')
-        self.dmd_ouchBanner = dmd.Animation().load(self.dmd_path + 'ouch-banner.dmd')
-        self.dmd_powBanner = dmd.Animation().load(self.dmd_path + 'pow-banner.dmd')
-        self.dmd_whamBanner = dmd.Animation().load(self.dmd_path + 'wham-banner.dmd')
-        self.dmd_zoinkBanner = dmd.Animation().load(self.dmd_path + 'zoink-banner.dmd')
-
-        self.dmd_bigPosterA = dmd.Animation().load(self.dmd_path +'wanted-BIG-A.dmd')
-        self.dmd_bandeleroPosterA = dmd.Animation().load(self.dmd_path + 'wanted-BANDELERO-A.dmd')
-        self.dmd_bubbaPosterA = dmd.Animation().load(self.dmd_path + 'wanted-BUBBA-A.dmd')
-        self.dmd_bossPosterA = dmd.Animation().load(self.dmd_path + 'wanted-BOSS-A.dmd')
-        self.dmd_rudyPosterA = dmd.Animation().load(self.dmd_path + 'rudy-wanted-a.dmd')
-        self.dmd_bullPosterA = dmd.Animation().load(self.dmd_path + 'bull-wanted-a.dmd')
-        self.dmd_bettyPosterA = dmd.Animation().load(self.dmd_path + 'betty-wanted-a.dmd')
-
-        self.dmd_bigPosterB = dmd.Animation().load(self.dmd_path +'wanted-BIG-B.dmd')
-        self.dmd_bandeleroPosterB = dmd.Animation().load(self.dmd_path + 'wanted-BANDELERO-B.dmd')
-        self.dmd_bubbaPosterB = dmd.Animation().load(self.dmd_path + 'wanted-BUBBA-B.dmd')
-        self.dmd_bossPosterB = dmd.Animation().load(self.dmd_path + 'wanted-BOSS-B.dmd')
-        self.dmd_rudyPosterB = dmd.Animation().load(self.dmd_path + 'rudy-wanted-b.dmd')
-        self.dmd_bullPosterB = dmd.Animation().load(self.dmd_path + 'bull-wanted-b.dmd')
-        self.dmd_bettyPosterB = dmd.Animation().load(self.dmd_path + 'betty-wanted-b.dmd')
-
-        self.dmd_big = dmd.Animation().load(self.dmd_path + 'face-BIG.dmd')
-        self.dmd_bandelero = dmd.Animation().load(self.dmd_path + 'face-BANDELERO.dmd')
-        self.dmd_bubba = dmd.Animation().load(self.dmd_path + 'face-BUBBA.dmd')
-        self.dmd_boss = dmd.Animation().load(self.dmd_path + 'boss.dmd')
-        self.dmd_rudy = dmd.Animation().load(self.dmd_path + 'rudy-start.dmd')
-        self.dmd_bull = dmd.Animation().load(self.dmd_path + 'bull-start.dmd')
-        self.dmd_betty = dmd.Animation().load(self.dmd_path + 'betty-start.dmd')
-
-        self.dmd_bigHit = dmd.Animation().load(self.dmd_path + 'hit-BIG.dmd')
-        self.dmd_bandeleroHit = dmd.Animation().load(self.dmd_path + 'hit-BANDELERO.dmd')
-        self.dmd_bubbaHit = dmd.Animation().load(self.dmd_path + 'hit-BUBBA.dmd')
-        self.dmd_bossHit = dmd.Animation().load(self.dmd_path+'boss-hit.dmd')
-        self.dmd_rudyHit = dmd.Animation().load(self.dmd_path + 'rudy-hit.dmd')
-        self.dmd_bullHit = dmd.Animation().load(self.dmd_path + 'bull-hit.dmd')
-        self.dmd_bettyHit = dmd.Animation().load(self.dmd_path + 'betty-hit.dmd')
-
-        self.dmd_trainOnTracks = dmd.Animation().load(self.dmd_path+'train-on-tracks.dmd')
-        self.dmd_trainMoveRight = dmd.Animation().load(self.dmd_path+'train-on-tracks-move-right.dmd')
-        self.dmd_trainMoveLeft = dmd.Animation().load(self.dmd_path+'train-on-tracks-move-left.dmd')
-        self.dmd_emptyTrack = dmd.Animation().load(self.dmd_path+'empty-track.dmd')
-
-        self.dmd_dmbIdle = dmd.Animation().load(self.dmd_path+'dmb-idle.dmd')
-        self.dmd_reverse = dmd.Animation().load(self.dmd_path+'reverse.dmd')
-        self.dmd_pourMask = dmd.Animation().load(self.dmd_path+'pour-mask.dmd')
-        self.dmd_beerMug1 = dmd.Animation().load(self.dmd_path+'beer-mug-1.dmd')
-        self.dmd_drunkMultiball = dmd.Animation().load(self.dmd_path+'drunk-multiball.dmd')
-        self.dmd_flippers1 = dmd.Animation().load(self.dmd_path+'flippers1.dmd')
-        self.dmd_flippers2 = dmd.Animation().load(self.dmd_path+'flippers2.dmd')
-        self.dmd_flippers3 = dmd.Animation().load(self.dmd_path+'flippers3.dmd')
-        self.dmd_rightArrow1 = dmd.Animation().load(self.dmd_path+'right-arrow-1.dmd')
-        self.dmd_rightArrow2 = dmd.Animation().load(self.dmd_path+'right-arrow-2.dmd')
-        self.dmd_rightArrow3 = dmd.Animation().load(self.dmd_path+'right-arrow-3.dmd')
-        self.dmd_leftArrow1 = dmd.Animation().load(self.dmd_path+'left-arrow-1.dmd')
-        self.dmd_leftArrow2 = dmd.Animation().load(self.dmd_path+'left-arrow-2.dmd')
-        self.dmd_leftArrow3 = dmd.Animation().load(self.dmd_path+'left-arrow-3.dmd')
-        self.dmd_dmb = dmd.Animation().load(self.dmd_path+'dmb.dmd')
-        self.dmd_dmbJackpotAdded = dmd.Animation().load(self.dmd_path+'jackpot-added.dmd')
-        self.dmd_beerSlide = dmd.Animation().load(self.dmd_path+'beer-slide.dmd')
-        self.dmd_dmbJackpot = dmd.Animation().load(self.dmd_path+'dmb-jackpot.dmd')
-        
-        self.dmd_match = dmd.Animation().load(self.dmd_path+'match.dmd')
-        
-        self.dmd_bionicCombo = dmd.Animation().load(self.dmd_path +'bionic-combo.dmd')
-        self.dmd_bionicHit = dmd.Animation().load(self.dmd_path+'bionic-hit.dmd')
-        self.dmd_bionicGunClose = dmd.Animation().load(self.dmd_path+'gun-close.dmd')
-        self.dmd_bionicGunLoad = dmd.Animation().load(self.dmd_path+'gun-load.dmd')
-        self.dmd_bionicGunUnload = dmd.Animation().load(self.dmd_path+'gun-unload.dmd')
-        self.dmd_bionicGunOpen = dmd.Animation().load(self.dmd_path+'gun-open.dmd')
-        self.dmd_bionicDeath = dmd.Animation().load(self.dmd_path+'bionic-death.dmd')
-        self.dmd_bionicDeathTalking = dmd.Animation().load(self.dmd_path+'bionic-death-talking.dmd')
-        self.dmd_bionicExplode = dmd.Animation().load(self.dmd_path+'bionic-explode.dmd')
-        
-        self.dmd_cvaStandingAlien0 = dmd.Animation().load(self.dmd_path+'cva_standing_alien0.dmd')
-        self.dmd_cvaStandingAlien1 = dmd.Animation().load(self.dmd_path+'cva_standing_alien1.dmd')
-        self.dmd_cvaStandingAlien2 = dmd.Animation().load(self.dmd_path+'cva_standing_alien2.dmd')
-        self.dmd_cvaStandingAlien3 = dmd.Animation().load(self.dmd_path+'cva_standing_alien3.dmd')
-        self.dmd_cvaSmallShip = dmd.Animation().load(self.dmd_path+'cva_small_ship.dmd')
-        self.dmd_cvaLargeShip = dmd.Animation().load(self.dmd_path+'cva_large_ship.dmd')
-        self.dmd_cvaLargeShipExplodes = dmd.Animation().load(self.dmd_path+'cva_large_ship_explodes.dmd')
-        self.dmd_cvaShipBehindStatic = dmd.Animation().load(self.dmd_path+'cva_ship_behind_static.dmd')
-        self.dmd_cvaStatic = dmd.Animation().load(self.dmd_path+'cva_static.dmd')
-        self.dmd_cvaTeleport = dmd.Animation().load(self.dmd_path+'cva_teleport.dmd')
-        self.dmd_cvaShot = dmd.Animation().load(self.dmd_path+'cva_shot.dmd')
-        self.dmd_cvaIntro = dmd.Animation().load(self.dmd_path+'cva_intro.dmd')
-        self.dmd_cvaBlastWipe = dmd.Animation().load(self.dmd_path+'cva_blast_wipe.dmd')
-        self.dmd_cvaDesert = dmd.Animation().load(self.dmd_path+'cva_desert_empty.dmd')
-        self.dmd_cvaShipsBorder = dmd.Animation().load(self.dmd_path+'cva_ships_border.dmd')
-        self.dmd_cvaAliensBorder = dmd.Animation().load(self.dmd_path+'cva_aliens_border.dmd')
-        
-        self.dmd_highNoonBackdrop = dmd.Animation().load(self.dmd_path+'high-noon-backdrop.dmd')
-        self.dmd_bellTower = dmd.Animation().load(self.dmd_path+'bell-ring.dmd')
-        self.dmd_highNoon = dmd.Animation().load(self.dmd_path+'high-noon.dmd')
-        self.dmd_goodLuck = dmd.Animation().load(self.dmd_path+'good-luck.dmd')
-        self.dmd_fireworks = dmd.Animation().load(self.dmd_path+'fireworks.dmd')
-
-        self.dmd_marshallBorder = dmd.Animation().load(self.dmd_path+'marshall-border.dmd')
-        self.dmd_marshallHighScoreFrame = dmd.Animation().load(self.dmd_path+'marshall-highscore-frame.dmd')
-
-        self.dmd_lastCall = dmd.Animation().load(self.dmd_path+'last_call.dmd')
-        self.dmd_beerFill = dmd.Animation().load(self.dmd_path+'beer-fill.dmd')
-
-        self.dmd_cows = dmd.Animation().load(self.dmd_path+'crazy_cows.dmd')
-        self.dmd_moother = dmd.Animation().load(self.dmd_path+'moother.dmd')
-        self.dmd_explosionWipe1 = dmd.Animation().load(self.dmd_path+'boom-wipe-1.dmd')
-        self.dmd_explosionWipe2 = dmd.Animation().load(self.dmd_path+'boom-wipe-2.dmd')
-        self.dmd_motherlode = dmd.Animation().load(self.dmd_path+'motherlode.dmd')
-
-        self.dmd_1pBurnCycle = dmd.Animation().load(self.dmd_path+'1p_burn_cycle.dmd')
-
-        self.dmd_mmJacob = dmd.Animation().load(self.dmd_path+'mm_jacob.dmd')
-        self.dmd_mmZap = dmd.Animation().load(self.dmd_path+'mm_zap.dmd')
-        self.dmd_mmPowie = dmd.Animation().load(self.dmd_path+'mm_powie.dmd')
-        self.dmd_mmDOHO = dmd.Animation().load(self.dmd_path+'mm_doho.dmd')
-        self.dmd_mmCrash = dmd.Animation().load(self.dmd_path+'mm_crash.dmd')
-        self.dmd_mmBoom = dmd.Animation().load(self.dmd_path+'mm_boom.dmd')
-        self.dmd_mmBang = dmd.Animation().load(self.dmd_path+'mm_bang.dmd')
-        self.dmd_moonIntro = dmd.Animation().load(self.dmd_path+'moon-intro.dmd')
-
-        self.dmd_ballSaved = dmd.Animation().load(self.dmd_path+'ball_saved.dmd')
-
-        self.dmd_switchMatrix = dmd.Animation().load(self.dmd_path+'matrix_backdrop.dmd')
-        self.dmd_testBackdrop = dmd.Animation().load(self.dmd_path+'test_backdrop.dmd')
-
+            self.animation('dmd_gunfightPan', self.dmd_path+'gunfight-pan-brown.dmd')
+        self.animation('dmd_gunfightEyes', self.dmd_path+'gunfight-eyes.dmd')
+        self.animation('dmd_gunfightHands', self.dmd_path+'gunfight-hands.dmd')
+        self.animation('dmd_gunfightBoots', self.dmd_path+'gunfight-boots.dmd')
+        self.animation('dmd_ambush', self.dmd_path +'ambush.dmd')
+        self.animation('dmd_showdown', self.dmd_path +'showdown.dmd')
+        self.animation('dmd_cloudLightning', self.dmd_path +'cloud-lightning.dmd')
+        self.animation('dmd_townPan', self.dmd_path +'town-pan.dmd')
+        self.animation('dmd_stampede', self.dmd_path + 'stampede-animation.dmd')
+        self.animation('dmd_cowsParading', self.dmd_path +'cows-parading.dmd')
+        self.animation('dmd_stampedeJackpot', self.dmd_path +'stampede-jackpot.dmd')
+        self.animation('dmd_cowsLeft', self.dmd_path + 'cows-left.dmd')
+        self.animation('dmd_cowsRight', self.dmd_path + 'cows-right.dmd')
+        self.animation('dmd_stampedeBannerLeft', self.dmd_path +'stampede-banner-left.dmd')
+        self.animation('dmd_stampedeBannerRight', self.dmd_path + 'stampede-banner-right.dmd')
+        self.animation('dmd_shootAgain', self.dmd_path+'shoot-again.dmd')
+        self.animation('dmd_ball', self.dmd_path +'ball.dmd')
+        self.animation('dmd_extraBall', self.dmd_path +'extra-ball.dmd')
+        self.animation('dmd_bonusCactus', self.dmd_path+'bonus-cactus-mash.dmd')
+        self.animation('dmd_bonusTrain', self.dmd_path+'bonus-train.dmd')
+        self.animation('dmd_lockOne', self.dmd_path +'ball-one-locked.dmd')
+        self.animation('dmd_lockTwo', self.dmd_path +'ball-two-locked.dmd')
+        self.animation('dmd_multiballStart', self.dmd_path+'multiball-start.dmd')
+        self.animation('dmd_multiballBannerInverse', self.dmd_path +'multiball-banner-inverse.dmd')
+        self.animation('dmd_multiballBanner', self.dmd_path +'multiball-banner.dmd')
+        self.animation('dmd_multiballFrame', self.dmd_path +'multiball-frame.dmd')
+        self.animation('dmd_mineCarCrash', self.dmd_path +'mine-car-crash.dmd')
+        self.animation('dmd_goldmineJackpot', self.dmd_path +'jackpot.dmd')
+        self.animation('dmd_bamBanner', self.dmd_path + 'bam-banner.dmd')
+        self.animation('dmd_biffBanner', self.dmd_path + 'biff-banner.dmd')
+        self.animation('dmd_ouchBanner', self.dmd_path + 'ouch-banner.dmd')
+        self.animation('dmd_powBanner', self.dmd_path + 'pow-banner.dmd')
+        self.animation('dmd_whamBanner', self.dmd_path + 'wham-banner.dmd')
+        self.animation('dmd_zoinkBanner', self.dmd_path + 'zoink-banner.dmd')
+        self.animation('dmd_bigPosterA', self.dmd_path +'wanted-BIG-A.dmd')
+        self.animation('dmd_bandeleroPosterA', self.dmd_path + 'wanted-BANDELERO-A.dmd')
+        self.animation('dmd_bubbaPosterA', self.dmd_path + 'wanted-BUBBA-A.dmd')
+        self.animation('dmd_bossPosterA', self.dmd_path + 'wanted-BOSS-A.dmd')
+        self.animation('dmd_rudyPosterA', self.dmd_path + 'rudy-wanted-a.dmd')
+        self.animation('dmd_bullPosterA', self.dmd_path + 'bull-wanted-a.dmd')
+        self.animation('dmd_bettyPosterA', self.dmd_path + 'betty-wanted-a.dmd')
+        self.animation('dmd_bigPosterB', self.dmd_path +'wanted-BIG-B.dmd')
+        self.animation('dmd_bandeleroPosterB', self.dmd_path + 'wanted-BANDELERO-B.dmd')
+        self.animation('dmd_bubbaPosterB', self.dmd_path + 'wanted-BUBBA-B.dmd')
+        self.animation('dmd_bossPosterB', self.dmd_path + 'wanted-BOSS-B.dmd')
+        self.animation('dmd_rudyPosterB', self.dmd_path + 'rudy-wanted-b.dmd')
+        self.animation('dmd_bullPosterB', self.dmd_path + 'bull-wanted-b.dmd')
+        self.animation('dmd_bettyPosterB', self.dmd_path + 'betty-wanted-b.dmd')
+        self.animation('dmd_big', self.dmd_path + 'face-BIG.dmd')
+        self.animation('dmd_bandelero', self.dmd_path + 'face-BANDELERO.dmd')
+        self.animation('dmd_bubba', self.dmd_path + 'face-BUBBA.dmd')
+        self.animation('dmd_boss', self.dmd_path + 'boss.dmd')
+        self.animation('dmd_rudy', self.dmd_path + 'rudy-start.dmd')
+        self.animation('dmd_bull', self.dmd_path + 'bull-start.dmd')
+        self.animation('dmd_betty', self.dmd_path + 'betty-start.dmd')
+        self.animation('dmd_bigHit', self.dmd_path + 'hit-BIG.dmd')
+        self.animation('dmd_bandeleroHit', self.dmd_path + 'hit-BANDELERO.dmd')
+        self.animation('dmd_bubbaHit', self.dmd_path + 'hit-BUBBA.dmd')
+        self.animation('dmd_bossHit', self.dmd_path+'boss-hit.dmd')
+        self.animation('dmd_rudyHit', self.dmd_path + 'rudy-hit.dmd')
+        self.animation('dmd_bullHit', self.dmd_path + 'bull-hit.dmd')
+        self.animation('dmd_bettyHit', self.dmd_path + 'betty-hit.dmd')
+        self.animation('dmd_trainOnTracks', self.dmd_path+'train-on-tracks.dmd')
+        self.animation('dmd_trainMoveRight', self.dmd_path+'train-on-tracks-move-right.dmd')
+        self.animation('dmd_trainMoveLeft', self.dmd_path+'train-on-tracks-move-left.dmd')
+        self.animation('dmd_emptyTrack', self.dmd_path+'empty-track.dmd')
+        self.animation('dmd_dmbIdle', self.dmd_path+'dmb-idle.dmd')
+        self.animation('dmd_reverse', self.dmd_path+'reverse.dmd')
+        self.animation('dmd_pourMask', self.dmd_path+'pour-mask.dmd')
+        self.animation('dmd_beerMug1', self.dmd_path+'beer-mug-1.dmd')
+        self.animation('dmd_drunkMultiball', self.dmd_path+'drunk-multiball.dmd')
+        self.animation('dmd_flippers1', self.dmd_path+'flippers1.dmd')
+        self.animation('dmd_flippers2', self.dmd_path+'flippers2.dmd')
+        self.animation('dmd_flippers3', self.dmd_path+'flippers3.dmd')
+        self.animation('dmd_rightArrow1', self.dmd_path+'right-arrow-1.dmd')
+        self.animation('dmd_rightArrow2', self.dmd_path+'right-arrow-2.dmd')
+        self.animation('dmd_rightArrow3', self.dmd_path+'right-arrow-3.dmd')
+        self.animation('dmd_leftArrow1', self.dmd_path+'left-arrow-1.dmd')
+        self.animation('dmd_leftArrow2', self.dmd_path+'left-arrow-2.dmd')
+        self.animation('dmd_leftArrow3', self.dmd_path+'left-arrow-3.dmd')
+        self.animation('dmd_dmb', self.dmd_path+'dmb.dmd')
+        self.animation('dmd_dmbJackpotAdded', self.dmd_path+'jackpot-added.dmd')
+        self.animation('dmd_beerSlide', self.dmd_path+'beer-slide.dmd')
+        self.animation('dmd_dmbJackpot', self.dmd_path+'dmb-jackpot.dmd')
+        self.animation('dmd_match', self.dmd_path+'match.dmd')
+        self.animation('dmd_bionicCombo', self.dmd_path +'bionic-combo.dmd')
+        self.animation('dmd_bionicHit', self.dmd_path+'bionic-hit.dmd')
+        self.animation('dmd_bionicGunClose', self.dmd_path+'gun-close.dmd')
+        self.animation('dmd_bionicGunLoad', self.dmd_path+'gun-load.dmd')
+        self.animation('dmd_bionicGunUnload', self.dmd_path+'gun-unload.dmd')
+        self.animation('dmd_bionicGunOpen', self.dmd_path+'gun-open.dmd')
+        self.animation('dmd_bionicDeath', self.dmd_path+'bionic-death.dmd')
+        self.animation('dmd_bionicDeathTalking', self.dmd_path+'bionic-death-talking.dmd')
+        self.animation('dmd_bionicExplode', self.dmd_path+'bionic-explode.dmd')
+        self.animation('dmd_cvaStandingAlien0', self.dmd_path+'cva_standing_alien0.dmd')
+        self.animation('dmd_cvaStandingAlien1', self.dmd_path+'cva_standing_alien1.dmd')
+        self.animation('dmd_cvaStandingAlien2', self.dmd_path+'cva_standing_alien2.dmd')
+        self.animation('dmd_cvaStandingAlien3', self.dmd_path+'cva_standing_alien3.dmd')
+        self.animation('dmd_cvaSmallShip', self.dmd_path+'cva_small_ship.dmd')
+        self.animation('dmd_cvaLargeShip', self.dmd_path+'cva_large_ship.dmd')
+        self.animation('dmd_cvaLargeShipExplodes', self.dmd_path+'cva_large_ship_explodes.dmd')
+        self.animation('dmd_cvaShipBehindStatic', self.dmd_path+'cva_ship_behind_static.dmd')
+        self.animation('dmd_cvaStatic', self.dmd_path+'cva_static.dmd')
+        self.animation('dmd_cvaTeleport', self.dmd_path+'cva_teleport.dmd')
+        self.animation('dmd_cvaShot', self.dmd_path+'cva_shot.dmd')
+        self.animation('dmd_cvaIntro', self.dmd_path+'cva_intro.dmd')
+        self.animation('dmd_cvaBlastWipe', self.dmd_path+'cva_blast_wipe.dmd')
+        self.animation('dmd_cvaDesert', self.dmd_path+'cva_desert_empty.dmd')
+        self.animation('dmd_cvaShipsBorder', self.dmd_path+'cva_ships_border.dmd')
+        self.animation('dmd_cvaAliensBorder', self.dmd_path+'cva_aliens_border.dmd')
+        self.animation('dmd_highNoonBackdrop', self.dmd_path+'high-noon-backdrop.dmd')
+        self.animation('dmd_bellTower', self.dmd_path+'bell-ring.dmd')
+        self.animation('dmd_highNoon', self.dmd_path+'high-noon.dmd')
+        self.animation('dmd_goodLuck', self.dmd_path+'good-luck.dmd')
+        self.animation('dmd_fireworks', self.dmd_path+'fireworks.dmd')
+        self.animation('dmd_marshallBorder', self.dmd_path+'marshall-border.dmd')
+        self.animation('dmd_marshallHighScoreFrame', self.dmd_path+'marshall-highscore-frame.dmd')
+        self.animation('dmd_lastCall', self.dmd_path+'last_call.dmd')
+        self.animation('dmd_beerFill', self.dmd_path+'beer-fill.dmd')
+        self.animation('dmd_cows', self.dmd_path+'crazy_cows.dmd')
+        self.animation('dmd_moother', self.dmd_path+'moother.dmd')
+        self.animation('dmd_explosionWipe1', self.dmd_path+'boom-wipe-1.dmd')
+        self.animation('dmd_explosionWipe2', self.dmd_path+'boom-wipe-2.dmd')
+        self.animation('dmd_motherlode', self.dmd_path+'motherlode.dmd')
+        self.animation('dmd_1pBurnCycle', self.dmd_path+'1p_burn_cycle.dmd')
+        self.animation('dmd_mmJacob', self.dmd_path+'mm_jacob.dmd')
+        self.animation('dmd_mmZap', self.dmd_path+'mm_zap.dmd')
+        self.animation('dmd_mmPowie', self.dmd_path+'mm_powie.dmd')
+        self.animation('dmd_mmDOHO', self.dmd_path+'mm_doho.dmd')
+        self.animation('dmd_mmCrash', self.dmd_path+'mm_crash.dmd')
+        self.animation('dmd_mmBoom', self.dmd_path+'mm_boom.dmd')
+        self.animation('dmd_mmBang', self.dmd_path+'mm_bang.dmd')
+        self.animation('dmd_moonIntro', self.dmd_path+'moon-intro.dmd')
+        self.animation('dmd_ballSaved', self.dmd_path+'ball_saved.dmd')
+        self.animation('dmd_switchMatrix', self.dmd_path+'matrix_backdrop.dmd')
+        self.animation('dmd_testBackdrop', self.dmd_path+'test_backdrop.dmd')
         # Tribute bits
         if color_desktop:
-            self.dmd_mbLogo = dmd.Animation().load(self.dmd_path+'mb-logo-color.dmd')
+            self.animation('dmd_mbLogo', self.dmd_path+'mb-logo-color.dmd')
         else:
-            self.dmd_mbLogo = dmd.Animation().load(self.dmd_path+'mb-logo.dmd')
-        self.dmd_mbDracIntro1 = dmd.Animation().load(self.dmd_path+'mb-drac-intro-part1.dmd')
-        self.dmd_mbDracIntro2 = dmd.Animation().load(self.dmd_path+'mb-drac-intro-part2.dmd')
-        self.dmd_mbDracIdle = dmd.Animation().load(self.dmd_path+'mb-drac-idle.dmd')
-        self.dmd_mbDracSmack = dmd.Animation().load(self.dmd_path+'mb-drac-smack.dmd')
-        self.dmd_mbStakeBorder = dmd.Animation().load(self.dmd_path+'mb-stake-border.dmd')
-
+            self.animation('dmd_mbLogo', self.dmd_path+'mb-logo.dmd')
+        self.animation('dmd_mbDracIntro1', self.dmd_path+'mb-drac-intro-part1.dmd')
+        self.animation('dmd_mbDracIntro2', self.dmd_path+'mb-drac-intro-part2.dmd')
+        self.animation('dmd_mbDracIdle', self.dmd_path+'mb-drac-idle.dmd')
+        self.animation('dmd_mbDracSmack', self.dmd_path+'mb-drac-smack.dmd')
+        self.animation('dmd_mbStakeBorder', self.dmd_path+'mb-stake-border.dmd')
         if color_desktop:
-            self.dmd_mmLogo = dmd.Animation().load(self.dmd_path+'mm-logo-color.dmd')
+            self.animation('dmd_mmLogo', self.dmd_path+'mm-logo-color.dmd')
         else:
-            self.dmd_mmLogo = dmd.Animation().load(self.dmd_path+'mm-logo.dmd')
-        self.dmd_mmTrollsIntro = dmd.Animation().load(self.dmd_path+'mm_trolls_intro_anim.dmd')
-        self.dmd_mmTrollDeadLeft = dmd.Animation().load(self.dmd_path+'mm_left_troll_dead.dmd')
-        self.dmd_mmTrollHitLeft = dmd.Animation().load(self.dmd_path+'mm_left_troll_hit.dmd')
-        self.dmd_mmTrollIdleLeft = dmd.Animation().load(self.dmd_path+'mm_left_troll_idle.dmd')
-        self.dmd_mmTrollDeadRight = dmd.Animation().load(self.dmd_path+'mm_right_troll_dead.dmd')
-        self.dmd_mmTrollHitRight = dmd.Animation().load(self.dmd_path+'mm_right_troll_hit.dmd')
-        self.dmd_mmTrollIdleRight = dmd.Animation().load(self.dmd_path+'mm_right_troll_idle.dmd')
-        self.dmd_mmTrollFinalFrame = dmd.Animation().load(self.dmd_path+'mm_trolls_final_border.dmd')
-
-        self.dmd_tafLogo = dmd.Animation().load(self.dmd_path+'taf-logo.dmd')
-        self.dmd_tafItIntro = dmd.Animation().load(self.dmd_path+'taf-it-intro.dmd')
-        self.dmd_tafItIdle = dmd.Animation().load(self.dmd_path+'taf-it-idle.dmd')
-        self.dmd_tafItMiss1 = dmd.Animation().load(self.dmd_path+'taf-it-miss-1.dmd')
-        self.dmd_tafItMiss2 = dmd.Animation().load(self.dmd_path+'taf-it-miss-2.dmd')
-        self.dmd_tafItHit = dmd.Animation().load(self.dmd_path+'taf-it-hit.dmd')
-
+            self.animation('dmd_mmLogo', self.dmd_path+'mm-logo.dmd')
+        self.animation('dmd_mmTrollsIntro', self.dmd_path+'mm_trolls_intro_anim.dmd')
+        self.animation('dmd_mmTrollDeadLeft', self.dmd_path+'mm_left_troll_dead.dmd')
+        self.animation('dmd_mmTrollHitLeft', self.dmd_path+'mm_left_troll_hit.dmd')
+        self.animation('dmd_mmTrollIdleLeft', self.dmd_path+'mm_left_troll_idle.dmd')
+        self.animation('dmd_mmTrollDeadRight', self.dmd_path+'mm_right_troll_dead.dmd')
+        self.animation('dmd_mmTrollHitRight', self.dmd_path+'mm_right_troll_hit.dmd')
+        self.animation('dmd_mmTrollIdleRight', self.dmd_path+'mm_right_troll_idle.dmd')
+        self.animation('dmd_mmTrollFinalFrame', self.dmd_path+'mm_trolls_final_border.dmd')
+        self.animation('dmd_tafLogo', self.dmd_path+'taf-logo.dmd')
+        self.animation('dmd_tafItIntro', self.dmd_path+'taf-it-intro.dmd')
+        self.animation('dmd_tafItIdle', self.dmd_path+'taf-it-idle.dmd')
+        self.animation('dmd_tafItMiss1', self.dmd_path+'taf-it-miss-1.dmd')
+        self.animation('dmd_tafItMiss2', self.dmd_path+'taf-it-miss-2.dmd')
+        self.animation('dmd_tafItHit', self.dmd_path+'taf-it-hit.dmd')
         if color_desktop:
-            self.dmd_cvLogo = dmd.Animation().load(self.dmd_path+'cv-logo-color.dmd')
-            self.dmd_cvFinale = dmd.Animation().load(self.dmd_path+'cv-finale-color.dmd')
+            self.animation('dmd_cvLogo', self.dmd_path+'cv-logo-color.dmd')
+            self.animation('dmd_cvFinale', self.dmd_path+'cv-finale-color.dmd')
         else:
-            self.dmd_cvLogo = dmd.Animation().load(self.dmd_path+'cv-logo.dmd')
-            self.dmd_cvFinale = dmd.Animation().load(self.dmd_path+'cv-finale.dmd')
-        self.dmd_cvIntro1 = dmd.Animation().load(self.dmd_path+'cv-intro-part1.dmd')
-        self.dmd_cvIntro2 = dmd.Animation().load(self.dmd_path+'cv-intro-part2.dmd')
-        self.dmd_cvHypno = dmd.Animation().load(self.dmd_path+'cv-hypno.dmd')
-        self.dmd_cvBurst1 = dmd.Animation().load(self.dmd_path+'cv-burst1.dmd')
-        self.dmd_cvBurst2 = dmd.Animation().load(self.dmd_path+'cv-burst2.dmd')
-        self.dmd_cvBurst3 = dmd.Animation().load(self.dmd_path+'cv-burst3.dmd')
-        self.dmd_cvExplosion = dmd.Animation().load(self.dmd_path+'cv-explosion.dmd')
-        self.dmd_cvFireworks = dmd.Animation().load(self.dmd_path+'cv-fireworks.dmd')
-
-        self.dmd_ssLogo = dmd.Animation().load(self.dmd_path+'ss-logo.dmd')
-        self.dmd_ssLogo = dmd.Animation().load(self.dmd_path+'ss-logo.dmd')
-        self.dmd_ssBorder = dmd.Animation().load(self.dmd_path+'ss_border.dmd')
-        self.dmd_ssBlueLeft = dmd.Animation().load(self.dmd_path+'ss_blue_frog_left.dmd')
-        self.dmd_ssBlueRight = dmd.Animation().load(self.dmd_path+'ss_blue_frog_right.dmd')
-        self.dmd_ssGreenLeft = dmd.Animation().load(self.dmd_path+'ss_green_frog_left.dmd')
-        self.dmd_ssGreenRight = dmd.Animation().load(self.dmd_path+'ss_green_frog_right.dmd')
-        self.dmd_ssOrangeLeft = dmd.Animation().load(self.dmd_path+'ss_orange_frog_left.dmd')
-        self.dmd_ssOrangeRight = dmd.Animation().load(self.dmd_path+'ss_orange_frog_right.dmd')
-        self.dmd_ssPurpleLeft = dmd.Animation().load(self.dmd_path+'ss_purple_frog_left.dmd')
-        self.dmd_ssPurpleRight= dmd.Animation().load(self.dmd_path+'ss_purple_frog_right.dmd')
-        self.dmd_ssSquishBlue = dmd.Animation().load(self.dmd_path+'ss_squish-part-1-blue.dmd')
-        self.dmd_ssSquishGreen = dmd.Animation().load(self.dmd_path+'ss_squish-part-1-green.dmd')
-        self.dmd_ssSquishOrange = dmd.Animation().load(self.dmd_path+'ss_squish-part-1.dmd')
-        self.dmd_ssSquishPurple = dmd.Animation().load(self.dmd_path+'ss_squish-part-1-purple.dmd')
-        self.dmd_ssSquishWipe = dmd.Animation().load(self.dmd_path+'ss_squish-part-2.dmd')
-        self.dmd_ssLeaperWipe = dmd.Animation().load(self.dmd_path+'ss_leaper_wipe.dmd')
-        self.dmd_ssBubbles = dmd.Animation().load(self.dmd_path+ 'ss_bubbles.dmd')
-        self.dmd_ssPop = dmd.Animation().load(self.dmd_path+ 'ss_bubbles2.dmd')
-
-        self.dmd_franksBackdrop = dmd.Animation().load(self.dmd_path+'beans_n_franks.dmd')
-        self.dmd_slammed = dmd.Animation().load(self.dmd_path+'slammed.dmd')
-
+            self.animation('dmd_cvLogo', self.dmd_path+'cv-logo.dmd')
+            self.animation('dmd_cvFinale', self.dmd_path+'cv-finale.dmd')
+        self.animation('dmd_cvIntro1', self.dmd_path+'cv-intro-part1.dmd')
+        self.animation('dmd_cvIntro2', self.dmd_path+'cv-intro-part2.dmd')
+        self.animation('dmd_cvHypno', self.dmd_path+'cv-hypno.dmd')
+        self.animation('dmd_cvBurst1', self.dmd_path+'cv-burst1.dmd')
+        self.animation('dmd_cvBurst2', self.dmd_path+'cv-burst2.dmd')
+        self.animation('dmd_cvBurst3', self.dmd_path+'cv-burst3.dmd')
+        self.animation('dmd_cvExplosion', self.dmd_path+'cv-explosion.dmd')
+        self.animation('dmd_cvFireworks', self.dmd_path+'cv-fireworks.dmd')
+        self.animation('dmd_ssLogo', self.dmd_path+'ss-logo.dmd')
+        self.animation('dmd_ssLogo', self.dmd_path+'ss-logo.dmd')
+        self.animation('dmd_ssBorder', self.dmd_path+'ss_border.dmd')
+        self.animation('dmd_ssBlueLeft', self.dmd_path+'ss_blue_frog_left.dmd')
+        self.animation('dmd_ssBlueRight', self.dmd_path+'ss_blue_frog_right.dmd')
+        self.animation('dmd_ssGreenLeft', self.dmd_path+'ss_green_frog_left.dmd')
+        self.animation('dmd_ssGreenRight', self.dmd_path+'ss_green_frog_right.dmd')
+        self.animation('dmd_ssOrangeLeft', self.dmd_path+'ss_orange_frog_left.dmd')
+        self.animation('dmd_ssOrangeRight', self.dmd_path+'ss_orange_frog_right.dmd')
+        self.animation('dmd_ssPurpleLeft', self.dmd_path+'ss_purple_frog_left.dmd')
+        self.animation('dmd_ssPurpleRight', self.dmd_path+'ss_purple_frog_right.dmd')
+        self.animation('dmd_ssSquishBlue', self.dmd_path+'ss_squish-part-1-blue.dmd')
+        self.animation('dmd_ssSquishGreen', self.dmd_path+'ss_squish-part-1-green.dmd')
+        self.animation('dmd_ssSquishOrange', self.dmd_path+'ss_squish-part-1.dmd')
+        self.animation('dmd_ssSquishPurple', self.dmd_path+'ss_squish-part-1-purple.dmd')
+        self.animation('dmd_ssSquishWipe', self.dmd_path+'ss_squish-part-2.dmd')
+        self.animation('dmd_ssLeaperWipe', self.dmd_path+'ss_leaper_wipe.dmd')
+        self.animation('dmd_ssBubbles', self.dmd_path+ 'ss_bubbles.dmd')
+        self.animation('dmd_ssPop', self.dmd_path+ 'ss_bubbles2.dmd')
+        self.animation('dmd_franksBackdrop', self.dmd_path+'beans_n_franks.dmd')
+        self.animation('dmd_slammed', self.dmd_path+'slammed.dmd')
         # Shared Paths
         self.shared_dmd_path = curr_file_path + "/shared/dmd/"
 
@@ -1913,4 +1941,37 @@ class Assets():
         self.font_07x5 = ep.ColorFont(self.shared_dmd_path + "Font07x5.dmd")
         self.font_07x5.make_colors([ep.CYAN,ep.YELLOW,ep.ORANGE])
 
-        
+        # the sounds that play all game long - slings, jets and gunshots - stay decoded
+        if hasattr(self.game.sound, 'pin'):
+            self.game.sound.pin([self.sfx_ricochetSet, self.sfx_punch, self.sfx_smallExplosion, self.sfx_futuristicRicochet,
+                                 self.sfx_gunShot, self.sfx_gunfightShot])
+
+        self.boot_time = time.time() - start
+        print "Assets ready in %.2f seconds" % self.boot_time
+
+    def __getattr__(self, name):
+        # only gets here when the attribute isn't already set - which is the case for all the animations
+        animations = self.__dict__.get('animations')
+        if animations != None and name in animations.paths:
+            return animations.get(name)
+        raise AttributeError(name)
+
+    def animation(self, name, path):
+        """Registers a dmd animation to be loaded the first time it's used"""
+        self.animations.register(name, path)
+
+    def warm_up(self, prefixes):
+        """Preload a group of animations ahead of time - like when a mode is about to start"""
+        if prefixes:
+            self.animations.warm_up(prefixes)
+
+    def report(self):
+        """Boot time, animation memory and first use latency"""
+        lines = ["Assets boot: %.2f seconds" % self.boot_time]
+        lines += self.animations.report()
+        if hasattr(self.game.sound, 'report'):
+            lines += self.game.sound.report()
+        lines.append(ep.text_cache.report())
+        for line in lines:
+            print line
+        return lines
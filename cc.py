@@ -18,8 +18,8 @@
 
 #from procgame import *
 import locale
-import yaml
 import sys
+import time
 
 import logging
 logging.basicConfig(level=logging.WARN, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -37,31 +37,60 @@ curr_file_path = os.path.dirname(os.path.abspath( __file__ ))
 yaml_path = curr_file_path + "/config/cc_machine.yaml"
 
 def main():
-    # Load up the config file
-    config = yaml.load(open(yaml_path, 'r'))
+    boot_start = time.time()
+    # Load up the config file - from the snapshot if it hasn't changed since last boot
+    config = ep.load_yaml_cached(yaml_path)
     # set a variable for the machine type
     machineType = config['PRGame']['machineType']
 
     config = 0
     game = None
     fakePinProc = (len(sys.argv) >= 1 and 'fakepinproc' in sys.argv)
-    #recording = (len(sys.argv) > 1 and 'record' in sys.argv)
-    #playback = (len(sys.argv) > 1 and 'playback' in sys.argv)
+    recording = (len(sys.argv) > 1 and 'record' in sys.argv)
+    playback = (len(sys.argv) > 1 and 'playback' in sys.argv)
+    # headless plays back the log on a virtual clock, as fast as it'll go
+    headless = (len(sys.argv) > 1 and 'headless' in sys.argv)
+    # optional log=<file>, speed=<multiplier> and runs=<count> for record/playback
+    log_file = switch_log_path
+    speed = 1.0
+    runs = 1
+    for arg in sys.argv[1:]:
+        if arg.startswith('log='):
+            log_file = arg[4:]
+        elif arg.startswith('speed='):
+            speed = float(arg[6:])
+        elif arg.startswith('runs='):
+            runs = int(arg[5:])
 
-    #if playback:
-    #    # this covers if fakepinproc was not specified
-    #    fakePinProc = True
+    if headless:
+        playback = True
+
+    if playback:
+        # this covers if fakepinproc was not specified
+        fakePinProc = True
 
     try:
         # create the game object
-        game = CCGame(machineType,fakePinProc)
+        game = CCGame(machineType,fakePinProc,headless)
         # set the game's config path
         game.yamlpath = yaml_path
+        if recording:
+            game.start_recording(log_file)
+        elif playback:
+            game.start_playback(log_file, speed, runs)
         # fire off the setup
         game.setup()
+        print "Boot took %.2f seconds" % (time.time() - boot_start)
         # then run that sucker
         game.run_loop()
     finally:
+        if game:
+            game.stop_recording()
+            # get any queued saves onto the disk before going
+            game.flush_saves()
+            # and any batched driver commands out to the P-ROC
+            if game.driver_queue:
+                game.driver_queue.flush()
         del game
 
 if __name__ == '__main__': main()
\ No newline at end of file
@@ -24,6 +24,7 @@ import ep
 import locale
 import random
 import sys
+import time
 
 
 # Used to put commas in the score.
@@ -48,6 +49,12 @@ class Attract(ep.EP_Mode):
             self.customPages = self.game.user_settings['Custom Message']['Custom Message Pages']
         else:
             print "Custom Message Not Enabled"
+        # the built slideshow pages, and the scores and settings they were built from
+        self.pages = None
+        self.pages_key = None
+        self.pages_built = 0
+        self.pages_reused = 0
+        self.pages_build_time = 0.0
         # stuff for party menu
         self.pmode_settings = ("Disabled","Flip Ct","Rel Flip","Drunk","Newbie","No Hold","Lights Out","Spiked","Rectify")
 
@@ -74,73 +81,12 @@ class Attract(ep.EP_Mode):
             if bad_switches:
                 self.game.interrupter.switch_warning(bad_switches)
 
-        ## Set up the layers to use
-        ballyBanner = dmd.FrameLayer(opaque=False, frame=self.game.assets.dmd_ballyBanner.frames[0])
-
-        textLayer1 = ep.EP_TextLayer(76, 5, self.game.assets.font_10px_AZ, "center", opaque=False).set_text("ORIGINALLY",color=ep.YELLOW)
-        textLayer1.composite_op = "blacksrc"
-        textLayer2 = dmd.TextLayer(76, 18, self.game.assets.font_10px_AZ, "center", opaque=False).set_text("BY")
-        textLayer2.composite_op = "blacksrc"
-        leftGecko = dmd.FrameLayer(opaque=False, frame=self.game.assets.dmd_geckoBorderLeft.frames[0])
-        original = dmd.GroupedLayer(128, 32, [leftGecko, textLayer1,textLayer2])
-
-        textLayer1 = ep.EP_TextLayer(58, 5, self.game.assets.font_10px_AZ, "center", opaque=False).set_text("CONTINUED",color=ep.ORANGE)
-        textLayer1.composite_op = "blacksrc"
-        textLayer2 = dmd.TextLayer(58, 18, self.game.assets.font_10px_AZ, "center", opaque=False).set_text("WITH")
-        textLayer2.composite_op = "blacksrc"
-        rightGecko = dmd.FrameLayer(opaque=False, frame=self.game.assets.dmd_geckoBorderRight.frames[0])
-        expanded = dmd.GroupedLayer(128, 32, [rightGecko, textLayer1,textLayer2])
-
-        proc_banner = dmd.FrameLayer(opaque=False, frame=self.game.assets.dmd_procBanner.frames[0])
-
-        self.splash = dmd.FrameLayer(opaque=False, frame=self.game.assets.dmd_ccBanner.frames[0])
-        continuedBanner = dmd.FrameLayer(opaque=False, frame=self.game.assets.dmd_cccBanner.frames[0])
-
+        # the slideshow pages only get built again when the scores or settings behind them change
+        pages = self.slideshow_pages()
         self.myIndex = 0
-
-
         # adding a blank layer
         blanker = self.game.score_display.layer
-
-        self.layers = []
-        self.layers.append({'layer':blanker,'type':ep.EP_Transition.TYPE_PUSH,'direction':ep.EP_Transition.PARAM_NORTH})
-        self.layers.append({'layer':self.splash,'type':ep.EP_Transition.TYPE_PUSH,'direction':ep.EP_Transition.PARAM_WEST})
-        self.layers.append({'layer':continuedBanner,'type':"NONE",'direction':"DERP"})
-        self.layers.append({'layer':original,'type':ep.EP_Transition.TYPE_PUSH,'direction':ep.EP_Transition.PARAM_EAST})
-        self.layers.append({'layer':ballyBanner,'type':ep.EP_Transition.TYPE_CROSSFADE, 'direction':False})
-        self.layers.append({'layer':expanded,'type':ep.EP_Transition.TYPE_PUSH,'direction':ep.EP_Transition.PARAM_WEST})
-        self.layers.append({'layer':proc_banner,'type':ep.EP_Transition.TYPE_CROSSFADE,'direction':False})
-        # Add the party mode page
-        if  self.game.user_settings['Gameplay (Feature)']['Party Available'] == 'Yes':
-            self.set_party_display()
-            self.layers.append({'layer':self.party_display,'type':ep.EP_Transition.TYPE_PUSH,'direction':ep.EP_Transition.PARAM_NORTH})
-
-        # new custom message stuff
-        if self.customMessage:
-            print "Building Custom Message pages " + str(self.customPages)
-            for n in range (1,self.customPages +1,1):
-                print "Page " + str(n)
-                line = 'Page ' + str(n) + ' Line 1 Text'
-                if self.game.user_settings['Custom Message'][line] != 'NONE':
-                    print "Line one has text rendering"
-                    layer = ep.EP_CustomMessageFrame().make_frame(self.game,n)
-                    self.layers.append({'layer':layer,'type':ep.EP_Transition.TYPE_WIPE,'direction':ep.EP_Transition.PARAM_EAST})
-                else:
-                    print "Line 1 has no text, skipping page"
-
-        self.generate_score_frames()
-
-        if self.game.replays:
-            border = dmd.FrameLayer(opaque=True, frame=self.game.assets.dmd_simpleBorder.frames[0])
-            replayTextLayer1 = ep.EP_TextLayer(64, 5, self.game.assets.font_10px_AZ, "center", opaque=False).set_text("REPLAY SCORE:",color=ep.ORANGE)
-            replayTextLayer2 = ep.EP_TextLayer(64, 18, self.game.assets.font_10px_AZ, "center", opaque=False).set_text(ep.format_score(self.game.user_settings['Machine (Standard)']['Replay Score']),color=ep.YELLOW)
-            replayPage = dmd.GroupedLayer(128,32,[border,replayTextLayer1,replayTextLayer2])
-            # add the replay value page
-            self.layers.append({'layer':replayPage,'type':ep.EP_Transition.TYPE_CROSSFADE,'direction':False})
-
-        # add a game over at the end
-        gameOver = self.game.showcase.make_thin_string(3,text="GAME OVER")
-        self.layers.append({'layer':gameOver,'type':ep.EP_Transition.TYPE_CROSSFADE,'direction':False})
+        self.layers = [{'layer':blanker,'type':ep.EP_Transition.TYPE_PUSH,'direction':ep.EP_Transition.PARAM_NORTH}] + pages
 
         # Blink the start button to notify player about starting a game.
         self.game.lamps.startButton.schedule(schedule=0x00ff00ff)
@@ -213,6 +159,99 @@ class Attract(ep.EP_Mode):
 #        if self.game.party_setting != 'Disabled':
 #            self.game.party_mode.attract_display()
 
+    def slideshow_pages(self):
+        key = self.pages_signature()
+        if self.pages != None and key == self.pages_key:
+            self.pages_reused += 1
+            return self.pages
+        start = time.time()
+        self.pages = self.build_pages()
+        self.pages_key = key
+        self.pages_build_time = time.time() - start
+        self.pages_built += 1
+        print self.slideshow_report()
+        return self.pages
+
+    def pages_signature(self):
+        # the high scores, settings and custom message the pages get made from
+        scores = []
+        for category in self.game.highscore_categories:
+            scores.append((category.game_data_key, [(score.inits, score.score) for score in category.scores]))
+        return repr((scores, self.game.user_settings, self.game.replays))
+
+    def slideshow_report(self):
+        return "Attract pages: %d pages, built %d times (last took %.1fms), reused %d times" % (len(self.pages or []), self.pages_built, self.pages_build_time * 1000, self.pages_reused)
+
+    def build_pages(self):
+        """Builds the slideshow pages - everything but the score display at the start"""
+        ## Set up the layers to use
+        ballyBanner = dmd.FrameLayer(opaque=False, frame=self.game.assets.dmd_ballyBanner.frames[0])
+
+        textLayer1 = ep.EP_TextLayer(76, 5, self.game.assets.font_10px_AZ, "center", opaque=False).set_text("ORIGINALLY",color=ep.YELLOW)
+        textLayer1.composite_op = "blacksrc"
+        textLayer2 = dmd.TextLayer(76, 18, self.game.assets.font_10px_AZ, "center", opaque=False).set_text("BY")
+        textLayer2.composite_op = "blacksrc"
+        leftGecko = dmd.FrameLayer(opaque=False, frame=self.game.assets.dmd_geckoBorderLeft.frames[0])
+        original = dmd.GroupedLayer(128, 32, [leftGecko, textLayer1,textLayer2])
+
+        textLayer1 = ep.EP_TextLayer(58, 5, self.game.assets.font_10px_AZ, "center", opaque=False).set_text("CONTINUED",color=ep.ORANGE)
+        textLayer1.composite_op = "blacksrc"
+        textLayer2 = dmd.TextLayer(58, 18, self.game.assets.font_10px_AZ, "center", opaque=False).set_text("WITH")
+        textLayer2.composite_op = "blacksrc"
+        rightGecko = dmd.FrameLayer(opaque=False, frame=self.game.assets.dmd_geckoBorderRight.frames[0])
+        expanded = dmd.GroupedLayer(128, 32, [rightGecko, textLayer1,textLayer2])
+
+        proc_banner = dmd.FrameLayer(opaque=False, frame=self.game.assets.dmd_procBanner.frames[0])
+
+        self.splash = dmd.FrameLayer(opaque=False, frame=self.game.assets.dmd_ccBanner.frames[0])
+        continuedBanner = dmd.FrameLayer(opaque=False, frame=self.game.assets.dmd_cccBanner.frames[0])
+
+        self.layers = []
+        self.layers.append({'layer':self.splash,'type':ep.EP_Transition.TYPE_PUSH,'direction':ep.EP_Transition.PARAM_WEST})
+        self.layers.append({'layer':continuedBanner,'type':"NONE",'direction':"DERP"})
+        self.layers.append({'layer':original,'type':ep.EP_Transition.TYPE_PUSH,'direction':ep.EP_Transition.PARAM_EAST})
+        self.layers.append({'layer':ballyBanner,'type':ep.EP_Transition.TYPE_CROSSFADE, 'direction':False})
+        self.layers.append({'layer':expanded,'type':ep.EP_Transition.TYPE_PUSH,'direction':ep.EP_Transition.PARAM_WEST})
+        self.layers.append({'layer':proc_banner,'type':ep.EP_Transition.TYPE_CROSSFADE,'direction':False})
+        # Add the party mode page
+        if  self.game.user_settings['Gameplay (Feature)']['Party Available'] == 'Yes':
+            self.set_party_display()
+            self.layers.append({'layer':self.party_display,'type':ep.EP_Transition.TYPE_PUSH,'direction':ep.EP_Transition.PARAM_NORTH})
+
+        # new custom message stuff
+        if self.customMessage:
+            print "Building Custom Message pages " + str(self.customPages)
+            for n in range (1,self.customPages +1,1):
+                print "Page " + str(n)
+                line = 'Page ' + str(n) + ' Line 1 Text'
+                if self.game.user_settings['Custom Message'][line] != 'NONE':
+                    print "Line one has text rendering"
+                    layer = ep.EP_CustomMessageFrame().make_frame(self.game,n)
+                    self.layers.append({'layer':layer,'type':ep.EP_Transition.TYPE_WIPE,'direction':ep.EP_Transition.PARAM_EAST})
+                else:
+                    print "Line 1 has no text, skipping page"
+
+        self.generate_score_frames()
+
+        if self.game.replays:
+            border = dmd.FrameLayer(opaque=True, frame=self.game.assets.dmd_simpleBorder.frames[0])
+            replayTextLayer1 = ep.EP_TextLayer(64, 5, self.game.assets.font_10px_AZ, "center", opaque=False).set_text("REPLAY SCORE:",color=ep.ORANGE)
+            replayTextLayer2 = ep.EP_TextLayer(64, 18, self.game.assets.font_10px_AZ, "center", opaque=False).set_text(ep.format_score(self.game.user_settings['Machine (Standard)']['Replay Score']),color=ep.YELLOW)
+            replayPage = dmd.GroupedLayer(128,32,[border,replayTextLayer1,replayTextLayer2])
+            # add the replay value page
+            self.layers.append({'layer':replayPage,'type':ep.EP_Transition.TYPE_CROSSFADE,'direction':False})
+
+        # add a game over at the end
+        gameOver = self.game.showcase.make_thin_string(3,text="GAME OVER")
+        self.layers.append({'layer':gameOver,'type':ep.EP_Transition.TYPE_CROSSFADE,'direction':False})
+
+        # everything but the party page is fixed once it's built - flatten those down to one frame each
+        for page in self.layers:
+            if isinstance(page['layer'], dmd.GroupedLayer) and page['layer'] is not getattr(self, 'party_display', None):
+                page['layer'] = ep.flatten_layer(page['layer'])
+
+        return self.layers
+
     def run_animation_loop(self):
         # grab the current index
         indexA = self.myIndex
@@ -95,6 +95,8 @@ class BankRobbery(ep.EP_Mode):
         self.dude1Layer = self.dude1
         self.dude2Layer = self.dude2
         self.layers = [self.dude0Layer,self.dude1Layer,self.dude2Layer]
+        # new dude layers, so the mode screen gets built again
+        self.drop_display("Progress")
 
         # load the shot animation
         self.shotAnim = self.game.assets.dmd_dudeShotFullBody
@@ -280,16 +282,8 @@ class BankRobbery(ep.EP_Mode):
         if self.running:
             #print "IN PROGRESS " + str(self.modeTimer)
             #print "Shooter info: Target - " + str(self.shotTarget) + " Timer - " + str(self.shotTimer)
-            # and all the text
-            p = self.game.current_player()
-            scoreString = ep.format_score(p.score)
-            scoreLine = dmd.TextLayer(34, 6, self.game.assets.font_5px_bold_AZ, "center", opaque=False).set_text(scoreString,blink_frames=8)
-            timeString = str(int(self.modeTimer))
-            self.timeLine = dmd.TextLayer(128,26, self.game.assets.font_5px_AZ, "right", opaque=False).set_text(timeString)
-
-            # stick together the animation and static text with the dynamic text
-            composite = dmd.GroupedLayer(128,32,[self.dude0Layer,self.dude1Layer,self.dude2Layer,self.foreground,self.timeLine])
-            self.layer = composite
+            # the dudes and the bank, with the time following along on its own
+            self.show_display("Progress", self.build_progress_display)
 
             # increment the shot timer
             self.shotTimer += 1
@@ -331,6 +325,14 @@ class BankRobbery(ep.EP_Mode):
                     # set up a delay to come back in 1 second with the lowered time
                     self.delay(name="Mode Timer",delay=0.1,handler=self.in_progress)
 
+    def build_progress_display(self, display):
+        timeLine = self.bound_text(128, 26, self.game.assets.font_5px_AZ, self.time_string, "right")
+        # stick together the animation and static text with the dynamic text
+        return [self.dude0Layer,self.dude1Layer,self.dude2Layer,self.foreground,timeLine]
+
+    def time_string(self):
+        return str(int(self.modeTimer))
+
     def kill_dude(self,shot):
         # if the guy died was about to shot, that should be stopped
         if shot == self.shooter and self.shooting:
@@ -357,6 +359,7 @@ class BankRobbery(ep.EP_Mode):
         else:
             # WAT?
             pass
+        self.drop_display("Progress")
         # play a shot sound
         self.game.sound.play(self.game.assets.sfx_gunShot)
         # set a won flag if they're all dead
@@ -617,17 +620,21 @@ class BankRobbery(ep.EP_Mode):
             self.dude1Layer = eGuy0
         elif self.shooter == 2:
             self.dude2Layer = eGuy0
-            # set a flag
+        self.drop_display("Progress")
+        # set a flag
         self.shooting = True
 
     def end_shot_sequence(self):
         # if the guy who was shooting is still alive, reset their layer
         if self.shooter == 0 and self.isActive[0]:
             self.dude0Layer = self.dude0
+            self.drop_display("Progress")
         elif self.shooter == 1 and self.isActive[1]:
             self.dude1Layer = self.dude1
+            self.drop_display("Progress")
         elif self.shooter == 2 and self.isActive[2]:
             self.dude2Layer = self.dude2
+            self.drop_display("Progress")
         # assign a new dude
         self.set_shot_target()
 
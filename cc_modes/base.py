@@ -28,6 +28,15 @@ import ep
 import random
 import time
 import sys
+from tracking import STAT_IDS
+
+# stat ids for the switches that get hit all the time - skips the name lookup
+TILT_STATUS = STAT_IDS['tiltStatus']
+BUMPER_HITS = STAT_IDS['bumperHits']
+BEER_MUG_HITS = STAT_IDS['beerMugHits']
+BEER_MUG_HITS_TOTAL = STAT_IDS['beerMugHitsTotal']
+EXTRA_BALLS_PENDING = STAT_IDS['extraBallsPending']
+CVA_STATUS = STAT_IDS['cvaStatus']
 
 
 class BaseGameMode(ep.EP_Mode):
@@ -38,7 +47,6 @@ class BaseGameMode(ep.EP_Mode):
         self.ball_starting = True
         self.current_music = self.game.assets.music_mainTheme
         self.unbusy()
-        self.active_quotes = []
         # for aborting thebonus display
         self.doingBonus = False
         # skippable drunk multiball?
@@ -130,7 +138,7 @@ class BaseGameMode(ep.EP_Mode):
             self.game.ball_search.disable()
             # turn off the flippers
             self.game.enable_flippers(False)
-            if self.game.show_tracking('tiltStatus') < self.game.tilt_warnings:
+            if self.game.show_stat(TILT_STATUS) < self.game.tilt_warnings:
                 # play the ball end riff
                 self.game.sound.play(self.game.assets.sfx_ballEnd)
                 # go check the bonus - after that we'll finish the ball
@@ -190,7 +198,7 @@ class BaseGameMode(ep.EP_Mode):
             if not self.game.skill_shot.super:
                 # make sure we haven't tilted
                 # if we're tilted, ignore this switch:
-                if not self.game.show_tracking('tiltStatus') >= self.game.tilt_warnings:
+                if not self.game.show_stat(TILT_STATUS) >= self.game.tilt_warnings:
                     self.game.trough.start_ball_save(num_balls_to_save=1, time=0, now=True, allow_multiple_saves=False)
 
     def beer_unhit(self):
@@ -198,20 +206,20 @@ class BaseGameMode(ep.EP_Mode):
 
     def sw_beerMug_active(self, sw):
         # if been hit too recently or tilted pass
-        if self.beer_hit or self.game.show_tracking('tiltStatus') >= self.game.tilt_warnings:
+        if self.beer_hit or self.game.show_stat(TILT_STATUS) >= self.game.tilt_warnings:
             pass
         else:
             if self.game.user_settings['Gameplay (Feature)']['Party Mode'] == 'Spiked':
                 # set the tilt all the way up and then run it
-                self.game.set_tracking('tiltStatus', self.game.tilt_warnings)
+                self.game.set_stat(TILT_STATUS, self.game.tilt_warnings)
                 self.tilt()
             else:
                 print "Beer Mug Hit"
                 self.beer_hit = True
                 # delay to re-allow due to debounce being off
                 self.delay(delay=0.050, handler=self.beer_unhit)
-                hits = self.game.increase_tracking('beerMugHits')
-                self.game.increase_tracking('beerMugHitsTotal')
+                hits = self.game.increase_stat(BEER_MUG_HITS)
+                self.game.increase_stat(BEER_MUG_HITS_TOTAL)
                 # flash the light if present
                 if not self.game.lamp_control.lights_out:
                     self.game.lamps.beerMug.schedule(0x00000CCC, cycle_seconds=1)
@@ -304,59 +312,18 @@ class BaseGameMode(ep.EP_Mode):
 ### /_/   \_\__,_|\__,_|_|\___/  |____/|_|\__|___/
 ###
 
-    # modified version of play voice from procgame.sound that stores a list of active quotes
-    # even though more than one shouldn't be possible given the time checking
+    # voice quotes go through the game's voice scheduler - regular quotes wait their turn
+    # (briefly), override quotes cut in over regular ones
     def play_quote(self,key, loops=0, max_time=0, fade_ms=0,override=False,squelch=False,nr=999):
-        if not self.game.sound.enabled:
-            return 0
-        current_time = time.time()
-        # Make sure previous voice call is finished. unless override
-        if not override:
-            if current_time < self.game.sound.voice_end_time: return 0
-        # if the key exists, stuff happens
-        if key in self.game.sound.sounds:
-            if squelch:
-                # if we're squelching, turn down the music volume - but first, cancel any previous restore delay
-                self.cancel_delayed("Squelch")
-                self.game.squelch_music()
-            # store the key in a list
-            self.active_quotes.append(key)
-            # allow the code to pick specific items out of batches of quotes if specified
-            if nr != 999:
-                n = nr
-                print "Quote Specific Number is: " + str(n)
-            elif len(self.game.sound.sounds[key]) > 0:
-                l = list(range(len(self.game.sound.sounds[key])))
-                n = random.choice(l)
-                print "Randomized Quote Number is: " + str(n)
-            else:
-                print "Quote Number Defaulted to zero"
-                n = 0
-            # then play the quote based on the new selection
-            self.game.sound.sounds[key][n].play(loops,max_time,fade_ms)
-            duration = self.game.sound.sounds[key][n].get_length() * (loops+1)
-            self.game.sound.voice_end_time = current_time + duration
-            # delay a removal of the active quote from the list
-            self.delay(delay=duration,handler=self.end_quote,param=key)
-            if squelch:
-                # if we're squelching, set a delay to restore the music
-                self.delay("Squelch",delay=duration+0.2,handler=self.game.restore_music)
-            return duration
-        # if not, return zilch
+        if override:
+            priority = ep.VOICE_OVERRIDE
         else:
-            return 0
-
-    def end_quote(self,key):
-        self.active_quotes.remove(key)
+            priority = ep.VOICE_NORMAL
+        return self.game.voice.play(key,priority,loops,max_time,fade_ms,squelch=squelch,nr=nr)
 
     def priority_quote(self,quote,loops=0, max_time=0, fade_ms=0,squelch=False,nr=999):
-        # cancel any other voice quote
-        for key in self.active_quotes:
-            print "STOPPING " + str(key)
-            self.game.sound.stop(key)
-        # then play the quote - overriding the voice delay timer
-        duration = self.play_quote(quote,loops,max_time,fade_ms,override=True,squelch=squelch,nr=nr)
-        return duration
+        # cuts off whatever is being said, and can't be cut off by anything but another priority quote
+        return self.game.voice.play(quote,ep.VOICE_PRIORITY,loops,max_time,fade_ms,squelch=squelch,nr=nr)
 
     def repeat_ding(self,times):
         self.game.sound.play(self.game.assets.sfx_bountyBell)
@@ -381,7 +348,7 @@ class BaseGameMode(ep.EP_Mode):
             self.delay(delay=0.5,handler=self.tilt_unpause)
 
             # first, register the hit
-            status = self.game.increase_tracking('tiltStatus')
+            status = self.game.increase_stat(TILT_STATUS)
             print "TILT STATUS: " + str(status)
             # if that puts us at three, time to tilt
             if status == self.game.tilt_warnings:
@@ -399,7 +366,7 @@ class BaseGameMode(ep.EP_Mode):
         self.game.trough.disable_ball_save()
         # First check to make sure tilt hasn't already been processed once.
         # No need to do this stuff again if for some reason tilt already occurred.
-        if self.game.show_tracking('tiltStatus') >= self.game.tilt_warnings:
+        if self.game.show_stat(TILT_STATUS) >= self.game.tilt_warnings:
             # disable status
             self.game.statusOK = False
 
@@ -485,7 +452,7 @@ class BaseGameMode(ep.EP_Mode):
 
     def return_lane_hit(self, side):
         # if we're tilted, ignore this switch entirely:
-        if self.game.show_tracking('tiltStatus') >= self.game.tilt_warnings:
+        if self.game.show_stat(TILT_STATUS) >= self.game.tilt_warnings:
             print "Game is tilted, passing return " + str(side)
             pass
         else:
@@ -511,7 +478,7 @@ class BaseGameMode(ep.EP_Mode):
                 # if MYT is ready, start it and raise the post to catch the ball
                 self.game.move_your_train.start(True,side)
             # cva
-            elif self.game.show_tracking('cvaStatus') == "READY":
+            elif self.game.show_stat(CVA_STATUS) == "READY":
                 self.game.modes.add(self.game.cva)
                 self.game.cva.intro(entry="inlane",onSide = side)
             # if guns are allowed, and showdown is ready do that
@@ -567,7 +534,7 @@ class BaseGameMode(ep.EP_Mode):
 
     def outlane_hit(self, side):
         # if we're tilted, ignore this switch entirely:
-        if self.game.show_tracking('tiltStatus') >= self.game.tilt_warnings:
+        if self.game.show_stat(TILT_STATUS) >= self.game.tilt_warnings:
             pass
         else:
             self.game.score(2530, bonus=True)
@@ -601,7 +568,7 @@ class BaseGameMode(ep.EP_Mode):
 
     def slingshot_hit(self, side):
         # if we're tilted, ignore this switch entirely:
-        if self.game.show_tracking('tiltStatus') >= self.game.tilt_warnings:
+        if self.game.show_stat(TILT_STATUS) >= self.game.tilt_warnings:
             pass
         else:
             # play a sound
@@ -629,7 +596,7 @@ class BaseGameMode(ep.EP_Mode):
 
     def sw_bottomJetBumper_active(self, sw):
         # if we're tilted, ignore this switch entirely:
-        if self.game.show_tracking('tiltStatus') >= self.game.tilt_warnings:
+        if self.game.show_stat(TILT_STATUS) >= self.game.tilt_warnings:
             pass
         else:
             # count the hit
@@ -645,20 +612,20 @@ class BaseGameMode(ep.EP_Mode):
 
     def bumper_hit(self, bumper):
         # if we're tilted, ignore this switch entirely:
-        if self.game.show_tracking('tiltStatus') >= self.game.tilt_warnings:
+        if self.game.show_stat(TILT_STATUS) >= self.game.tilt_warnings:
             pass
         else:
             # if combos are on, award grace
             if self.game.combos.myTimer > 0:
                 self.game.combos.myTimer = self.game.combos.default
-            hits = self.game.increase_tracking('bumperHits')
+            hits = self.game.increase_stat(BUMPER_HITS)
             # flash the back left flasher per hit
             self.game.coils.backLeftFlasher.pulse(30)
             if hits == 125:
                 self.game.interrupter.bumpers_increased(25000)
             elif hits == 250:
                 self.game.interrupter.bumpers_increased(50000)
-            if self.game.show_tracking('cvaStatus') == "RUNNING":
+            if self.game.show_stat(CVA_STATUS) == "RUNNING":
                 self.game.score(5250)
                 self.game.base.play_quote(self.game.assets.sfx_cvaBumper)
 
@@ -739,7 +706,7 @@ class BaseGameMode(ep.EP_Mode):
            and (self.game.skill_shot not in self.game.modes) \
            and not self.rectified:
             self.rectified = True
-            self.game.set_tracking('tiltStatus',self.game.tilt_warnings)
+            self.game.set_stat(TILT_STATUS, self.game.tilt_warnings)
             self.tilt()
         # if doing the bonus, abort
         elif self.doingBonus:
@@ -773,7 +740,7 @@ class BaseGameMode(ep.EP_Mode):
 
     def sw_shooterLane_inactive_for_100ms(self,sw):
         # if we're tilted, ignore this switch:
-        if self.game.show_tracking('tiltStatus') >= self.game.tilt_warnings:
+        if self.game.show_stat(TILT_STATUS) >= self.game.tilt_warnings:
             pass
         else:
             # play the ball lanuch noise
@@ -889,7 +856,7 @@ class BaseGameMode(ep.EP_Mode):
 
     def quickdraw_hit(self, position, side):
         # if we're tilted, ignore this switch entirely:
-        if self.game.show_tracking('tiltStatus') >= self.game.tilt_warnings:
+        if self.game.show_stat(TILT_STATUS) >= self.game.tilt_warnings:
             pass
         else:
             # if the doubler is running, pass on quickdraw hits
@@ -1107,7 +1074,7 @@ class BaseGameMode(ep.EP_Mode):
     def collect_bozo_ball(self):
         self.is_busy()
         # add a fake pending extra ball
-        self.game.increase_tracking('extraBallsPending')
+        self.game.increase_stat(EXTRA_BALLS_PENDING)
         # and then collect it
         self.game.mine.collect_extra_ball()
         # and turn off the bozo ball flag
@@ -27,6 +27,8 @@ class CV_Tribute(ep.EP_Mode):
     def __init__(self,game,priority):
         super(CV_Tribute, self).__init__(game,priority)
         self.myID = "CV Tribute"
+        # animations to preload when the launcher picks this one
+        self.warm_up = ['dmd_cvBurst','dmd_cvExplosion','dmd_cvFinale','dmd_cvFireworks','dmd_cvHypno','dmd_cvIntro']
         # for timer halting in saloon/jets
         self.halted = False
         self.running = False
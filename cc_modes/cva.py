@@ -492,16 +492,14 @@ class CvA(ep.EP_Mode):
         # delay a move to the next spot
         # reassign the blank layer for later use
         self.blankLayer = dmd.FrameLayer(opaque=True, frame=self.game.assets.dmd_blank.frames[0])
+        # the backdrops are new for this run - so are the displays
+        self.drop_display("Ship")
+        self.drop_display("Alien")
         # update the display
         self.update_display()
 
 
     def update_display(self,once=False):
-        # score line
-        p = self.game.current_player()
-        scoreString = ep.format_score(p.score)
-        scoreLayer = ep.EP_TextLayer(64, 17, self.game.assets.font_9px_az, "center", opaque=False).set_text(scoreString,blink_frames=6,color=ep.DARK_GREEN)
-
         # if we're in ship mode, draw a combined layer of the ship and desert
         if self.mode == "SHIP":
             # if the saucer is moving - change it's position for the next pass if we haven't reached the target yet
@@ -549,35 +547,41 @@ class CvA(ep.EP_Mode):
                     else:
                         print "WAT?"
 
-                # set the position of the ship
-            self.smallShip.set_target_position(self.saucerX,0)
-            # then build and show the layer
-            combined = dmd.GroupedLayer(128,32,[self.smallShip,self.desert,scoreLayer])
-            self.layer = combined
+            # then show the layer - the ship follows saucerX on its own
+            self.show_display("Ship", self.build_ship_display)
         if self.mode == "ALIEN":
-            layers = []
-            # blackout layer
-            layers.append(self.blankLayer)
-            # add the backdrop
-            layers.append(self.desert)
-            # and teh score
-            layers.append(scoreLayer)
+            display = self.show_display("Alien", self.build_alien_display)
+            # the aliens come and go - the rest stays put
+            display.layers = display.layers[:3]
             # add teleporting aliens
             if self.teleporting:
-                for x in self.teleportingAliens:
-                    layers.append(x)
+                display.layers.extend(self.teleportingAliens)
             else:
                 #  add any standing aliens
                 for x in self.activeAliens:
-                    layers.append(self.alienLayers[x])
-            combined = dmd.GroupedLayer(128,32,layers)
-            self.layer = combined
+                    display.layers.append(self.alienLayers[x])
 
-        # if we're in aliens mode draw the combined aliens and desert
-        # loop back in 0.1 to update the display again
+        # loop back in 0.1 to move the saucer and update the aliens again
         if not once:
             self.delay("Display",delay=0.1,handler=self.update_display)
 
+    def build_ship_display(self, display):
+        display.bind_position(self.smallShip, self.ship_position)
+        return [self.smallShip,self.desert,self.score_layer()]
+
+    def build_alien_display(self, display):
+        # blackout layer, the backdrop, and the score
+        return [self.blankLayer,self.desert,self.score_layer()]
+
+    def score_layer(self):
+        return self.bound_text(64, 17, self.game.assets.font_9px_az, self.score_string, "center", blink_frames=6, color=ep.DARK_GREEN)
+
+    def score_string(self):
+        return ep.format_score(self.game.current_player().score)
+
+    def ship_position(self):
+        return (self.saucerX, 0)
+
     def sw_leftBonusLane_active(self,sw):
         self.teleportX += 1
         self.update_display()
@@ -286,21 +286,29 @@ class DrunkMultiball(ep.EP_Mode):
         self.game.trough.start_ball_save(num_balls_to_save=3, time=20, now=True, allow_multiple_saves=True)
 
     def update_display(self):
+        # built once - the text lines keep up with the score and jackpots on their own
+        self.show_display("Main", self.build_display)
+
+    def build_display(self, display):
         self.overlay.composite_op = "blacksrc"
-        p = self.game.current_player()
-        scoreString = ep.format_score(p.score)
-        scoreLine = ep.EP_TextLayer(80, 8, self.game.assets.font_7px_az, "center", opaque=False).set_text(scoreString,blink_frames=8,color=ep.YELLOW)
+        scoreLine = self.bound_text(80, 8, self.game.assets.font_7px_az, self.score_string, "center", blink_frames=8, color=ep.YELLOW)
         textLine1 = ep.EP_TextLayer(80, 1, self.game.assets.font_5px_AZ, "center", opaque=False).set_text("DRUNK MULTIBALL",color=ep.ORANGE)
+        textLine2 = self.bound_text(80, 18, self.game.assets.font_5px_AZ, self.jackpot_title, "center", color=ep.BROWN)
+        textLine3 = self.bound_text(80, 25, self.game.assets.font_5px_AZ, self.jackpot_string, "center", color=ep.BROWN)
+        return [textLine1,textLine2,textLine3,scoreLine,self.overlay]
+
+    def score_string(self):
+        return ep.format_score(self.game.current_player().score)
+
+    def jackpot_title(self):
         if self.active:
-            textLine2 = ep.EP_TextLayer(80, 18, self.game.assets.font_5px_AZ, "center", opaque=False).set_text("JACKPOTS",color=ep.BROWN)
-            textString = "WORTH " + str(ep.format_score(self.jackpotValue))
-            textLine3 = ep.EP_TextLayer(80, 25, self.game.assets.font_5px_AZ, "center", opaque=False).set_text(textString,color=ep.BROWN)
-        else:
-            textLine2 = ep.EP_TextLayer(80, 18, self.game.assets.font_5px_AZ, "center", opaque=False).set_text("HIT BEER MUG",color=ep.BROWN)
-            textLine3 = ep.EP_TextLayer(80, 25, self.game.assets.font_5px_AZ, "center", opaque=False).set_text("TO LIGHT JACKPOTS",color=ep.BROWN)
-        combined = dmd.GroupedLayer(128,32,[textLine1,textLine2,textLine3,scoreLine,self.overlay])
-        self.layer = combined
-        self.delay(name="Display",delay=0.2,handler=self.update_display)
+            return "JACKPOTS"
+        return "HIT BEER MUG"
+
+    def jackpot_string(self):
+        if self.active:
+            return "WORTH " + str(ep.format_score(self.jackpotValue))
+        return "TO LIGHT JACKPOTS"
 
     def light_jackpot(self):
         # pick a jackpot
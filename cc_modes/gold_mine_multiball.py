@@ -297,42 +297,47 @@ class GoldMine(ep.EP_Mode):
         self.game.base.multiball_saver()
 
     def main_display(self):
-        # set up the display during multiball
+        # set up the display during multiball - built once, the text lines keep up on their own
+        self.show_display("Main", self.build_main_display)
+
+    def build_main_display(self, display):
         backdrop = dmd.FrameLayer(opaque=True, frame=self.game.assets.dmd_multiballFrame.frames[0])
         # title line
-        titleString = "GOLD MINE MULTIBALL"
-        if self.game.drunk_multiball.running:
-            titleString = "DRUNK MINE MULTIBALL"
-        titleLine = ep.EP_TextLayer(128/2, -1, self.game.assets.font_5px_AZ, "center", opaque=False).set_text(titleString,color=ep.YELLOW)
+        titleLine = self.bound_text(128/2, -1, self.game.assets.font_5px_AZ, self.title_string, "center", color=ep.YELLOW)
         # score line
-        p = self.game.current_player()
-        scoreString = ep.format_score(p.score)
-        scoreLine = ep.EP_TextLayer(64, 5, self.game.assets.font_9px_az, "center", opaque=False).set_text(scoreString,blink_frames=4,color=ep.DARK_BROWN)
+        scoreLine = self.bound_text(64, 5, self.game.assets.font_9px_az, self.score_string, "center", blink_frames=4, color=ep.DARK_BROWN)
         scoreLine.composite_op = "blacksrc"
         # motherlode line
+        motherLine = self.bound_text(128/2, 16, self.game.assets.font_5px_AZ, self.motherlode_string, "center", color=ep.YELLOW)
+        # jackpot value line
+        jackpotLine = self.bound_text(128/2, 22, self.game.assets.font_5px_AZ, self.jackpot_string, "center", color=ep.DARK_BROWN)
+        return [backdrop,titleLine,scoreLine,motherLine,jackpotLine]
+
+    def title_string(self):
+        if self.game.drunk_multiball.running:
+            return "DRUNK MINE MULTIBALL"
+        return "GOLD MINE MULTIBALL"
+
+    def score_string(self):
+        return ep.format_score(self.game.current_player().score)
+
+    def motherlode_string(self):
         # if no motherlode is lit
         if self.game.show_tracking('motherlodeLit') and not self.bandits:
-            textString = "MOTHERLODE " + ep.format_score(self.motherlodeValue) + " X " + str(self.game.show_tracking('motherlodeMultiplier'))
+            return "MOTHERLODE " + ep.format_score(self.motherlodeValue) + " X " + str(self.game.show_tracking('motherlodeMultiplier'))
         # if the bandits showed up
         elif self.bandits:
-            textString = "SHOOT THE BANDITS!"
+            return "SHOOT THE BANDITS!"
         else:
-            textString = "JACKPOTS LIGHT MOTHERLODE"
+            return "JACKPOTS LIGHT MOTHERLODE"
 
-        motherLine = ep.EP_TextLayer(128/2,16,self.game.assets.font_5px_AZ, "center", opaque=False).set_text(textString,color=ep.YELLOW)
-        # jackpot value line
+    def jackpot_string(self):
         if self.bandits:
-            jackString = "TIME REMAINING: " + str(self.banditTimer)
+            return "TIME REMAINING: " + str(self.banditTimer)
+        elif self.game.drunk_multiball.running:
+            return "JACKPOTS = " + str(ep.format_score(1000000))
         else:
-            if self.game.drunk_multiball.running:
-                jackString = "JACKPOTS = " + str(ep.format_score(1000000))
-            else:
-                jackString = "JACKPOTS = " + str(ep.format_score(500000))
-        jackpotLine = ep.EP_TextLayer(128/2,22,self.game.assets.font_5px_AZ, "center", opaque=False).set_text(jackString,color=ep.DARK_BROWN)
-        combined = dmd.GroupedLayer(128,32,[backdrop,titleLine,scoreLine,motherLine,jackpotLine])
-        self.layer = combined
-        # loop back in .2 to update
-        self.delay(name="Display",delay=0.2,handler=self.main_display)
+            return "JACKPOTS = " + str(ep.format_score(500000))
 
     def jackpot_hit(self,step=1):
         if step == 1:
@@ -126,6 +126,8 @@ class Interrupter(ep.EP_Mode):
 
     def tilt_display(self,slam=False):
         self.cancel_delayed("Display")
+        # cut off the voice, and drop any quotes still waiting to play
+        self.game.voice.clear()
 
         if slam:
             # kill all delays
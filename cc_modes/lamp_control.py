@@ -20,36 +20,151 @@
 
 #from procgame import *
 import ep
+import time
+
+class LampState(object):
+    """Tracks what lamp control last told each driver to do.
+
+    While an update is running, driver commands are collected instead of sent, and
+    when it's done only the lamps whose command changed get sent to the P-ROC.
+    """
+    def __init__(self):
+        # driver name -> (command, driver's last_time_changed after we sent it)
+        self.committed = {}
+        self.pending = None
+        self.depth = 0
+        self.proxies = {}
+        self.issued = 0
+        self.suppressed = 0
+        self.last_issued = 0
+        self.last_suppressed = 0
+        self.updates = 0
+
+    def proxy(self, driver):
+        if driver.name not in self.proxies:
+            self.proxies[driver.name] = LampProxy(driver, self)
+        return self.proxies[driver.name]
+
+    def begin(self):
+        if self.depth == 0:
+            self.pending = {}
+        self.depth += 1
+
+    def command(self, driver, method, args):
+        if self.pending == None:
+            # not in an update - send it right away
+            getattr(driver, method)(*args)
+        else:
+            # the last command for a lamp is the one that counts
+            self.pending[driver.name] = (driver, method, args)
+
+    def commit(self):
+        self.depth -= 1
+        if self.depth > 0:
+            return
+        issued = 0
+        suppressed = 0
+        for name, (driver, method, args) in self.pending.iteritems():
+            command = (method, args)
+            last = self.committed.get(name)
+            # skip it if it's what we sent last time and nothing else has touched the driver since
+            if last != None and last[0] == command and last[1] == getattr(driver, 'last_time_changed', None) and self.steady(method, args):
+                suppressed += 1
+                continue
+            getattr(driver, method)(*args)
+            issued += 1
+            self.committed[name] = (command, getattr(driver, 'last_time_changed', None))
+        self.pending = None
+        self.updates += 1
+        self.last_issued = issued
+        self.last_suppressed = suppressed
+        self.issued += issued
+        self.suppressed += suppressed
+
+    def steady(self, method, args):
+        # timed schedules run out, so those always get sent again
+        if method == 'schedule':
+            return args[1] == 0
+        return True
+
+    def forget(self):
+        """Drops the committed state, so the next update sends everything"""
+        self.committed = {}
+
+    def report(self):
+        return "Lamp updates: %d, commands issued: %d, suppressed: %d (last update %d/%d)" % (self.updates, self.issued, self.suppressed, self.last_issued, self.last_suppressed)
+
+class LampProxy(object):
+    """Stands in for a lamp driver for lamp control - commands go through the lamp state"""
+    def __init__(self, driver, state):
+        self.driver = driver
+        self.lamp_state = state
+
+    def schedule(self, schedule, cycle_seconds=0, now=True):
+        self.lamp_state.command(self.driver, 'schedule', (schedule, cycle_seconds, now))
+
+    def enable(self):
+        self.lamp_state.command(self.driver, 'enable', ())
+
+    def disable(self):
+        self.lamp_state.command(self.driver, 'disable', ())
+
+    def __getattr__(self, attr):
+        # anything else goes straight to the driver
+        return getattr(self.driver, attr)
+
+class LampGroup(object):
+    """Lamp control's view of the game's lamps or coils - hands out proxies instead of drivers"""
+    def __init__(self, items, state):
+        self.items = items
+        self.lamp_state = state
+
+    def __getattr__(self, attr):
+        return self.lamp_state.proxy(getattr(self.items, attr))
+
+    def __getitem__(self, name):
+        return self.lamp_state.proxy(self.items[name])
+
+    def __iter__(self):
+        for driver in self.items:
+            yield self.lamp_state.proxy(driver)
+
+    def items_tagged(self, tag):
+        return [self.lamp_state.proxy(driver) for driver in self.items.items_tagged(tag)]
 
 class LampControl(ep.EP_Mode):
     """Playfield Lamp Controller"""
     def __init__(self, game,priority):
         super(LampControl, self).__init__(game, priority)
         self.myID = "Lamp Control"
+        # lamp commands go through the lamp state, so update only sends what changed
+        self.lamp_state = LampState()
+        self.lamps = LampGroup(self.game.lamps, self.lamp_state)
+        self.coils = LampGroup(self.game.coils, self.lamp_state)
 
         # lamp groups
-        self.starLamps = [self.game.lamps.starMotherlode,
-                          self.game.lamps.starCombo,
-                          self.game.lamps.starBartBrothers,
-                          self.game.lamps.starShowdown,
-                          self.game.lamps.starStampede]
+        self.starLamps = [self.lamps.starMotherlode,
+                          self.lamps.starCombo,
+                          self.lamps.starBartBrothers,
+                          self.lamps.starShowdown,
+                          self.lamps.starStampede]
         # rank - set up the bulb list
-        self.rankLamps = [self.game.lamps.rankStranger,
-                      self.game.lamps.rankPartner,
-                      self.game.lamps.rankDeputy,
-                      self.game.lamps.rankSheriff,
-                      self.game.lamps.rankMarshall]
+        self.rankLamps = [self.lamps.rankStranger,
+                      self.lamps.rankPartner,
+                      self.lamps.rankDeputy,
+                      self.lamps.rankSheriff,
+                      self.lamps.rankMarshall]
         # combo lamps
-        self.comboLights = [self.game.lamps.rightRampCombo,
-                            self.game.lamps.leftRampCombo,
-                            self.game.lamps.centerRampCombo,
-                            self.game.lamps.leftLoopCombo,
-                            self.game.lamps.rightLoopCombo]
+        self.comboLights = [self.lamps.rightRampCombo,
+                            self.lamps.leftRampCombo,
+                            self.lamps.centerRampCombo,
+                            self.lamps.leftLoopCombo,
+                            self.lamps.rightLoopCombo]
         # bad guys
-        self.badGuyLamps = [self.game.lamps.badGuyL0,
-                      self.game.lamps.badGuyL1,
-                      self.game.lamps.badGuyL2,
-                      self.game.lamps.badGuyL3]
+        self.badGuyLamps = [self.lamps.badGuyL0,
+                      self.lamps.badGuyL1,
+                      self.lamps.badGuyL2,
+                      self.lamps.badGuyL3]
 
         self.bigFive = [self.left_loop,self.left_ramp,self.center_ramp,self.right_loop,self.right_ramp]
         self.lights_out = self.game.user_settings['Gameplay (Feature)']['Party Mode'] == 'Lights Out'
@@ -60,18 +175,30 @@ class LampControl(ep.EP_Mode):
 
     def disable_lamps(self):
         # disable all playfield lamps
-        for lamp in self.game.lamps.items_tagged('Main'):
+        for lamp in self.lamps.items_tagged('Main'):
             lamp.disable()
-        self.game.coils.mineFlasher.disable()
+        self.coils.mineFlasher.disable()
         # Note, this doesn't disable the bonus lanes, the bad guys, or the combos
 
     def disable_all_lamps(self):
-        for lamp in self.game.lamps.items_tagged('Playfield'):
+        for lamp in self.lamps.items_tagged('Playfield'):
             lamp.disable()
         # this gets scheduled in some instances too, so for good measure
-        self.game.coils.mineFlasher.disable()
+        self.coils.mineFlasher.disable()
 
     def update(self):
+        # work out what every lamp should be doing, then only send the ones that changed
+        if ep.profiler.enabled:
+            start = time.time()
+        self.lamp_state.begin()
+        try:
+            self.update_all()
+        finally:
+            self.lamp_state.commit()
+        if ep.profiler.enabled:
+            ep.profiler.record("LampControl.update", start)
+
+    def update_all(self):
         # marhsall multiball is a whole separate thing - dont run this when it's running
         if self.game.marshall_multiball.running:
             return
@@ -213,28 +340,28 @@ class LampControl(ep.EP_Mode):
                 self.gunfight_flash()
             else:
                 if left == 'READY':
-                    self.game.lamps.leftReturnQuickdraw.schedule(0x00FF00FF)
+                    self.lamps.leftReturnQuickdraw.schedule(0x00FF00FF)
                 if right == 'READY' and self.game.base.guns_allowed():
-                    self.game.lamps.rightReturnQuickdraw.schedule(0x00FF00FF)
+                    self.lamps.rightReturnQuickdraw.schedule(0x00FF00FF)
                 ## on a second pass thorugh the returns - if showdown is ready, flash 'em both
                 if self.game.show_tracking('showdownStatus') == "READY" or self.game.show_tracking('ambushStatus') == "READY":
-                    self.game.lamps.rightReturnQuickdraw.schedule(0x0F0F0F0F)
-                    self.game.lamps.leftReturnQuickdraw.schedule(0xF0F0F0F0)
+                    self.lamps.rightReturnQuickdraw.schedule(0x0F0F0F0F)
+                    self.lamps.leftReturnQuickdraw.schedule(0xF0F0F0F0)
         # even if guns aren't allowed the quickdraw playfield lights should be on if needed
         if self.game.taf_tribute.running:
-            self.game.lamps.leftQuickdraw.schedule(0x0F0F0F0F)
+            self.lamps.leftQuickdraw.schedule(0x0F0F0F0F)
         else:
             if left == 'OPEN':
-                self.game.lamps.leftQuickdraw.enable()
+                self.lamps.leftQuickdraw.enable()
             if left == 'TOP' or left == 'BOT':
-                self.game.lamps.leftQuickdraw.schedule(0x00FF00FF)
+                self.lamps.leftQuickdraw.schedule(0x00FF00FF)
         if right == 'OPEN':
-            self.game.lamps.topRightQuickdraw.enable()
-            self.game.lamps.bottomRightQuickdraw.enable()
+            self.lamps.topRightQuickdraw.enable()
+            self.lamps.bottomRightQuickdraw.enable()
         if right == 'TOP':
-            self.game.lamps.bottomRightQuickdraw.enable()
+            self.lamps.bottomRightQuickdraw.enable()
         if right == 'BOT':
-            self.game.lamps.topRightQuickdraw.enable()
+            self.lamps.topRightQuickdraw.enable()
 
 
         #   __  __ _
@@ -245,7 +372,7 @@ class LampControl(ep.EP_Mode):
         #
         # if there's an extra ball pending, flash the light at the mine
         if ebPending > 0:
-            self.game.lamps.extraBall.schedule(0x0F0F0F0F)
+            self.lamps.extraBall.schedule(0x0F0F0F0F)
         # This batch of stuff doesn't happen during certain modes
         if self.game.stampede.running or \
             self.game.ambush.running or \
@@ -256,15 +383,15 @@ class LampControl(ep.EP_Mode):
         else:
             # for the mine arrow , ther'es a bunch of conditionals
             if highNoonStatus == "READY":
-                self.game.lamps.mineLock.schedule(0x00FF00FF)
-                self.game.coils.mineFlasher.schedule(0x00010001)
+                self.lamps.mineLock.schedule(0x00FF00FF)
+                self.coils.mineFlasher.schedule(0x00010001)
             elif mineStatus == "LOCK":
-                self.game.lamps.mineLock.enable()
+                self.lamps.mineLock.enable()
             elif mineStatus == "READY":
-                self.game.lamps.mineLock.schedule(0x0F0F0F0F)
+                self.lamps.mineLock.schedule(0x0F0F0F0F)
             elif self.game.show_tracking('motherlodeLit') or self.game.gm_multiball.restartFlag:
-                self.game.coils.mineFlasher.schedule(0x00010001)
-                self.game.lamps.mineLock.schedule(0x0F0F0F0F)
+                self.coils.mineFlasher.schedule(0x00010001)
+                self.lamps.mineLock.schedule(0x0F0F0F0F)
             else:
                 pass
 
@@ -282,11 +409,11 @@ class LampControl(ep.EP_Mode):
             self.saloon_flash(1)
         # if drunk multiball is ready - flash the arrow
         elif drunkStatus == "READY":
-            self.game.lamps.bountySaloon.schedule(0xF0F0F0F0)
+            self.lamps.bountySaloon.schedule(0xF0F0F0F0)
         # Otherwise, if there's a live bart bro, turn on the saloon arrow
         elif bartStatus == 'RUNNING' or bartStatus == 'LAST':
             if bionicStatus != "READY":
-                self.game.lamps.saloonArrow.enable()
+                self.lamps.saloonArrow.enable()
         else:
             pass
 
@@ -300,15 +427,15 @@ class LampControl(ep.EP_Mode):
         # if a bounty is lit - flash the saloon and turn on the beacon light
         if self.game.show_tracking('isBountyLit'):
             if bionicStatus != "READY" and drunkStatus != "READY":
-                self.game.lamps.bountySaloon.schedule(0xFF00FF00)
-            self.game.lamps.bountyBeacon.enable()
+                self.lamps.bountySaloon.schedule(0xFF00FF00)
+            self.lamps.bountyBeacon.enable()
             beacon = True
         # if there's an extra ball to collect - turn on the beacon light for it
         if ebPending > 0:
             beacon = True
         # if any beacon light is on, enable the shoot to collect above
         if beacon:
-            self.game.lamps.shootToCollect.enable()
+            self.lamps.shootToCollect.enable()
 
         #
         #  ____  _                 _        _               _
@@ -319,10 +446,10 @@ class LampControl(ep.EP_Mode):
         #                                       |___/
         # if ball saver is on, flash
         if self.game.trough.ball_save_active:
-            self.game.lamps.shootAgain.schedule(0x00FF00FF)
+            self.lamps.shootAgain.schedule(0x00FF00FF)
         # if not ball saver, but extra ball - turn it on
         elif self.game.current_player().extra_balls > 0:
-            self.game.lamps.shootAgain.enable()
+            self.lamps.shootAgain.enable()
         # otherwise, it's off
         else:
             pass
@@ -335,8 +462,8 @@ class LampControl(ep.EP_Mode):
         #
         # if the bozo ball is on, flash the outlanes
         if self.game.show_tracking('bozoBall'):
-            self.game.lamps.rightOutSpecial.schedule(0x0F0F0F0F)
-            self.game.lamps.leftOutGunfight.schedule(0x0F0F0F0F)
+            self.lamps.rightOutSpecial.schedule(0x0F0F0F0F)
+            self.lamps.leftOutGunfight.schedule(0x0F0F0F0F)
 
         #
         #  ____            _    ____
@@ -384,41 +511,41 @@ class LampControl(ep.EP_Mode):
         # the left loop collection of lights
         ## high noon
         if mode == "highNoon":
-            self.game.lamps.leftLoopBuckNBronco.schedule(0x00FF00FF)
-            self.game.lamps.leftLoopWildRide.schedule(0x00FF00FF)
-            self.game.lamps.leftLoopRideEm.schedule(0x00FF00FF)
-            self.game.lamps.leftLoopJackpot.schedule(0x00FF00FF)
+            self.lamps.leftLoopBuckNBronco.schedule(0x00FF00FF)
+            self.lamps.leftLoopWildRide.schedule(0x00FF00FF)
+            self.lamps.leftLoopRideEm.schedule(0x00FF00FF)
+            self.lamps.leftLoopJackpot.schedule(0x00FF00FF)
 
         # bionic bart
         elif mode == "Bionic":
             if 0 in self.game.bionic.activeShots:
-                self.game.lamps.leftLoopBuckNBronco.schedule(0x00FF00FF)
-                self.game.lamps.leftLoopWildRide.schedule(0x00FF00FF)
-                self.game.lamps.leftLoopRideEm.schedule(0x00FF00FF)
-                self.game.lamps.leftLoopJackpot.schedule(0x00FF00FF)
+                self.lamps.leftLoopBuckNBronco.schedule(0x00FF00FF)
+                self.lamps.leftLoopWildRide.schedule(0x00FF00FF)
+                self.lamps.leftLoopRideEm.schedule(0x00FF00FF)
+                self.lamps.leftLoopJackpot.schedule(0x00FF00FF)
 
         # cva
         elif mode == "CvA":
             if self.game.cva.activeShot == 0:
-                self.game.lamps.leftLoopBuckNBronco.schedule(0x00FF00FF)
-                self.game.lamps.leftLoopWildRide.schedule(0x00FF00FF)
-                self.game.lamps.leftLoopRideEm.schedule(0x00FF00FF)
-                self.game.lamps.leftLoopJackpot.schedule(0x00FF00FF)
+                self.lamps.leftLoopBuckNBronco.schedule(0x00FF00FF)
+                self.lamps.leftLoopWildRide.schedule(0x00FF00FF)
+                self.lamps.leftLoopRideEm.schedule(0x00FF00FF)
+                self.lamps.leftLoopJackpot.schedule(0x00FF00FF)
 
         # last call
         elif mode == 'lastCall':
-            self.game.lamps.leftLoopBuckNBronco.schedule(0x00FF00FF)
-            self.game.lamps.leftLoopWildRide.schedule(0x00FF00FF)
-            self.game.lamps.leftLoopRideEm.schedule(0x00FF00FF)
-            self.game.lamps.leftLoopJackpot.schedule(0x00FF00FF)
+            self.lamps.leftLoopBuckNBronco.schedule(0x00FF00FF)
+            self.lamps.leftLoopWildRide.schedule(0x00FF00FF)
+            self.lamps.leftLoopRideEm.schedule(0x00FF00FF)
+            self.lamps.leftLoopJackpot.schedule(0x00FF00FF)
 
         # drunk multiball
         elif mode == "Drunk":
             if 'leftLoop' in self.game.drunk_multiball.active:
-                self.game.lamps.leftLoopJackpot.enable()
-                self.game.lamps.leftLoopRideEm.schedule(0xFF00FF00)
-                self.game.lamps.leftLoopWildRide.schedule(0xFF00FF00)
-                self.game.lamps.leftLoopBuckNBronco.schedule(0xFF00FF00)
+                self.lamps.leftLoopJackpot.enable()
+                self.lamps.leftLoopRideEm.schedule(0xFF00FF00)
+                self.lamps.leftLoopWildRide.schedule(0xFF00FF00)
+                self.lamps.leftLoopBuckNBronco.schedule(0xFF00FF00)
 
         ## goldmine check
         elif mode == "Mine":
@@ -426,31 +553,31 @@ class LampControl(ep.EP_Mode):
                 # check if this jackpot shot is active
             # if drunk multiball is running - check those and update
                 if self.game.drunk_multiball.running and 'leftLoop' in self.game.drunk_multiball.active:
-                    self.game.lamps.leftLoopJackpot.enable()
-                    self.game.lamps.leftLoopRideEm.schedule(0xFF00FF00)
-                    self.game.lamps.leftLoopWildRide.schedule(0xFF00FF00)
-                    self.game.lamps.leftLoopBuckNBronco.schedule(0xFF00FF00)
+                    self.lamps.leftLoopJackpot.enable()
+                    self.lamps.leftLoopRideEm.schedule(0xFF00FF00)
+                    self.lamps.leftLoopWildRide.schedule(0xFF00FF00)
+                    self.lamps.leftLoopBuckNBronco.schedule(0xFF00FF00)
                 else:
                     if self.game.show_tracking('jackpotStatus',0):
-                        self.game.lamps.leftLoopJackpot.enable()
-                        self.game.lamps.leftLoopRideEm.schedule(0xF0FFF0FF)
-                        self.game.lamps.leftLoopWildRide.schedule(0xFF0FFF0F)
-                        self.game.lamps.leftLoopBuckNBronco.schedule(0xFFF0FFF0)
+                        self.lamps.leftLoopJackpot.enable()
+                        self.lamps.leftLoopRideEm.schedule(0xF0FFF0FF)
+                        self.lamps.leftLoopWildRide.schedule(0xFF0FFF0F)
+                        self.lamps.leftLoopBuckNBronco.schedule(0xFFF0FFF0)
 
         ##  stampede
         elif mode == "Stampede":
             ## left loop is #0 in the stampede jackpot list
             if self.game.stampede.active == 0:
-                self.game.lamps.leftLoopJackpot.schedule(0xF000F000)
-                self.game.lamps.leftLoopRideEm.schedule(0x0F000F00)
-                self.game.lamps.leftLoopWildRide.schedule(0x00F000F0)
-                self.game.lamps.leftLoopBuckNBronco.schedule(0x000F000F)
+                self.lamps.leftLoopJackpot.schedule(0xF000F000)
+                self.lamps.leftLoopRideEm.schedule(0x0F000F00)
+                self.lamps.leftLoopWildRide.schedule(0x00F000F0)
+                self.lamps.leftLoopBuckNBronco.schedule(0x000F000F)
             # if not active, just turn on the jackpot light only
             else:
-                self.game.lamps.leftLoopJackpot.schedule(0xFF00FF00)
+                self.lamps.leftLoopJackpot.schedule(0xFF00FF00)
 
         elif mode == "Disable":
-            for lamp in self.game.lamps.items_tagged('leftLoop'):
+            for lamp in self.lamps.items_tagged('leftLoop'):
                 lamp.disable()
 
         ## This is the base mode if all else passes
@@ -459,24 +586,24 @@ class LampControl(ep.EP_Mode):
 
             if stage == 1:
                 # blink the first light
-                self.game.lamps.leftLoopBuckNBronco.schedule(0x0F0F0F0F)
+                self.lamps.leftLoopBuckNBronco.schedule(0x0F0F0F0F)
             elif stage == 2:
                 # first light on
-                self.game.lamps.leftLoopBuckNBronco.enable()
+                self.lamps.leftLoopBuckNBronco.enable()
                 # blink the second
-                self.game.lamps.leftLoopWildRide.schedule(0x0F0F0F0F)
+                self.lamps.leftLoopWildRide.schedule(0x0F0F0F0F)
             elif stage == 3:
                 # first two on
-                self.game.lamps.leftLoopBuckNBronco.enable()
-                self.game.lamps.leftLoopWildRide.enable()
+                self.lamps.leftLoopBuckNBronco.enable()
+                self.lamps.leftLoopWildRide.enable()
                 # blink the third
-                self.game.lamps.leftLoopRideEm.schedule(0x0F0F0F0F)
+                self.lamps.leftLoopRideEm.schedule(0x0F0F0F0F)
             # this is completed
             elif stage == 4:
                 # all three on
-                self.game.lamps.leftLoopBuckNBronco.enable()
-                self.game.lamps.leftLoopWildRide.enable()
-                self.game.lamps.leftLoopRideEm.enable()
+                self.lamps.leftLoopBuckNBronco.enable()
+                self.lamps.leftLoopWildRide.enable()
+                self.lamps.leftLoopRideEm.enable()
             else:
                 pass
 
@@ -493,68 +620,68 @@ class LampControl(ep.EP_Mode):
         # the left ramp collection of lights
         ## high noon check
         if mode == "highNoon":
-            self.game.lamps.leftRampWhiteWater.schedule(0x00FF00FF)
-            self.game.lamps.leftRampWaterfall.schedule(0x00FF00FF)
-            self.game.lamps.leftRampSavePolly.schedule(0x00FF00FF)
-            self.game.lamps.leftRampJackpot.schedule(0x00FF00FF)
+            self.lamps.leftRampWhiteWater.schedule(0x00FF00FF)
+            self.lamps.leftRampWaterfall.schedule(0x00FF00FF)
+            self.lamps.leftRampSavePolly.schedule(0x00FF00FF)
+            self.lamps.leftRampJackpot.schedule(0x00FF00FF)
 
         # bionic bart
         elif mode == "Bionic":
             if 1 in self.game.bionic.activeShots:
-                self.game.lamps.leftRampWhiteWater.schedule(0x00FF00FF)
-                self.game.lamps.leftRampWaterfall.schedule(0x00FF00FF)
-                self.game.lamps.leftRampSavePolly.schedule(0x00FF00FF)
-                self.game.lamps.leftRampJackpot.schedule(0x00FF00FF)
+                self.lamps.leftRampWhiteWater.schedule(0x00FF00FF)
+                self.lamps.leftRampWaterfall.schedule(0x00FF00FF)
+                self.lamps.leftRampSavePolly.schedule(0x00FF00FF)
+                self.lamps.leftRampJackpot.schedule(0x00FF00FF)
 
         # cva
         elif mode == "CvA":
             if self.game.cva.activeShot == 1:
-                self.game.lamps.leftRampWhiteWater.schedule(0x00FF00FF)
-                self.game.lamps.leftRampWaterfall.schedule(0x00FF00FF)
-                self.game.lamps.leftRampSavePolly.schedule(0x00FF00FF)
-                self.game.lamps.leftRampJackpot.schedule(0x00FF00FF)
+                self.lamps.leftRampWhiteWater.schedule(0x00FF00FF)
+                self.lamps.leftRampWaterfall.schedule(0x00FF00FF)
+                self.lamps.leftRampSavePolly.schedule(0x00FF00FF)
+                self.lamps.leftRampJackpot.schedule(0x00FF00FF)
 
         # last call
         elif mode == "lastCall":
-            self.game.lamps.leftRampWhiteWater.schedule(0x00FF00FF)
-            self.game.lamps.leftRampWaterfall.schedule(0x00FF00FF)
-            self.game.lamps.leftRampSavePolly.schedule(0x00FF00FF)
-            self.game.lamps.leftRampJackpot.schedule(0x00FF00FF)
+            self.lamps.leftRampWhiteWater.schedule(0x00FF00FF)
+            self.lamps.leftRampWaterfall.schedule(0x00FF00FF)
+            self.lamps.leftRampSavePolly.schedule(0x00FF00FF)
+            self.lamps.leftRampJackpot.schedule(0x00FF00FF)
 
         # drunk multiball
         elif mode == "Drunk":
         ## right ramp is #4 in the stampede jackpot list
             if 'leftRamp' in self.game.drunk_multiball.active:
-                self.game.lamps.leftRampJackpot.enable()
-                self.game.lamps.leftRampSavePolly.schedule(0xFF00FF00)
-                self.game.lamps.leftRampWaterfall.schedule(0xFF00FF00)
-                self.game.lamps.leftRampWhiteWater.schedule(0xFF00FF00)
+                self.lamps.leftRampJackpot.enable()
+                self.lamps.leftRampSavePolly.schedule(0xFF00FF00)
+                self.lamps.leftRampWaterfall.schedule(0xFF00FF00)
+                self.lamps.leftRampWhiteWater.schedule(0xFF00FF00)
 
         # check for goldmine multiball
         elif mode == "Mine":
             if not self.game.gm_multiball.restartFlag:
             # if drunk multiball is running - check those and update
                 if self.game.drunk_multiball.running and 'leftRamp' in self.game.drunk_multiball.active:
-                    self.game.lamps.leftRampJackpot.enable()
-                    self.game.lamps.leftRampSavePolly.schedule(0xFF00FF00)
-                    self.game.lamps.leftRampWaterfall.schedule(0xFF00FF00)
-                    self.game.lamps.leftRampWhiteWater.schedule(0xFF00FF00)
+                    self.lamps.leftRampJackpot.enable()
+                    self.lamps.leftRampSavePolly.schedule(0xFF00FF00)
+                    self.lamps.leftRampWaterfall.schedule(0xFF00FF00)
+                    self.lamps.leftRampWhiteWater.schedule(0xFF00FF00)
                 else:
                     if self.game.show_tracking('jackpotStatus',1):
-                        self.game.lamps.leftRampJackpot.enable()
-                        self.game.lamps.leftRampSavePolly.schedule(0xF0FFF0FF)
-                        self.game.lamps.leftRampWaterfall.schedule(0xFF0FFF0F)
-                        self.game.lamps.leftRampWhiteWater.schedule(0xFFF0FFF0)
+                        self.lamps.leftRampJackpot.enable()
+                        self.lamps.leftRampSavePolly.schedule(0xF0FFF0FF)
+                        self.lamps.leftRampWaterfall.schedule(0xFF0FFF0F)
+                        self.lamps.leftRampWhiteWater.schedule(0xFFF0FFF0)
 
         elif mode == "Stampede":
             if self.game.stampede.active == 1:
-                self.game.lamps.leftRampJackpot.schedule(0xF000F000)
-                self.game.lamps.leftRampSavePolly.schedule(0x0F000F00)
-                self.game.lamps.leftRampWaterfall.schedule(0x00F000F0)
-                self.game.lamps.leftRampWhiteWater.schedule(0x000F000F)
+                self.lamps.leftRampJackpot.schedule(0xF000F000)
+                self.lamps.leftRampSavePolly.schedule(0x0F000F00)
+                self.lamps.leftRampWaterfall.schedule(0x00F000F0)
+                self.lamps.leftRampWhiteWater.schedule(0x000F000F)
             # if not active, just turn on the jackpot light only
             else:
-                self.game.lamps.leftRampJackpot.schedule(0xFF00FF00)
+                self.lamps.leftRampJackpot.schedule(0xFF00FF00)
 
         # save polly
         elif mode == "Polly":
@@ -562,9 +689,9 @@ class LampControl(ep.EP_Mode):
             if self.game.bank_robbery.running:
                 if not self.game.bank_robbery.isActive[0]:
                     return
-            self.game.lamps.leftRampSavePolly.schedule(0x0FF00FF0)
-            self.game.lamps.leftRampWaterfall.schedule(0x00FF00FF)
-            self.game.lamps.leftRampWhiteWater.schedule(0xF00FF00F)
+            self.lamps.leftRampSavePolly.schedule(0x0FF00FF0)
+            self.lamps.leftRampWaterfall.schedule(0x00FF00FF)
+            self.lamps.leftRampWhiteWater.schedule(0xF00FF00F)
             # if the multiplier is on, blink the combo
             print "RIVER CHASE VALUE MULTIPLIER " + str(self.game.river_chase.valueMultiplier)
             print "BANK ROBBERY VALUE MULTIPLIER " + str(self.game.bank_robbery.valueMultiplier)
@@ -572,13 +699,13 @@ class LampControl(ep.EP_Mode):
             if self.game.bank_robbery.valueMultiplier > 1 or\
                self.game.river_chase.valueMultiplier > 1 or\
                self.game.save_polly.valueMultiplier > 1:
-                self.game.lamps.leftRampJackpot.schedule(0xCCCCCCCC)
+                self.lamps.leftRampJackpot.schedule(0xCCCCCCCC)
             else:
-                self.game.lamps.leftRampJackpot.enable()
+                self.lamps.leftRampJackpot.enable()
 
 
         elif mode == "Disable":
-            for lamp in self.game.lamps.items_tagged('leftRamp'):
+            for lamp in self.lamps.items_tagged('leftRamp'):
                 lamp.disable()
 
         else:
@@ -586,24 +713,24 @@ class LampControl(ep.EP_Mode):
 
             if stage == 1:
                 # blink the first light
-                self.game.lamps.leftRampWhiteWater.schedule(0x0F0F0F0F)
+                self.lamps.leftRampWhiteWater.schedule(0x0F0F0F0F)
             elif stage == 2:
                 # first light on
-                self.game.lamps.leftRampWhiteWater.enable()
+                self.lamps.leftRampWhiteWater.enable()
                 # blink the second
-                self.game.lamps.leftRampWaterfall.schedule(0x0F0F0F0F)
+                self.lamps.leftRampWaterfall.schedule(0x0F0F0F0F)
             elif stage == 3:
                 # first two on
-                self.game.lamps.leftRampWhiteWater.enable()
-                self.game.lamps.leftRampWaterfall.enable()
+                self.lamps.leftRampWhiteWater.enable()
+                self.lamps.leftRampWaterfall.enable()
                 # blink the third
-                self.game.lamps.leftRampSavePolly.schedule(0x0F0F0F0F)
+                self.lamps.leftRampSavePolly.schedule(0x0F0F0F0F)
             # this is completed - pulse the 3rd light
             elif stage == 5:
                 # two on
-                self.game.lamps.leftRampWhiteWater.enable()
-                self.game.lamps.leftRampWaterfall.enable()
-                self.game.lamps.leftRampSavePolly.enable()
+                self.lamps.leftRampWhiteWater.enable()
+                self.lamps.leftRampWaterfall.enable()
+                self.lamps.leftRampSavePolly.enable()
 
     #   ____           _              ____
     #  / ___|___ _ __ | |_ ___ _ __  |  _ \ __ _ _ __ ___  _ __
@@ -619,26 +746,26 @@ class LampControl(ep.EP_Mode):
         # the center ramp collection of lights
         ## high noon check
         if mode == "highNoon":
-            self.game.lamps.centerRampCatchTrain.schedule(0x00FF00FF)
-            self.game.lamps.centerRampStopTrain.schedule(0x00FF00FF)
-            self.game.lamps.centerRampSavePolly.schedule(0x00FF00FF)
-            self.game.lamps.centerRampJackpot.schedule(0x00FF00FF)
+            self.lamps.centerRampCatchTrain.schedule(0x00FF00FF)
+            self.lamps.centerRampStopTrain.schedule(0x00FF00FF)
+            self.lamps.centerRampSavePolly.schedule(0x00FF00FF)
+            self.lamps.centerRampJackpot.schedule(0x00FF00FF)
 
         # bionic bart
         elif mode == "Bionic":
             if 2 in self.game.bionic.activeShots:
-                self.game.lamps.centerRampCatchTrain.schedule(0x00FF00FF)
-                self.game.lamps.centerRampStopTrain.schedule(0x00FF00FF)
-                self.game.lamps.centerRampSavePolly.schedule(0x00FF00FF)
-                self.game.lamps.centerRampJackpot.schedule(0x00FF00FF)
+                self.lamps.centerRampCatchTrain.schedule(0x00FF00FF)
+                self.lamps.centerRampStopTrain.schedule(0x00FF00FF)
+                self.lamps.centerRampSavePolly.schedule(0x00FF00FF)
+                self.lamps.centerRampJackpot.schedule(0x00FF00FF)
 
         # cva
         elif mode == "CvA":
             if self.game.cva.activeShot == 2:
-                self.game.lamps.centerRampCatchTrain.schedule(0x00FF00FF)
-                self.game.lamps.centerRampStopTrain.schedule(0x00FF00FF)
-                self.game.lamps.centerRampSavePolly.schedule(0x00FF00FF)
-                self.game.lamps.centerRampJackpot.schedule(0x00FF00FF)
+                self.lamps.centerRampCatchTrain.schedule(0x00FF00FF)
+                self.lamps.centerRampStopTrain.schedule(0x00FF00FF)
+                self.lamps.centerRampSavePolly.schedule(0x00FF00FF)
+                self.lamps.centerRampJackpot.schedule(0x00FF00FF)
 
         # last call
         elif mode == "lastCall":
@@ -648,10 +775,10 @@ class LampControl(ep.EP_Mode):
         elif mode == "Drunk":
         ## right ramp is #4 in the stampede jackpot list
             if 'centerRamp' in self.game.drunk_multiball.active:
-                self.game.lamps.centerRampJackpot.enable()
-                self.game.lamps.centerRampSavePolly.schedule(0xFF00FF00)
-                self.game.lamps.centerRampStopTrain.schedule(0xFF00FF00)
-                self.game.lamps.centerRampCatchTrain.schedule(0xFF00FF00)
+                self.lamps.centerRampJackpot.enable()
+                self.lamps.centerRampSavePolly.schedule(0xFF00FF00)
+                self.lamps.centerRampStopTrain.schedule(0xFF00FF00)
+                self.lamps.centerRampCatchTrain.schedule(0xFF00FF00)
 
 
         # check goldmine active status
@@ -659,61 +786,61 @@ class LampControl(ep.EP_Mode):
             if not self.game.gm_multiball.restartFlag:
             # if drunk multiball is running - check those and update
                 if self.game.drunk_multiball.running and 'centerRamp' in self.game.drunk_multiball.active:
-                    self.game.lamps.centerRampJackpot.enable()
-                    self.game.lamps.centerRampSavePolly.schedule(0xFF00FF00)
-                    self.game.lamps.centerRampStopTrain.schedule(0xFF00FF00)
-                    self.game.lamps.centerRampCatchTrain.schedule(0xFF00FF00)
+                    self.lamps.centerRampJackpot.enable()
+                    self.lamps.centerRampSavePolly.schedule(0xFF00FF00)
+                    self.lamps.centerRampStopTrain.schedule(0xFF00FF00)
+                    self.lamps.centerRampCatchTrain.schedule(0xFF00FF00)
                 else:
                     if self.game.show_tracking('jackpotStatus',2):
-                        self.game.lamps.centerRampJackpot.enable()
-                        self.game.lamps.centerRampSavePolly.schedule(0xF0FFF0FF)
-                        self.game.lamps.centerRampStopTrain.schedule(0xFF0FFF0F)
-                        self.game.lamps.centerRampCatchTrain.schedule(0xFFF0FFF0)
+                        self.lamps.centerRampJackpot.enable()
+                        self.lamps.centerRampSavePolly.schedule(0xF0FFF0FF)
+                        self.lamps.centerRampStopTrain.schedule(0xFF0FFF0F)
+                        self.lamps.centerRampCatchTrain.schedule(0xFFF0FFF0)
 
         elif mode == "Stampede":
         ## center ramp is #2 in the stampede jackpot list
             if self.game.stampede.active == 2:
-                self.game.lamps.centerRampJackpot.schedule(0xF000F000)
-                self.game.lamps.centerRampSavePolly.schedule(0x0F000F00)
-                self.game.lamps.centerRampStopTrain.schedule(0x00F000F0)
-                self.game.lamps.centerRampCatchTrain.schedule(0x000F000F)
+                self.lamps.centerRampJackpot.schedule(0xF000F000)
+                self.lamps.centerRampSavePolly.schedule(0x0F000F00)
+                self.lamps.centerRampStopTrain.schedule(0x00F000F0)
+                self.lamps.centerRampCatchTrain.schedule(0x000F000F)
             # if not active, just turn on the jackpot light only
             else:
-                self.game.lamps.centerRampJackpot.schedule(0xFF00FF00)
+                self.lamps.centerRampJackpot.schedule(0xFF00FF00)
 
         elif mode == "Polly":
             if self.game.river_chase.running:
-                self.game.lamps.centerRampSavePolly.schedule(0x0FF00FF0)
-                self.game.lamps.centerRampStopTrain.schedule(0x00FF00FF)
-                self.game.lamps.centerRampCatchTrain.schedule(0xF00FF00F)
+                self.lamps.centerRampSavePolly.schedule(0x0FF00FF0)
+                self.lamps.centerRampStopTrain.schedule(0x00FF00FF)
+                self.lamps.centerRampCatchTrain.schedule(0xF00FF00F)
                 # if the multiplier is on, blink the combo
                 if self.game.river_chase.valueMultiplier > 1:
-                    self.game.lamps.centerRampJackpot.schedule(0xCCCCCCCC)
+                    self.lamps.centerRampJackpot.schedule(0xCCCCCCCC)
                 else:
-                    self.game.lamps.centerRampJackpot.enable()
+                    self.lamps.centerRampJackpot.enable()
 
 
             elif self.game.bank_robbery.running:
                 if self.game.bank_robbery.isActive[1]:
-                    self.game.lamps.centerRampJackpot.enable()
-                    self.game.lamps.centerRampSavePolly.schedule(0x0FF00FF0)
-                    self.game.lamps.centerRampStopTrain.schedule(0x00FF00FF)
-                    self.game.lamps.centerRampCatchTrain.schedule(0xF00FF00F)
+                    self.lamps.centerRampJackpot.enable()
+                    self.lamps.centerRampSavePolly.schedule(0x0FF00FF0)
+                    self.lamps.centerRampStopTrain.schedule(0x00FF00FF)
+                    self.lamps.centerRampCatchTrain.schedule(0xF00FF00F)
                     # if the multiplier is on, blink the combo
                     if self.game.bank_robbery.valueMultiplier > 1:
-                        self.game.lamps.centerRampJackpot.schedule(0xCCCCCCCC)
+                        self.lamps.centerRampJackpot.schedule(0xCCCCCCCC)
                     else:
-                        self.game.lamps.centerRampJackpot.enable()
+                        self.lamps.centerRampJackpot.enable()
 
 
             else:
-                self.game.lamps.centerRampJackpot.enable()
-                self.game.lamps.centerRampSavePolly.schedule(0x00FFFF00)
-                self.game.lamps.centerRampStopTrain.schedule(0x0000FFFF)
-                self.game.lamps.centerRampCatchTrain.schedule(0xFF0000FF)
+                self.lamps.centerRampJackpot.enable()
+                self.lamps.centerRampSavePolly.schedule(0x00FFFF00)
+                self.lamps.centerRampStopTrain.schedule(0x0000FFFF)
+                self.lamps.centerRampCatchTrain.schedule(0xFF0000FF)
 
         elif mode == "Disable":
-            for lamp in self.game.lamps.items_tagged('centerRamp'):
+            for lamp in self.lamps.items_tagged('centerRamp'):
                 lamp.disable()
 
         else:
@@ -721,25 +848,25 @@ class LampControl(ep.EP_Mode):
 
             if stage == 1:
                 # blink the first light
-                self.game.lamps.centerRampCatchTrain.schedule(0x0F0F0F0F)
+                self.lamps.centerRampCatchTrain.schedule(0x0F0F0F0F)
             elif stage == 2:
                 # first light on
-                self.game.lamps.centerRampCatchTrain.enable()
+                self.lamps.centerRampCatchTrain.enable()
                 # blink the second
-                self.game.lamps.centerRampStopTrain.schedule(0x0F0F0F0F)
+                self.lamps.centerRampStopTrain.schedule(0x0F0F0F0F)
             elif stage == 3:
                 # first two on
-                self.game.lamps.centerRampCatchTrain.enable()
-                self.game.lamps.centerRampStopTrain.enable()
+                self.lamps.centerRampCatchTrain.enable()
+                self.lamps.centerRampStopTrain.enable()
                 # blink the third
-                self.game.lamps.centerRampSavePolly.schedule(0x0F0F0F0F)
+                self.lamps.centerRampSavePolly.schedule(0x0F0F0F0F)
 
             # this is after polly peril - all three on
             elif stage == 5:
             # after polly, before stampede all three stay on
-                self.game.lamps.centerRampCatchTrain.enable()
-                self.game.lamps.centerRampStopTrain.enable()
-                self.game.lamps.centerRampSavePolly.enable()
+                self.lamps.centerRampCatchTrain.enable()
+                self.lamps.centerRampStopTrain.enable()
+                self.lamps.centerRampSavePolly.enable()
             else:
                 pass
 
@@ -756,73 +883,73 @@ class LampControl(ep.EP_Mode):
         # the right loop collection of lights
         ## high noon check
         if mode == "highNoon":
-            self.game.lamps.rightLoopGoodShot.schedule(0x00FF00FF)
-            self.game.lamps.rightLoopGunslinger.schedule(0x00FF00FF)
-            self.game.lamps.rightLoopMarksman.schedule(0x00FF00FF)
-            self.game.lamps.rightLoopJackpot.schedule(0x00FF00FF)
+            self.lamps.rightLoopGoodShot.schedule(0x00FF00FF)
+            self.lamps.rightLoopGunslinger.schedule(0x00FF00FF)
+            self.lamps.rightLoopMarksman.schedule(0x00FF00FF)
+            self.lamps.rightLoopJackpot.schedule(0x00FF00FF)
 
         # bionic bart
         elif mode == "Bionic":
             if 3 in self.game.bionic.activeShots:
-                self.game.lamps.rightLoopGoodShot.schedule(0x00FF00FF)
-                self.game.lamps.rightLoopGunslinger.schedule(0x00FF00FF)
-                self.game.lamps.rightLoopMarksman.schedule(0x00FF00FF)
-                self.game.lamps.rightLoopJackpot.schedule(0x00FF00FF)
+                self.lamps.rightLoopGoodShot.schedule(0x00FF00FF)
+                self.lamps.rightLoopGunslinger.schedule(0x00FF00FF)
+                self.lamps.rightLoopMarksman.schedule(0x00FF00FF)
+                self.lamps.rightLoopJackpot.schedule(0x00FF00FF)
 
         # cva
         elif mode == "CvA":
             if self.game.cva.activeShot == 3:
-                self.game.lamps.rightLoopGoodShot.schedule(0x00FF00FF)
-                self.game.lamps.rightLoopGunslinger.schedule(0x00FF00FF)
-                self.game.lamps.rightLoopMarksman.schedule(0x00FF00FF)
-                self.game.lamps.rightLoopJackpot.schedule(0x00FF00FF)
+                self.lamps.rightLoopGoodShot.schedule(0x00FF00FF)
+                self.lamps.rightLoopGunslinger.schedule(0x00FF00FF)
+                self.lamps.rightLoopMarksman.schedule(0x00FF00FF)
+                self.lamps.rightLoopJackpot.schedule(0x00FF00FF)
 
         # last call
         elif mode == "lastCall":
-            self.game.lamps.rightLoopGoodShot.schedule(0x00FF00FF)
-            self.game.lamps.rightLoopGunslinger.schedule(0x00FF00FF)
-            self.game.lamps.rightLoopMarksman.schedule(0x00FF00FF)
-            self.game.lamps.rightLoopJackpot.schedule(0x00FF00FF)
+            self.lamps.rightLoopGoodShot.schedule(0x00FF00FF)
+            self.lamps.rightLoopGunslinger.schedule(0x00FF00FF)
+            self.lamps.rightLoopMarksman.schedule(0x00FF00FF)
+            self.lamps.rightLoopJackpot.schedule(0x00FF00FF)
 
         # drunk multiball
         elif mode == "Drunk":
             ## right ramp is #4 in the stampede jackpot list
             if 'rightLoop' in self.game.drunk_multiball.active:
-                self.game.lamps.rightLoopJackpot.enable()
-                self.game.lamps.rightLoopMarksman.schedule(0xFF00FF00)
-                self.game.lamps.rightLoopGunslinger.schedule(0xFF00FF00)
-                self.game.lamps.rightLoopGoodShot.schedule(0xFF00FF00)
+                self.lamps.rightLoopJackpot.enable()
+                self.lamps.rightLoopMarksman.schedule(0xFF00FF00)
+                self.lamps.rightLoopGunslinger.schedule(0xFF00FF00)
+                self.lamps.rightLoopGoodShot.schedule(0xFF00FF00)
 
         # goldmine active check
         elif mode == "Mine":
             if not self.game.gm_multiball.restartFlag:
             # if drunk multiball is running - check those and update
                 if self.game.drunk_multiball.running and 'rightLoop' in self.game.drunk_multiball.active:
-                    self.game.lamps.rightLoopJackpot.enable()
-                    self.game.lamps.rightLoopMarksman.schedule(0xFF00FF00)
-                    self.game.lamps.rightLoopGunslinger.schedule(0xFF00FF00)
-                    self.game.lamps.rightLoopGoodShot.schedule(0xFF00FF00)
+                    self.lamps.rightLoopJackpot.enable()
+                    self.lamps.rightLoopMarksman.schedule(0xFF00FF00)
+                    self.lamps.rightLoopGunslinger.schedule(0xFF00FF00)
+                    self.lamps.rightLoopGoodShot.schedule(0xFF00FF00)
                 else:
                     if self.game.show_tracking('jackpotStatus',3):
-                        self.game.lamps.rightLoopJackpot.enable()
-                        self.game.lamps.rightLoopMarksman.schedule(0xF0FFF0FF)
-                        self.game.lamps.rightLoopGunslinger.schedule(0xFF0FFF0F)
-                        self.game.lamps.rightLoopGoodShot.schedule(0xFFF0FFF0)
+                        self.lamps.rightLoopJackpot.enable()
+                        self.lamps.rightLoopMarksman.schedule(0xF0FFF0FF)
+                        self.lamps.rightLoopGunslinger.schedule(0xFF0FFF0F)
+                        self.lamps.rightLoopGoodShot.schedule(0xFFF0FFF0)
 
         # stampede
         elif mode == "Stampede":
             ## right loop is #3 in the stampede jackpot list
             if self.game.stampede.active == 3:
-                self.game.lamps.rightLoopJackpot.schedule(0xF000F000)
-                self.game.lamps.rightLoopMarksman.schedule(0x0F000F00)
-                self.game.lamps.rightLoopGunslinger.schedule(0x00F000F0)
-                self.game.lamps.rightLoopGoodShot.schedule(0x000F000F)
+                self.lamps.rightLoopJackpot.schedule(0xF000F000)
+                self.lamps.rightLoopMarksman.schedule(0x0F000F00)
+                self.lamps.rightLoopGunslinger.schedule(0x00F000F0)
+                self.lamps.rightLoopGoodShot.schedule(0x000F000F)
             # if not active, just turn on the jackpot light only
             else:
-                self.game.lamps.rightLoopJackpot.schedule(0xFF00FF00)
+                self.lamps.rightLoopJackpot.schedule(0xFF00FF00)
 
         elif mode == "Disable":
-            for lamp in self.game.lamps.items_tagged('rightLoop'):
+            for lamp in self.lamps.items_tagged('rightLoop'):
                 lamp.disable()
 
         else:
@@ -830,24 +957,24 @@ class LampControl(ep.EP_Mode):
 
             if stage == 1:
                 # blink the first light
-                self.game.lamps.rightLoopGoodShot.schedule(0x0F0F0F0F)
+                self.lamps.rightLoopGoodShot.schedule(0x0F0F0F0F)
             elif stage == 2:
                 # first light on
-                self.game.lamps.rightLoopGoodShot.enable()
+                self.lamps.rightLoopGoodShot.enable()
                 # blink the second
-                self.game.lamps.rightLoopGunslinger.schedule(0x0F0F0F0F)
+                self.lamps.rightLoopGunslinger.schedule(0x0F0F0F0F)
             elif stage == 3:
                 # first two on
-                self.game.lamps.rightLoopGoodShot.enable()
-                self.game.lamps.rightLoopGunslinger.enable()
+                self.lamps.rightLoopGoodShot.enable()
+                self.lamps.rightLoopGunslinger.enable()
                 # blink the third
-                self.game.lamps.rightLoopMarksman.schedule(0x0F0F0F0F)
+                self.lamps.rightLoopMarksman.schedule(0x0F0F0F0F)
             # this is completed
             elif stage == 4:
                 # all three on
-                self.game.lamps.rightLoopGoodShot.enable()
-                self.game.lamps.rightLoopGunslinger.enable()
-                self.game.lamps.rightLoopMarksman.enable()
+                self.lamps.rightLoopGoodShot.enable()
+                self.lamps.rightLoopGunslinger.enable()
+                self.lamps.rightLoopMarksman.enable()
 
     #  ____  _       _     _     ____
     # |  _ \(_) __ _| |__ | |_  |  _ \ __ _ _ __ ___  _ __
@@ -863,91 +990,91 @@ class LampControl(ep.EP_Mode):
         # the right ramp collection of lights
         ## high noon check
         if mode =="highNoon":
-            self.game.lamps.rightRampSoundAlarm.schedule(0x00FF00FF)
-            self.game.lamps.rightRampShootOut.schedule(0x00FF00FF)
-            self.game.lamps.rightRampSavePolly.schedule(0x00FF00FF)
-            self.game.lamps.rightRampJackpot.schedule(0x00FF00FF)
+            self.lamps.rightRampSoundAlarm.schedule(0x00FF00FF)
+            self.lamps.rightRampShootOut.schedule(0x00FF00FF)
+            self.lamps.rightRampSavePolly.schedule(0x00FF00FF)
+            self.lamps.rightRampJackpot.schedule(0x00FF00FF)
 
         # bionic bart
         elif mode == "Bionic":
             if 4 in self.game.bionic.activeShots:
-                self.game.lamps.rightRampSoundAlarm.schedule(0x00FF00FF)
-                self.game.lamps.rightRampShootOut.schedule(0x00FF00FF)
-                self.game.lamps.rightRampSavePolly.schedule(0x00FF00FF)
-                self.game.lamps.rightRampJackpot.schedule(0x00FF00FF)
+                self.lamps.rightRampSoundAlarm.schedule(0x00FF00FF)
+                self.lamps.rightRampShootOut.schedule(0x00FF00FF)
+                self.lamps.rightRampSavePolly.schedule(0x00FF00FF)
+                self.lamps.rightRampJackpot.schedule(0x00FF00FF)
 
         # cva
         elif mode == "CvA":
             if self.game.cva.activeShot == 4:
-                self.game.lamps.rightRampSoundAlarm.schedule(0x00FF00FF)
-                self.game.lamps.rightRampShootOut.schedule(0x00FF00FF)
-                self.game.lamps.rightRampSavePolly.schedule(0x00FF00FF)
-                self.game.lamps.rightRampJackpot.schedule(0x00FF00FF)
+                self.lamps.rightRampSoundAlarm.schedule(0x00FF00FF)
+                self.lamps.rightRampShootOut.schedule(0x00FF00FF)
+                self.lamps.rightRampSavePolly.schedule(0x00FF00FF)
+                self.lamps.rightRampJackpot.schedule(0x00FF00FF)
 
         # last call
         elif mode == "lastCall":
-            self.game.lamps.rightRampSoundAlarm.schedule(0x00FF00FF)
-            self.game.lamps.rightRampShootOut.schedule(0x00FF00FF)
-            self.game.lamps.rightRampSavePolly.schedule(0x00FF00FF)
-            self.game.lamps.rightRampJackpot.schedule(0x00FF00FF)
+            self.lamps.rightRampSoundAlarm.schedule(0x00FF00FF)
+            self.lamps.rightRampShootOut.schedule(0x00FF00FF)
+            self.lamps.rightRampSavePolly.schedule(0x00FF00FF)
+            self.lamps.rightRampJackpot.schedule(0x00FF00FF)
 
         # drunk multiball
         elif mode == "Drunk":
         ## right ramp is #4 in the stampede jackpot list
             if 'rightRamp' in self.game.drunk_multiball.active:
-                self.game.lamps.rightRampJackpot.enable()
-                self.game.lamps.rightRampSavePolly.schedule(0xFF00FF00)
-                self.game.lamps.rightRampShootOut.schedule(0xFF00FF00)
-                self.game.lamps.rightRampSoundAlarm.schedule(0xFF00FF00)
+                self.lamps.rightRampJackpot.enable()
+                self.lamps.rightRampSavePolly.schedule(0xFF00FF00)
+                self.lamps.rightRampShootOut.schedule(0xFF00FF00)
+                self.lamps.rightRampSoundAlarm.schedule(0xFF00FF00)
 
         # goldmine multiball check
         elif mode == "Mine":
             if not self.game.gm_multiball.restartFlag:
             # if drunk multiball is running - check those and update
                 if self.game.drunk_multiball.running and 'rightRamp' in self.game.drunk_multiball.active:
-                    self.game.lamps.rightRampJackpot.enable()
-                    self.game.lamps.rightRampSavePolly.schedule(0xFF00FF00)
-                    self.game.lamps.rightRampShootOut.schedule(0xFF00FF00)
-                    self.game.lamps.rightRampSoundAlarm.schedule(0xFF00FF00)
+                    self.lamps.rightRampJackpot.enable()
+                    self.lamps.rightRampSavePolly.schedule(0xFF00FF00)
+                    self.lamps.rightRampShootOut.schedule(0xFF00FF00)
+                    self.lamps.rightRampSoundAlarm.schedule(0xFF00FF00)
                 else:
                     if self.game.show_tracking('jackpotStatus',4):
-                        self.game.lamps.rightRampJackpot.enable()
-                        self.game.lamps.rightRampSavePolly.schedule(0xF0FFF0FF)
-                        self.game.lamps.rightRampShootOut.schedule(0xFF0FFF0F)
-                        self.game.lamps.rightRampSoundAlarm.schedule(0xFFF0FFF0)
+                        self.lamps.rightRampJackpot.enable()
+                        self.lamps.rightRampSavePolly.schedule(0xF0FFF0FF)
+                        self.lamps.rightRampShootOut.schedule(0xFF0FFF0F)
+                        self.lamps.rightRampSoundAlarm.schedule(0xFFF0FFF0)
 
         elif mode == "Stampede":
         ## right ramp is #4 in the stampede jackpot list
             if self.game.stampede.active == 4:
-                self.game.lamps.rightRampJackpot.schedule(0xF000F000)
-                self.game.lamps.rightRampSavePolly.schedule(0x0F000F00)
-                self.game.lamps.rightRampShootOut.schedule(0x00F000F0)
-                self.game.lamps.rightRampSoundAlarm.schedule(0x000F000F)
+                self.lamps.rightRampJackpot.schedule(0xF000F000)
+                self.lamps.rightRampSavePolly.schedule(0x0F000F00)
+                self.lamps.rightRampShootOut.schedule(0x00F000F0)
+                self.lamps.rightRampSoundAlarm.schedule(0x000F000F)
             # if not active, just turn on the jackpot light only
             else:
-                self.game.lamps.rightRampJackpot.schedule(0xFF00FF00)
+                self.lamps.rightRampJackpot.schedule(0xFF00FF00)
 
         # save polly
         elif mode == "Polly":
             if self.game.bank_robbery.running:
                 if not self.game.bank_robbery.isActive[2]:
                     return
-            self.game.lamps.rightRampSavePolly.schedule(0x0FF00FF0)
-            self.game.lamps.rightRampShootOut.schedule(0x00FF00FF)
-            self.game.lamps.rightRampSoundAlarm.schedule(0xF00FF00F)
+            self.lamps.rightRampSavePolly.schedule(0x0FF00FF0)
+            self.lamps.rightRampShootOut.schedule(0x00FF00FF)
+            self.lamps.rightRampSoundAlarm.schedule(0xF00FF00F)
             # if the multiplier is on, blink the combo
             if self.game.bank_robbery.valueMultiplier > 1 or \
                self.game.river_chase.valueMultiplier > 1 or \
                self.game.save_polly.valueMultiplier > 1:
                 print "LAMP DOES IN FACT SEE THE MULTIPLIER"
-                self.game.lamps.rightRampJackpot.schedule(0xCCCCCCCC)
+                self.lamps.rightRampJackpot.schedule(0xCCCCCCCC)
             else:
                 print "LAMP DOESNT SEE MULTIPLIER"
-                self.game.lamps.rightRampJackpot.enable()
+                self.lamps.rightRampJackpot.enable()
 
 
         elif mode == "Disable":
-            for lamp in self.game.lamps.items_tagged('rightRamp'):
+            for lamp in self.lamps.items_tagged('rightRamp'):
                 lamp.disable()
 
         else:
@@ -955,24 +1082,24 @@ class LampControl(ep.EP_Mode):
 
             if stage == 1:
                 # blink the first light
-                self.game.lamps.rightRampSoundAlarm.schedule(0x0F0F0F0F)
+                self.lamps.rightRampSoundAlarm.schedule(0x0F0F0F0F)
             elif stage == 2:
                 # first light on
-                self.game.lamps.rightRampSoundAlarm.enable()
+                self.lamps.rightRampSoundAlarm.enable()
                 # blink the second
-                self.game.lamps.rightRampShootOut.schedule(0x0F0F0F0F)
+                self.lamps.rightRampShootOut.schedule(0x0F0F0F0F)
             elif stage == 3:
                 # first two on
-                self.game.lamps.rightRampSoundAlarm.enable()
-                self.game.lamps.rightRampShootOut.enable()
+                self.lamps.rightRampSoundAlarm.enable()
+                self.lamps.rightRampShootOut.enable()
                 # blink the third
-                self.game.lamps.rightRampSavePolly.schedule(0x0F0F0F0F)
+                self.lamps.rightRampSavePolly.schedule(0x0F0F0F0F)
             # this is completed - pulse the 3rd light
             elif stage == 5:
                 # three on
-                self.game.lamps.rightRampSoundAlarm.enable()
-                self.game.lamps.rightRampShootOut.enable()
-                self.game.lamps.rightRampSavePolly.enable()
+                self.lamps.rightRampSoundAlarm.enable()
+                self.lamps.rightRampShootOut.enable()
+                self.lamps.rightRampSavePolly.enable()
             else:
                 pass
 
@@ -1059,29 +1186,29 @@ class LampControl(ep.EP_Mode):
 
         elif mode == 'Chase':
             # chase the badge points
-            self.game.lamps.starMotherlode.schedule(0xFFE0FFE0)
-            self.game.lamps.starCombo.schedule(0xFF07FF07)
-            self.game.lamps.starBartBrothers.schedule(0xF83FF83F)
-            self.game.lamps.starShowdown.schedule(0x81FF81FF)
-            self.game.lamps.starStampede.schedule(0x0FFE0FFE)
+            self.lamps.starMotherlode.schedule(0xFFE0FFE0)
+            self.lamps.starCombo.schedule(0xFF07FF07)
+            self.lamps.starBartBrothers.schedule(0xF83FF83F)
+            self.lamps.starShowdown.schedule(0x81FF81FF)
+            self.lamps.starStampede.schedule(0x0FFE0FFE)
 
         elif mode == 'Flash':
             # flash the full badge
-            self.game.lamps.starHighNoon.schedule(0x00FF00FF)
+            self.lamps.starHighNoon.schedule(0x00FF00FF)
             for lamp in range(0,5,1):
                 if self.game.show_tracking('starStatus',lamp) == True:
                     self.starLamps[lamp].schedule(0xFF00FF00)
 
         elif mode == 'On':
             # turn all the bade lights on
-            self.game.lamps.starHighNoon.enable()
+            self.lamps.starHighNoon.enable()
             for lamp in range(0,5,1):
                 self.starLamps[lamp].enable()
         else:
             pass
 
     def disable_badge(self):
-        for lamp in self.game.lamps.items_tagged('Badge'):
+        for lamp in self.lamps.items_tagged('Badge'):
             lamp.disable()
 
 
@@ -1108,15 +1235,15 @@ class LampControl(ep.EP_Mode):
             return
 
         if speed == 0:
-            self.game.lamps.saloonArrow.schedule(0x00FF00FF)
-            self.game.lamps.bountySaloon.schedule(0x00FF00FF)
+            self.lamps.saloonArrow.schedule(0x00FF00FF)
+            self.lamps.bountySaloon.schedule(0x00FF00FF)
         elif speed == 1:
-            self.game.lamps.saloonArrow.schedule(0xF0F0F0F0)
-            self.game.lamps.bountySaloon.schedule(0xF0F0F0F0)
+            self.lamps.saloonArrow.schedule(0xF0F0F0F0)
+            self.lamps.bountySaloon.schedule(0xF0F0F0F0)
 
     def gunfight_flash(self):
-        self.game.lamps.rightGunfightPin.schedule(0x00FF00FF)
-        self.game.lamps.leftGunfightPin.schedule(0x00FF00FF)
+        self.lamps.rightGunfightPin.schedule(0x00FF00FF)
+        self.lamps.leftGunfightPin.schedule(0x00FF00FF)
 
     #  ____            _    ____
     # | __ )  __ _  __| |  / ___|_   _ _   _ ___
@@ -1183,13 +1310,13 @@ class LampControl(ep.EP_Mode):
 
         # bonus lanes
         if self.game.show_tracking('bonusLaneStatus',0) == 'ON':
-            self.game.lamps.leftBonusLane.enable()
+            self.lamps.leftBonusLane.enable()
         if self.game.show_tracking('bonusLaneStatus',1) == 'ON':
-            self.game.lamps.rightBonusLane.enable()
+            self.lamps.rightBonusLane.enable()
 
     def disable_bonus_lanes(self):
-        self.game.lamps.leftBonusLane.disable()
-        self.game.lamps.rightBonusLane.disable()
+        self.lamps.leftBonusLane.disable()
+        self.lamps.rightBonusLane.disable()
 
 
     #
@@ -1197,11 +1324,11 @@ class LampControl(ep.EP_Mode):
     #
 
     def feature_lamps_on(self):
-        for lamp in self.game.lamps:
+        for lamp in self.lamps:
             lamp.enable()
 
     def feature_lamps_off(self):
-        for lamp in self.game.lamps:
+        for lamp in self.lamps:
             if lamp.name == 'startButton':
                 pass
             else:
@@ -26,6 +26,8 @@ class MB_Tribute(ep.EP_Mode):
     def __init__(self,game,priority):
         super(MB_Tribute, self).__init__(game,priority)
         self.myID = "MB Tribute"
+        # animations to preload when the launcher picks this one
+        self.warm_up = ['dmd_mb']
         # for timer halting in saloon/jets
         self.halted = False
         self.running = False
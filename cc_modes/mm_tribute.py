@@ -26,6 +26,8 @@ class MM_Tribute(ep.EP_Mode):
     def __init__(self,game,priority):
         super(MM_Tribute, self).__init__(game,priority)
         self.myID = "MM Tribute"
+        # animations to preload when the launcher picks this one
+        self.warm_up = ['dmd_mm']
         self.halted = False
         self.running = False
         self.hitsToWin = 3
@@ -89,6 +89,8 @@ class RiverChase(ep.EP_Mode):
         anim = self.game.assets.dmd_rowboatLoop
         self.boat = dmd.AnimatedLayer(frames=anim.frames,repeat = True,frame_time = 6)
         self.boat.composite_op = "blacksrc"
+        # new layers, so the chase screen gets built again
+        self.drop_display("Chase")
 
     def ball_drained(self):
         if self.game.trough.num_balls_in_play == 0:
@@ -262,12 +264,6 @@ class RiverChase(ep.EP_Mode):
     def in_progress(self):
         if self.running:
             # and all the text
-            p = self.game.current_player()
-            scoreString = ep.format_score(p.score)
-            scoreLine = dmd.TextLayer(34, 6, self.game.assets.font_5px_bold_AZ, "center", opaque=False).set_text(scoreString,blink_frames=8)
-            timeString = "TIME: " + str(int(self.modeTimer))
-            self.timeLine = dmd.TextLayer(128,26, self.game.assets.font_5px_AZ, "right", opaque=False).set_text(timeString)
-
             # moving the horse
             if self.distance > 0:
                 # change the x_position
@@ -278,11 +274,8 @@ class RiverChase(ep.EP_Mode):
                 print "I SHOULD DO THE BANNER MON"
                 self.hit_banner()
             else:
-                # set the horse layer position
-                self.horse.set_target_position(self.x_pos,0)
-                # stick together the animation and static text with the dynamic text
-                composite = dmd.GroupedLayer(128,32,[self.backdrop,self.horse,self.boat,self.timeLine])
-                self.layer = composite
+                # stick together the animation and static text with the dynamic text - the horse and time follow along on their own
+                self.show_display("Chase", self.build_chase_display)
                 ## tick down the timer
                 self.modeTimer -= 0.1
                 ## hurry quote at 5 seconds, plead at 15
@@ -298,6 +291,17 @@ class RiverChase(ep.EP_Mode):
                     # set up a delay to come back in 1 second with the lowered time
                     self.delay("Mode Timer",delay=0.1,handler=self.in_progress)
 
+    def build_chase_display(self, display):
+        timeLine = self.bound_text(128, 26, self.game.assets.font_5px_AZ, self.time_string, "right")
+        display.bind_position(self.horse, self.horse_position)
+        return [self.backdrop,self.horse,self.boat,timeLine]
+
+    def time_string(self):
+        return "TIME: " + str(int(self.modeTimer))
+
+    def horse_position(self):
+        return (self.x_pos, 0)
+
     def halt(self):
         print "HALTING -- BUMPERS/MINE/SALOON"
         # cancel delays
@@ -61,7 +61,6 @@ class SavePolly(ep.EP_Mode):
             reward = str(ep.format_score(5000000))
         self.awardLine2 = ep.EP_TextLayer(34, 19, self.game.assets.font_5px_AZ, "center", opaque=False).set_text(reward,color=ep.MAGENTA)
         self.awardLine2b= ep.EP_TextLayer(64, 23, self.game.assets.font_7px_az, "center", opaque=False).set_text(reward,color=ep.GREEN)
-        self.scoreLine = ep.EP_TextLayer(34, 6, self.game.assets.font_5px_bold_AZ, "center", opaque=False).set_text("",blink_frames=8)
         # calculate the shot value
         self.shotValue = 250000
         # extra 250k for each ramp done
@@ -272,6 +271,8 @@ class SavePolly(ep.EP_Mode):
             # scripted layer alternating between the info and award lines
             self.infoLayer = dmd.ScriptedLayer(128,32,script)
             self.infoLayer.composite_op = "blacksrc"
+            # new info layer, so the mode screen gets built again
+            self.drop_display("Progress")
 
             # loop back for the title card
             self.delay("Operational",delay=myWait,handler=self.start_save_polly,param=2)
@@ -296,16 +297,8 @@ class SavePolly(ep.EP_Mode):
             # start the train moving
             self.game.train.move()
             # setup the mode screen with the animated train
-            # and all the text
-            p = self.game.current_player()
-            scoreString = ep.format_score(p.score)
-            self.scoreLine.set_text(scoreString,blink_frames=999,color=ep.BROWN)
-            timeString = "TIME: " + str(int(self.modeTimer))
-            timeLine = ep.EP_TextLayer(34, 25, self.game.assets.font_5px_AZ, "center", opaque=False).set_text(timeString,color=ep.DARK_RED)
-
-            # stick together the animation and static text with the dynamic text
-            composite = dmd.GroupedLayer(128,32,[self.trainLayer,self.pollyTitle,self.scoreLine,self.infoLayer,timeLine])
-            self.layer = composite
+            # and all the text - the score and time follow along on their own
+            self.show_display("Progress", self.build_progress_display)
             ## tick down the timer
             self.modeTimer -= 0.1
             ## hurry quote at 5 seconds, plead at 15
@@ -321,6 +314,18 @@ class SavePolly(ep.EP_Mode):
                 # set up a delay to come back in 1 second with the lowered time
                 self.delay("Mode Timer",delay=0.1,handler=self.in_progress)
 
+    def build_progress_display(self, display):
+        scoreLine = self.bound_text(34, 6, self.game.assets.font_5px_bold_AZ, self.score_string, "center", blink_frames=8, color=ep.BROWN)
+        timeLine = self.bound_text(34, 25, self.game.assets.font_5px_AZ, self.time_string, "center", color=ep.DARK_RED)
+        # stick together the animation and static text with the dynamic text
+        return [self.trainLayer,self.pollyTitle,scoreLine,self.infoLayer,timeLine]
+
+    def score_string(self):
+        return ep.format_score(self.game.current_player().score)
+
+    def time_string(self):
+        return "TIME: " + str(int(self.modeTimer))
+
     # for a ramp hit - time and if advanced or not are conditional for side vs center ramps
     def pause_train(self,advanced=False):
         if self.running:
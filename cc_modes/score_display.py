@@ -27,11 +27,15 @@ class ScoreLayer(dmd.GroupedLayer):
         super(ScoreLayer, self).__init__(width, height, mode)
         self.myID = "Score Display"
         self.mode = mode
+        self.cached_frame = None
     def next_frame(self):
         """docstring for next_frame"""
         # Setup for the frame.
-        self.mode.update_layer()
-        return super(ScoreLayer, self).next_frame()
+        changed = self.mode.update_layer()
+        # if nothing changed and nothing's animating, the last frame is still good
+        if changed or self.mode.animated or self.cached_frame == None:
+            self.cached_frame = super(ScoreLayer, self).next_frame()
+        return self.cached_frame
 
 
 class ScoreDisplay(ep.EP_Mode):
@@ -59,6 +63,10 @@ class ScoreDisplay(ep.EP_Mode):
 
     def __init__(self, game, priority, left_players_justify="right"):
         super(ScoreDisplay, self).__init__(game, priority)
+        # the game state the current layers were built for - see layer_signature
+        self.signature = None
+        self.animated = False
+        self.rebuilds = 0
         self.layer = ScoreLayer(128, 32, self)
         self.font_common = self.game.assets.font_07x5
         self.set_left_players_justify(left_players_justify)
@@ -79,6 +87,11 @@ class ScoreDisplay(ep.EP_Mode):
         else:
             raise ValueError, "Justify must be right or left."
         self.score_justs = [left_players_justify, 'right', left_players_justify, 'right']
+        self.invalidate()
+
+    def invalidate(self):
+        """Forces the layers to be rebuilt on the next frame"""
+        self.signature = None
 
     def format_score(self, score):
         """Returns a string representation of the given score value.
@@ -120,16 +133,7 @@ class ScoreDisplay(ep.EP_Mode):
     def justify_for_player(self, player_index):
         return self.score_justs[player_index]
 
-    def update_layer(self):
-        """Called by the layer to update the score layer for the present game state."""
-        self.layer.layers = []
-        if len(self.game.players) <= 1:
-            self.update_layer_1p()
-        else:
-            self.update_layer_4p()
-        # Common: Add the "BALL X ... FREE PLAY" footer.
-        common = dmd.TextLayer(128/2, 32-6, self.font_common, "center")
-
+    def credit_string(self):
         if self.game.tournament:
             credit_str = 'TOURNAMENT'
         elif self.game.party_setting != 'Disabled':
@@ -139,6 +143,34 @@ class ScoreDisplay(ep.EP_Mode):
 
         if self.credit_string_callback:
             credit_str = self.credit_string_callback()
+        return credit_str
+
+    def layer_signature(self, credit_str):
+        """Returns everything the score layers depend on - if it hasn't changed, neither have they."""
+        scores = tuple([player.score for player in self.game.players[:4]])
+        return (scores, self.game.current_player_index, self.game.ball, credit_str, self.game.tournament, self.game.party_setting)
+
+    def update_layer(self):
+        """Called by the layer to update the score layer for the present game state.
+        Returns True if the layers had to be rebuilt."""
+        credit_str = self.credit_string()
+        signature = self.layer_signature(credit_str)
+        if signature == self.signature:
+            return False
+        self.signature = signature
+        self.rebuilds += 1
+
+        self.layer.layers = []
+        if len(self.game.players) <= 1:
+            self.update_layer_1p()
+            # the burn cycle keeps moving, so the frame has to be built every time
+            self.animated = True
+        else:
+            self.update_layer_4p()
+            self.animated = False
+        # Common: Add the "BALL X ... FREE PLAY" footer.
+        common = dmd.TextLayer(128/2, 32-6, self.font_common, "center")
+
         if self.game.ball == 0:
             common.set_text(credit_str)
         elif len(credit_str) > 0:
@@ -146,6 +178,7 @@ class ScoreDisplay(ep.EP_Mode):
         else:
             common.set_text("BALL %d" % (self.game.ball))
         self.layer.layers += [common]
+        return True
 
     def update_layer_1p(self):
         if self.game.current_player() == None:
@@ -26,6 +26,8 @@ class SS_Tribute(ep.EP_Mode):
     def __init__(self,game,priority):
         super(SS_Tribute, self).__init__(game,priority)
         self.myID = "SS Tribute"
+        # animations to preload when the launcher picks this one
+        self.warm_up = ['dmd_ss']
         # for timer halting in saloon/jets
         self.halted = False
         self.running = False
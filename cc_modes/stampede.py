@@ -131,20 +131,20 @@ class Stampede(ep.EP_Mode):
             self.game.trough.launch_balls(total)
 
     def main_display(self):
-        # this is the main score display for stampede - it's got score on it, so we'll have to loop
+        # this is the main score display for stampede - built once, the score line keeps up on its own
+        self.show_display("Main", self.build_main_display)
+
+    def build_main_display(self, display):
         # title line
         titleLine = ep.EP_TextLayer(128/2, 1, self.game.assets.font_5px_AZ, "center", opaque=False).set_text("STAMPEDE MULTIBALL",color=ep.PURPLE)
         # score line
-        p = self.game.current_player()
-        scoreString = ep.format_score(p.score)
-        scoreLine = ep.EP_TextLayer(64, 7, self.game.assets.font_9px_az, "center", opaque=False).set_text(scoreString,color=ep.YELLOW)
+        scoreLine = self.bound_text(64, 7, self.game.assets.font_9px_az, self.score_string, "center", color=ep.YELLOW)
         scoreLine.composite_op = "blacksrc"
         # group with cow layer
-        combined = dmd.GroupedLayer(128,32,[self.cowLayer,titleLine,scoreLine])
-        # set the layer active
-        self.layer = combined
-        # loop back again in .2 for score update
-        self.delay(name="Display",delay=0.2,handler=self.main_display)
+        return [self.cowLayer,titleLine,scoreLine]
+
+    def score_string(self):
+        return ep.format_score(self.game.current_player().score)
 
     # decide if this was a jackpot hit or a miss
     def process_shot(self,number,active):
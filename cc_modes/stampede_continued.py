@@ -65,16 +65,6 @@ class StampedeContinued(ep.EP_Mode):
         self.shortTimer = 6
         self.time = 0
         self.halted = False
-        # set up some display bits
-        # title line
-        self.titleLine = ep.EP_TextLayer(128/2, 1, self.game.assets.font_5px_AZ, "center", opaque=False).set_text("STAMPEDE MULTIBALL",color=ep.PURPLE)
-        # score line
-        p = self.game.current_player()
-        scoreString = ep.format_score(p.score)
-        self.mainScoreLine = ep.EP_TextLayer(64, 7, self.game.assets.font_9px_az, "center", opaque=False).set_text(scoreString,color=ep.YELLOW)
-        self.mainScoreLine.composite_op = "blacksrc"
-        # jackpot info line
-        self.jackpotLine = ep.EP_TextLayer(64,1, self.game.assets.font_5px_AZ, "center", opaque=False)
 
     def ball_drained(self):
     # if we're dropping down to one ball, and stampede is running - do stuff
@@ -184,30 +174,37 @@ class StampedeContinued(ep.EP_Mode):
             self.game.trough.launch_balls(total)
 
     def main_display(self):
-        # this is the main score display for stampede - it's got score on it, so we'll have to loop
+        # this is the main score display for stampede - built once, the score and jackpot lines keep up on their own
+        self.show_display("Main", self.build_main_display)
+
+    def build_main_display(self, display):
         # score line
-        p = self.game.current_player()
-        scoreString = ep.format_score(p.score)
-        self.mainScoreLine.set_text(scoreString,color=ep.YELLOW)
-        # jackpot info line
+        scoreLine = self.bound_text(64, 7, self.game.assets.font_9px_az, self.score_string, "center", color=ep.YELLOW)
+        scoreLine.composite_op = "blacksrc"
+        # jackpot info line - center and one off center
+        jackpotLine = self.bound_text(64, 1, self.game.assets.font_5px_AZ, self.jackpot_string, "center", color=ep.PURPLE)
+        # two off center blinks
+        farJackpotLine = self.bound_text(64, 1, self.game.assets.font_5px_AZ, self.far_jackpot_string, "center", blink_frames=4, color=ep.PURPLE)
+        # group with cow layer
+        return [self.cowLayer,scoreLine,jackpotLine,farJackpotLine]
+
+    def score_string(self):
+        return ep.format_score(self.game.current_player().score)
+
+    def jackpot_string(self):
         # Center shot
         if self.active == 2:
-            string = "JACKPOT = " + ep.format_score(self.centerValue)
-            self.jackpotLine.set_text(string,color=ep.PURPLE)
+            return "JACKPOT = " + ep.format_score(self.centerValue)
         # One off center is 2x
         if self.active == 1 or self.active == 3:
-            string = "JACKPOT = 2 X " + ep.format_score(self.jackpotValue)
-            self.jackpotLine.set_text(string,color=ep.PURPLE)
+            return "JACKPOT = 2 X " + ep.format_score(self.jackpotValue)
+        return None
+
+    def far_jackpot_string(self):
         # two off center is 4x
         if self.active == 0 or self.active == 4:
-            string = "JACKPOT = 4 X " + ep.format_score(self.jackpotValue)
-            self.jackpotLine.set_text(string,color=ep.PURPLE,blink_frames=4)
-        # group with cow layer
-        combined = dmd.GroupedLayer(128,32,[self.cowLayer,self.mainScoreLine,self.jackpotLine])
-        # set the layer active
-        self.layer = combined
-        # loop back again in .2 for score update
-        self.delay(name="Display",delay=0.2,handler=self.main_display)
+            return "JACKPOT = 4 X " + ep.format_score(self.jackpotValue)
+        return None
 
     # decide if this was a jackpot hit or a miss
     def process_shot(self,number,active):
@@ -26,6 +26,8 @@ class TAF_Tribute(ep.EP_Mode):
     def __init__(self,game,priority):
         super(TAF_Tribute, self).__init__(game,priority)
         self.myID = "TAF Tribute"
+        # animations to preload when the launcher picks this one
+        self.warm_up = ['dmd_taf']
         # switch value to raise if it gets hit
         self.bump = 25000
         # for timer halting in saloon/jets
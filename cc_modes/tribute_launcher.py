@@ -140,21 +140,26 @@ class TributeLauncher(ep.EP_Mode):
         # and then do some junk
         if self.index == 0:
             print "Selected Monster Bash"
-            self.game.modes.add(self.game.mb_tribute)
+            tribute = self.game.mb_tribute
         elif self.index == 1:
             print "Selected Addams Family"
-            self.game.modes.add(self.game.taf_tribute)
+            tribute = self.game.taf_tribute
         elif self.index == 2:
             print "Selected Medieval Madness"
-            self.game.modes.add(self.game.mm_tribute)
+            tribute = self.game.mm_tribute
         elif self.index == 3:
             print "Selected Cirqus Voltaire"
-            self.game.modes.add(self.game.cv_tribute)
+            tribute = self.game.cv_tribute
         elif self.index == 4:
             print "Selected Scared Stiff"
-            self.game.modes.add(self.game.ss_tribute)
+            tribute = self.game.ss_tribute
         else:
             print "WAT"
+            tribute = None
+        if tribute:
+            # get the animations loaded before the mode starts asking for them
+            self.game.assets.warm_up(tribute.warm_up)
+            self.game.modes.add(tribute)
         # and then unload -- tribute modes will unload this mode
         #self.delay(delay=4,handler=self.unload)
 
@@ -24,8 +24,19 @@ __all__ = [
     'ep_new_service',
     'ep_pygame_desktop',
     'ep_font',
-    'ep_custom_message'
+    'ep_custom_message',
+    'ep_recorder',
+    'ep_clock',
+    'ep_simulator',
+    'ep_profiler',
+    'ep_saver',
+    'ep_config',
+    'ep_drivers',
+    'ep_sound',
+    'ep_voice'
 ]
+from ep_clock import *
+from ep_profiler import *
 from ep_layers import *
 from ep_transition import *
 from ep_mode import *
@@ -36,6 +47,13 @@ from ep_new_service import *
 from ep_desktop_pygame import *
 from ep_font import *
 from ep_custom_message import *
+from ep_recorder import *
+from ep_simulator import *
+from ep_saver import *
+from ep_config import *
+from ep_drivers import *
+from ep_sound import *
+from ep_voice import *
 
 import locale
 
@@ -0,0 +1,54 @@
+##   ____           _                ____
+##  / ___|__ _  ___| |_ _   _ ___   / ___|__ _ _ __  _   _  ___  _ __
+## | |   / _` |/ __| __| | | / __| | |   / _` | '_ \| | | |/ _ \| '_ \
+## | |__| (_| | (__| |_| |_| \__ \ | |__| (_| | | | | |_| | (_) | | | |
+##  \____\__,_|\___|\__|\__,_|___/  \____\__,_|_| |_|\__, |\___/|_| |_|
+##                                                   |___/
+##           ___ ___  _  _ _____ ___ _  _ _   _ ___ ___
+##          / __/ _ \| \| |_   _|_ _| \| | | | | __|   \
+##         | (_| (_) | .` | | |  | || .` | |_| | _|| |) |
+##          \___\___/|_|\_| |_| |___|_|\_|\___/|___|___/
+##
+## A P-ROC Project by Eric Priepke, Copyright 2012-2013
+## Built on the PyProcGame Framework from Adam Preble and Gerry Stellenberg
+## Original Cactus Canyon software by Matt Coriale
+##
+##
+## The game clock - delays, lampshows, text blinking and quote timing all ask this for the time,
+## so the headless simulator can swap in a virtual clock and run games faster than real time
+##
+
+import time
+
+__all__ = ['EP_Clock', 'EP_VirtualClock', 'now', 'set_clock', 'get_clock']
+
+class EP_Clock(object):
+    """The wall clock - what the game runs on normally"""
+    def time(self):
+        return time.time()
+
+class EP_VirtualClock(EP_Clock):
+    """A clock that only moves when it's told to"""
+    def __init__(self, start=None):
+        if start == None:
+            start = time.time()
+        self.now = start
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+clock = EP_Clock()
+
+def now():
+    """Returns the current game time - use this instead of time.time() for anything game timing related"""
+    return clock.time()
+
+def set_clock(new_clock):
+    global clock
+    clock = new_clock
+
+def get_clock():
+    return clock
@@ -0,0 +1,95 @@
+##   ____           _                ____
+##  / ___|__ _  ___| |_ _   _ ___   / ___|__ _ _ __  _   _  ___  _ __
+## | |   / _` |/ __| __| | | / __| | |   / _` | '_ \| | | |/ _ \| '_ \
+## | |__| (_| | (__| |_| |_| \__ \ | |__| (_| | | | | |_| | (_) | | | |
+##  \____\__,_|\___|\__|\__,_|___/  \____\__,_|_| |_|\__, |\___/|_| |_|
+##                                                   |___/
+##           ___ ___  _  _ _____ ___ _  _ _   _ ___ ___
+##          / __/ _ \| \| |_   _|_ _| \| | | | | __|   \
+##         | (_| (_) | .` | | |  | || .` | |_| | _|| |) |
+##          \___\___/|_|\_| |_| |___|_|\_|\___/|___|___/
+##
+## A P-ROC Project by Eric Priepke, Copyright 2012-2013
+## Built on the PyProcGame Framework from Adam Preble and Gerry Stellenberg
+## Original Cactus Canyon software by Matt Coriale
+##
+##
+## Config loading helpers - yaml through LibYAML when it's there, and snapshots of
+## already parsed and merged config that get reused until the source files change
+##
+
+import os
+import yaml
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+__all__ = ['FastLoader', 'load_yaml', 'load_snapshot', 'save_snapshot', 'load_yaml_cached']
+
+curr_file_path = os.path.dirname(os.path.abspath( __file__ ))
+SNAPSHOT_PATH = curr_file_path + "/../cache/config/"
+SNAPSHOT_VERSION = 1
+
+# the C loader is a lot quicker on the pi - fall back to the python one if libyaml isn't around
+try:
+    FastLoader = yaml.CLoader
+except AttributeError:
+    print "LibYAML not found, using the python yaml loader"
+    FastLoader = yaml.Loader
+
+def load_yaml(filename):
+    """Parses a yaml file with the fastest loader available"""
+    stream = open(filename, 'r')
+    try:
+        return yaml.load(stream, Loader=FastLoader)
+    finally:
+        stream.close()
+
+def file_stamps(sources):
+    # mtime and size of each source, None for ones that aren't there
+    stamps = []
+    for source in sources:
+        try:
+            stat = os.stat(source)
+            stamps.append((source, stat.st_mtime, stat.st_size))
+        except OSError:
+            stamps.append((source, None, None))
+    return stamps
+
+def load_snapshot(name, sources):
+    """Returns the value saved under name, if none of the source files have changed since - otherwise None"""
+    filename = SNAPSHOT_PATH + name + ".snapshot"
+    if not os.path.isfile(filename):
+        return None
+    try:
+        stream = open(filename, 'rb')
+        version, stamps, value = pickle.load(stream)
+        stream.close()
+    except Exception:
+        return None
+    if version != SNAPSHOT_VERSION or stamps != file_stamps(sources):
+        return None
+    return value
+
+def save_snapshot(name, sources, value):
+    """Saves value under name, good until one of the source files changes"""
+    try:
+        if not os.path.isdir(SNAPSHOT_PATH):
+            os.makedirs(SNAPSHOT_PATH)
+        filename = SNAPSHOT_PATH + name + ".snapshot"
+        stream = open(filename + ".tmp", 'wb')
+        pickle.dump((SNAPSHOT_VERSION, file_stamps(sources), value), stream, pickle.HIGHEST_PROTOCOL)
+        stream.close()
+        os.rename(filename + ".tmp", filename)
+    except (IOError, OSError, pickle.PicklingError):
+        print "Couldn't save config snapshot " + name
+
+def load_yaml_cached(filename):
+    """Parses a yaml file, or reads back the snapshot from the last time it was parsed"""
+    name = os.path.basename(filename)
+    value = load_snapshot(name, [filename])
+    if value == None:
+        value = load_yaml(filename)
+        save_snapshot(name, [filename], value)
+    return value
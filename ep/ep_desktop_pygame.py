@@ -21,6 +21,13 @@ except ImportError:
     print "Error importing pygame; ignoring."
     pygame = None
 
+try:
+    import numpy
+    import pygame.surfarray
+except ImportError:
+    print "Error importing numpy; color desktop will use the per-dot renderer."
+    numpy = None
+
 if hasattr(ctypes.pythonapi, 'Py_InitModule4'):
    Py_ssize_t = ctypes.c_int
 elif hasattr(ctypes.pythonapi, 'Py_InitModule4_64'):
@@ -44,6 +51,14 @@ def array(surface):
    bytes.object = buffer_interface
    return bytes
 
+curr_file_path = os.path.dirname(os.path.abspath( __file__ ))
+# where the packed dot atlases get saved
+CACHE_PATH = curr_file_path + "/../cache/"
+
+# dot image names for colors 1 - 15, in color index order
+DOT_COLOR_NAMES = ['Grey','DarkGrey','DarkGreen','Flesh','Purple','DarkRed','Brown','DarkBrown',
+                   'Red','Green','Yellow','Blue','Orange','Cyan','Magenta']
+
 
 class EP_Desktop():
     """The :class:`Desktop` class helps manage interaction with the desktop, providing both a windowed
@@ -59,6 +74,20 @@ class EP_Desktop():
         self.ctrl = 0
         self.i = 0
         self.HD = False
+        # vectorized renderer - turned on in load_images if numpy is around and the output checks out
+        self.vectorized = False
+        self.dot_lookup = None
+        self.dot_tiles = None
+        self.tile_array = None
+        # packed dot images, and what they were built from
+        self.atlas = None
+        self.atlas_key = None
+        self.banners_path = None
+        # dirty region tracking - the last frame that actually made it to the window
+        self.last_frame = None
+        # past this many changed dots, just repaint the whole thing
+        self.full_repaint_dots = 2048
+        self.reset_counters()
 
         self.add_key_map(pygame.locals.K_LSHIFT, 3)
         self.add_key_map(pygame.locals.K_RSHIFT, 1)
@@ -88,216 +117,142 @@ class EP_Desktop():
             print 'Desktop init skipping setup_window(); pygame does not appear to be loaded.'
 
     def load_images(self,dots_path,images_path):
-        ## dot images
-        #dot_black = pygame.image.load(dots_path+ 'DotBlack.png')
-        dot_dark_grey_low = pygame.image.load(dots_path+ 'DotDarkGreyLow.png')
-        dot_dark_grey_low = pygame.transform.scale(dot_dark_grey_low, (self.pixel_size,self.pixel_size))
-        dot_dark_grey_low.convert()
-        dot_dark_grey_mid = pygame.image.load(dots_path+ 'DotDarkGreyMid.png')
-        dot_dark_grey_mid = pygame.transform.scale(dot_dark_grey_mid, (self.pixel_size,self.pixel_size))
-        dot_dark_grey_mid.convert()
-        dot_dark_grey = pygame.image.load(dots_path+ 'DotDarkGrey.png')
-        dot_dark_grey = pygame.transform.scale(dot_dark_grey, (self.pixel_size,self.pixel_size))
-        dot_dark_grey.convert()
-        dot_dark_red_low = pygame.image.load(dots_path+ 'DotDarkRedLow.png')
-        dot_dark_red_low = pygame.transform.scale(dot_dark_red_low, (self.pixel_size,self.pixel_size))
-        dot_dark_red_low.convert()
-        dot_dark_red_mid = pygame.image.load(dots_path+ 'DotDarkRedMid.png')
-        dot_dark_red_mid = pygame.transform.scale(dot_dark_red_mid, (self.pixel_size,self.pixel_size))
-        dot_dark_red_mid.convert()
-        dot_dark_red = pygame.image.load(dots_path+ 'DotDarkRed.png')
-        dot_dark_red = pygame.transform.scale(dot_dark_red, (self.pixel_size,self.pixel_size))
-        dot_dark_red.convert()
-        dot_grey_low = pygame.image.load(dots_path+ 'DotGreyLow.png')
-        dot_grey_low = pygame.transform.scale(dot_grey_low, (self.pixel_size,self.pixel_size))
-        dot_grey_low.convert()
-        dot_grey_mid = pygame.image.load(dots_path+ 'DotGreyMid.png')
-        dot_grey_mid = pygame.transform.scale(dot_grey_mid, (self.pixel_size,self.pixel_size))
-        dot_grey_mid.convert()
-        dot_grey = pygame.image.load(dots_path+ 'DotGrey.png')
-        dot_grey = pygame.transform.scale(dot_grey, (self.pixel_size,self.pixel_size))
-        dot_grey.convert()
-        dot_dark_brown_low = pygame.image.load(dots_path+ 'DotDarkBrownLow.png')
-        dot_dark_brown_low = pygame.transform.scale(dot_dark_brown_low, (self.pixel_size,self.pixel_size))
-        dot_dark_brown_low.convert()
-        dot_dark_brown_mid = pygame.image.load(dots_path+ 'DotDarkBrownMid.png')
-        dot_dark_brown_mid = pygame.transform.scale(dot_dark_brown_mid, (self.pixel_size,self.pixel_size))
-        dot_dark_brown_mid.convert()
-        dot_dark_brown = pygame.image.load(dots_path+ 'DotDarkBrown.png')
-        dot_dark_brown = pygame.transform.scale(dot_dark_brown, (self.pixel_size,self.pixel_size))
-        dot_dark_brown.convert()
-        dot_brown_low = pygame.image.load(dots_path+ 'DotBrownLow.png')
-        dot_brown_low = pygame.transform.scale(dot_brown_low, (self.pixel_size,self.pixel_size))
-        dot_brown_low.convert()
-        dot_brown_mid = pygame.image.load(dots_path+ 'DotBrownMid.png')
-        dot_brown_mid = pygame.transform.scale(dot_brown_mid, (self.pixel_size,self.pixel_size))
-        dot_brown_mid.convert()
-        dot_brown = pygame.image.load(dots_path+ 'DotBrown.png')
-        dot_brown = pygame.transform.scale(dot_brown, (self.pixel_size,self.pixel_size))
-        dot_brown.convert()
-        dot_red_low = pygame.image.load(dots_path+ 'DotRedLow.png')
-        dot_red_low = pygame.transform.scale(dot_red_low, (self.pixel_size,self.pixel_size))
-        dot_red_low.convert()
-        dot_red_mid = pygame.image.load(dots_path+ 'DotRedMid.png')
-        dot_red_mid = pygame.transform.scale(dot_red_mid, (self.pixel_size,self.pixel_size))
-        dot_red_mid.convert()
-        dot_red = pygame.image.load(dots_path+ 'DotRed.png')
-        dot_red = pygame.transform.scale(dot_red, (self.pixel_size,self.pixel_size))
-        dot_red.convert()
-        dot_dark_green_low = pygame.image.load(dots_path+ 'DotDarkGreenLow.png')
-        dot_dark_green_low = pygame.transform.scale(dot_dark_green_low, (self.pixel_size,self.pixel_size))
-        dot_dark_green_low.convert()
-        dot_dark_green_mid = pygame.image.load(dots_path+ 'DotDarkGreenMid.png')
-        dot_dark_green_mid = pygame.transform.scale(dot_dark_green_mid, (self.pixel_size,self.pixel_size))
-        dot_dark_green_mid.convert()
-        dot_dark_green = pygame.image.load(dots_path+ 'DotDarkGreen.png')
-        dot_dark_green = pygame.transform.scale(dot_dark_green, (self.pixel_size,self.pixel_size))
-        dot_dark_green.convert()
-        dot_flesh_low = pygame.image.load(dots_path+ 'DotFleshLow.png')
-        dot_flesh_low = pygame.transform.scale(dot_flesh_low, (self.pixel_size,self.pixel_size))
-        dot_flesh_low.convert()
-        dot_flesh_mid = pygame.image.load(dots_path+ 'DotFleshMid.png')
-        dot_flesh_mid = pygame.transform.scale(dot_flesh_mid, (self.pixel_size,self.pixel_size))
-        dot_flesh_mid.convert()
-        dot_flesh = pygame.image.load(dots_path+ 'DotFlesh.png')
-        dot_flesh = pygame.transform.scale(dot_flesh, (self.pixel_size,self.pixel_size))
-        dot_flesh.convert()
-        dot_purple_low = pygame.image.load(dots_path+ 'DotPurpleLow.png')
-        dot_purple_low = pygame.transform.scale(dot_purple_low, (self.pixel_size,self.pixel_size))
-        dot_purple_low.convert()
-        dot_purple_mid = pygame.image.load(dots_path+ 'DotPurpleMid.png')
-        dot_purple_mid = pygame.transform.scale(dot_purple_mid, (self.pixel_size,self.pixel_size))
-        dot_purple_mid.convert()
-        dot_purple = pygame.image.load(dots_path+ 'DotPurple.png')
-        dot_purple = pygame.transform.scale(dot_purple, (self.pixel_size,self.pixel_size))
-        dot_purple.convert()
-        dot_green_low = pygame.image.load(dots_path+ 'DotGreenLow.png')
-        dot_green_low = pygame.transform.scale(dot_green_low, (self.pixel_size,self.pixel_size))
-        dot_green_low.convert()
-        dot_green_mid = pygame.image.load(dots_path+ 'DotGreenMid.png')
-        dot_green_mid = pygame.transform.scale(dot_green_mid, (self.pixel_size,self.pixel_size))
-        dot_green_mid.convert()
-        dot_green = pygame.image.load(dots_path+ 'DotGreen.png')
-        dot_green = pygame.transform.scale(dot_green, (self.pixel_size,self.pixel_size))
-        dot_green.convert()
-        dot_yellow_low = pygame.image.load(dots_path+ 'DotYellowLow.png')
-        dot_yellow_low = pygame.transform.scale(dot_yellow_low, (self.pixel_size,self.pixel_size))
-        dot_yellow_low.convert()
-        dot_yellow_mid = pygame.image.load(dots_path+ 'DotYellowMid.png')
-        dot_yellow_mid = pygame.transform.scale(dot_yellow_mid, (self.pixel_size,self.pixel_size))
-        dot_yellow_mid.convert()
-        dot_yellow = pygame.image.load(dots_path+ 'DotYellow.png')
-        dot_yellow = pygame.transform.scale(dot_yellow, (self.pixel_size,self.pixel_size))
-        dot_yellow.convert()
-        dot_blue_low = pygame.image.load(dots_path+ 'DotBlueLow.png')
-        dot_blue_low = pygame.transform.scale(dot_blue_low, (self.pixel_size,self.pixel_size))
-        dot_blue_low.convert()
-        dot_blue_mid = pygame.image.load(dots_path+ 'DotBlueMid.png')
-        dot_blue_mid = pygame.transform.scale(dot_blue_mid, (self.pixel_size,self.pixel_size))
-        dot_blue_mid.convert()
-        dot_blue = pygame.image.load(dots_path+ 'DotBlue.png')
-        dot_blue = pygame.transform.scale(dot_blue, (self.pixel_size,self.pixel_size))
-        dot_blue.convert()
-        dot_orange_low = pygame.image.load(dots_path+ 'DotOrangeLow.png')
-        dot_orange_low = pygame.transform.scale(dot_orange_low, (self.pixel_size,self.pixel_size))
-        dot_orange_low.convert()
-        dot_orange_mid = pygame.image.load(dots_path+ 'DotOrangeMid.png')
-        dot_orange_mid = pygame.transform.scale(dot_orange_mid, (self.pixel_size,self.pixel_size))
-        dot_orange_mid.convert()
-        dot_orange = pygame.image.load(dots_path+ 'DotOrange.png')
-        dot_orange = pygame.transform.scale(dot_orange, (self.pixel_size,self.pixel_size))
-        dot_orange.convert()
-        dot_cyan_low = pygame.image.load(dots_path+ 'DotCyanLow.png')
-        dot_cyan_low = pygame.transform.scale(dot_cyan_low, (self.pixel_size,self.pixel_size))
-        dot_cyan_low.convert()
-        dot_cyan_mid = pygame.image.load(dots_path+ 'DotCyanMid.png')
-        dot_cyan_mid = pygame.transform.scale(dot_cyan_mid, (self.pixel_size,self.pixel_size))
-        dot_cyan_mid.convert()
-        dot_cyan = pygame.image.load(dots_path+ 'DotCyan.png')
-        dot_cyan = pygame.transform.scale(dot_cyan, (self.pixel_size,self.pixel_size))
-        dot_cyan.convert()
-        dot_white_255 = pygame.image.load(dots_path+ 'DotWhite255.png')
-        dot_white_255 = pygame.transform.scale(dot_white_255, (self.pixel_size,self.pixel_size))
-        dot_white_255.convert()
-        dot_white_238 = pygame.image.load(dots_path+ 'DotWhite238.png')
-        dot_white_238 = pygame.transform.scale(dot_white_238, (self.pixel_size,self.pixel_size))
-        dot_white_238.convert()
-        dot_white_221 = pygame.image.load(dots_path+ 'DotWhite221.png')
-        dot_white_221 = pygame.transform.scale(dot_white_221, (self.pixel_size,self.pixel_size))
-        dot_white_221.convert()
-        dot_white_204 = pygame.image.load(dots_path+ 'DotWhite204.png')
-        dot_white_204 = pygame.transform.scale(dot_white_204, (self.pixel_size,self.pixel_size))
-        dot_white_204.convert()
-        dot_white_187 = pygame.image.load(dots_path+ 'DotWhite187.png')
-        dot_white_187 = pygame.transform.scale(dot_white_187, (self.pixel_size,self.pixel_size))
-        dot_white_187.convert()
-        dot_white_170 = pygame.image.load(dots_path+ 'DotWhite170.png')
-        dot_white_170 = pygame.transform.scale(dot_white_170, (self.pixel_size,self.pixel_size))
-        dot_white_170.convert()
-        dot_white_153 = pygame.image.load(dots_path+ 'DotWhite153.png')
-        dot_white_153 = pygame.transform.scale(dot_white_153, (self.pixel_size,self.pixel_size))
-        dot_white_153.convert()
-        dot_white_136 = pygame.image.load(dots_path+ 'DotWhite136.png')
-        dot_white_136 = pygame.transform.scale(dot_white_136, (self.pixel_size,self.pixel_size))
-        dot_white_136.convert()
-        dot_white_119 = pygame.image.load(dots_path+ 'DotWhite119.png')
-        dot_white_119 = pygame.transform.scale(dot_white_119, (self.pixel_size,self.pixel_size))
-        dot_white_119.convert()
-        dot_white_102 = pygame.image.load(dots_path+ 'DotWhite102.png')
-        dot_white_102 = pygame.transform.scale(dot_white_102, (self.pixel_size,self.pixel_size))
-        dot_white_102.convert()
-        dot_white_085 = pygame.image.load(dots_path+ 'DotWhite085.png')
-        dot_white_085 = pygame.transform.scale(dot_white_085, (self.pixel_size,self.pixel_size))
-        dot_white_085.convert()
-        dot_white_068 = pygame.image.load(dots_path+ 'DotWhite068.png')
-        dot_white_068 = pygame.transform.scale(dot_white_068, (self.pixel_size,self.pixel_size))
-        dot_white_068.convert()
-        dot_white_051 = pygame.image.load(dots_path+ 'DotWhite051.png')
-        dot_white_051 = pygame.transform.scale(dot_white_051, (self.pixel_size,self.pixel_size))
-        dot_white_051.convert()
-        dot_white_034 = pygame.image.load(dots_path+ 'DotWhite034.png')
-        dot_white_034 = pygame.transform.scale(dot_white_034, (self.pixel_size,self.pixel_size))
-        dot_white_034.convert()
-        dot_magenta_low = pygame.image.load(dots_path+ 'DotMagentaLow.png')
-        dot_magenta_low = pygame.transform.scale(dot_magenta_low, (self.pixel_size,self.pixel_size))
-        dot_magenta_low.convert()
-        dot_magenta_mid = pygame.image.load(dots_path+ 'DotMagentaMid.png')
-        dot_magenta_mid = pygame.transform.scale(dot_magenta_mid, (self.pixel_size,self.pixel_size))
-        dot_magenta_mid.convert()
-        dot_magenta = pygame.image.load(dots_path+ 'DotMagenta.png')
-        dot_magenta = pygame.transform.scale(dot_magenta, (self.pixel_size,self.pixel_size))
-        dot_magenta.convert()
-
-        image_kapow = pygame.image.load(images_path+'kapow.jpg').convert()
-        image_boom = pygame.image.load(images_path+'boom.jpg').convert()
-        image_powie = pygame.image.load(images_path+'powie.jpg').convert()
-        image_bang = pygame.image.load(images_path+'bang.jpg').convert()
-        image_zap = pygame.image.load(images_path+'zap.jpg').convert()
-        image_doho = pygame.image.load(images_path+'doho.jpg').convert()
-        image_kapooya = pygame.image.load(images_path+'kapooya.jpg').convert()
-        image_jacob = pygame.image.load(images_path+'jacob.jpg').convert()
-
-        self.mm_banners = [image_kapow, image_boom, image_powie, image_bang, image_zap, image_doho, "GIMMICK"]
-        self.mm_gimmick = [image_kapooya, image_jacob]
-
-        self.colors = [[None,None,None,None], # blank
-                       [None,dot_grey_low,dot_grey_mid,dot_grey], # color 1 grey
-                       [None,dot_dark_grey_low,dot_dark_grey_mid,dot_dark_grey], # color 2 dark grey
-                       [None,dot_dark_green_low,dot_dark_green_mid,dot_dark_green], # color 3 dark green
-                       [None,dot_flesh_low,dot_flesh_mid,dot_flesh], # color 4 flesh tone
-                       [None,dot_purple_low,dot_purple_mid,dot_purple], # color 5 purple
-                       [None,dot_dark_red_low,dot_dark_red_mid,dot_dark_red], # color 6 dark red
-                       [None,dot_brown_low,dot_brown_mid,dot_brown], # color 7 - Brown
-                       [None,dot_dark_brown_low,dot_dark_brown_mid,dot_dark_brown], # color 8 dark brown
-                       [None,dot_red_low,dot_red_mid,dot_red], # color 9 - Red
-                       [None,dot_green_low,dot_green_mid,dot_green], # color 10 - Green
-                       [None,dot_yellow_low,dot_yellow_mid,dot_yellow], # color 11 - Yellow
-                       [None,dot_blue_low,dot_blue_mid,dot_blue], # color 12 blue
-                       [None,dot_orange_low,dot_orange_mid,dot_orange], # color 13 orange
-                       [None,dot_cyan_low,dot_cyan_mid,dot_cyan], # color 14 - cyan
-                       [None,dot_magenta_low,dot_magenta_mid,dot_magenta], # color 15 - magenta
-                       #[None,dot_white_low,dot_white_mid,dot_white]] # default color - white
-                       [None,None,dot_white_034,dot_white_051,dot_white_068,dot_white_085,dot_white_102,dot_white_119,dot_white_136,dot_white_153,dot_white_170,dot_white_187,dot_white_204,dot_white_221,dot_white_238,dot_white_255]]
+        # the dots only need building once per style and size - resets can skip it
+        if self.atlas_key != (dots_path,self.pixel_size):
+            self.load_dot_atlas(dots_path)
+            self.atlas_key = (dots_path,self.pixel_size)
+            # build the lookup tables for the renderers
+            self.build_dot_lookup()
+            self.setup_vectorized()
+        else:
+            self.invalidate()
+
+        # the moonlight banners only need loading once too
+        if self.banners_path != images_path:
+            image_kapow = pygame.image.load(images_path+'kapow.jpg').convert()
+            image_boom = pygame.image.load(images_path+'boom.jpg').convert()
+            image_powie = pygame.image.load(images_path+'powie.jpg').convert()
+            image_bang = pygame.image.load(images_path+'bang.jpg').convert()
+            image_zap = pygame.image.load(images_path+'zap.jpg').convert()
+            image_doho = pygame.image.load(images_path+'doho.jpg').convert()
+            image_kapooya = pygame.image.load(images_path+'kapooya.jpg').convert()
+            image_jacob = pygame.image.load(images_path+'jacob.jpg').convert()
+
+            self.mm_banners = [image_kapow, image_boom, image_powie, image_bang, image_zap, image_doho, "GIMMICK"]
+            self.mm_gimmick = [image_kapooya, image_jacob]
+            self.banners_path = images_path
+
+    def dot_files(self):
+        """Returns the dot image names laid out like self.colors - [color][brightness]"""
+        colors = [[None,None,None,None]] # blank
+        # colors 1 - 15, low, mid and full brightness
+        for name in DOT_COLOR_NAMES:
+            colors.append([None,'Dot' + name + 'Low.png','Dot' + name + 'Mid.png','Dot' + name + '.png'])
+        # default color - white, with 14 levels of brightness
+        colors.append([None,None] + ['DotWhite%03d.png' % level for level in range(34,256,17)])
+        return colors
+
+    def load_dot_atlas(self,dots_path):
+        """Loads all the dot images as one packed, display format surface - from the cache if it's there"""
+        files = self.dot_files()
+        names = []
+        for row in files:
+            for name in row:
+                if name:
+                    names.append(name)
+        size = self.pixel_size
+        style = os.path.basename(os.path.normpath(dots_path))
+        cache_file = os.path.join(CACHE_PATH, 'atlas_%s_%d.png' % (style,size))
+        atlas = None
+        if os.path.exists(cache_file):
+            newest = max(os.path.getmtime(dots_path + name) for name in names)
+            if os.path.getmtime(cache_file) >= newest:
+                atlas = pygame.image.load(cache_file).convert()
+                # make sure the cache matches what we're expecting
+                if atlas.get_size() != ((len(names) + 1) * size, size):
+                    atlas = None
+        if atlas == None:
+            print "Building dot atlas " + str(style) + " at " + str(size)
+            # slot 0 is a blank dot, the rest are each dot image composited onto black
+            atlas = pygame.Surface(((len(names) + 1) * size, size)).convert()
+            atlas.fill((0,0,0))
+            for index in range(len(names)):
+                image = pygame.image.load(dots_path + names[index])
+                image = pygame.transform.scale(image, (size,size))
+                atlas.blit(image,((index + 1) * size,0))
+            try:
+                if not os.path.exists(CACHE_PATH):
+                    os.makedirs(CACHE_PATH)
+                pygame.image.save(atlas,cache_file)
+            except (IOError, OSError, pygame.error), e:
+                print "Could not save dot atlas: " + str(e)
+        self.atlas = atlas
+        # colors holds the atlas slot for each color and brightness
+        slots = {}
+        for index in range(len(names)):
+            slots[names[index]] = index + 1
+        self.colors = []
+        for row in files:
+            self.colors.append([slots.get(name) for name in row])
+
+    def dot_for_value(self,dot_value):
+        """Returns the (color, brightness) index into self.colors for a raw dot value - None for a blank dot"""
+        if dot_value == 0:
+            return None
+        brightness = (dot_value&0xf)
+        # if we have a brightness but no color - use white
+        if brightness and (dot_value >> 4) == 0:
+            return (16,brightness)
+        # otherwise, find the color and set the brightness
+        if brightness <= 3:
+            bright_value = 0
+        elif brightness <= 8:
+            bright_value = 1
+        elif brightness <= 13:
+            bright_value = 2
+        else:
+            bright_value = 3
+        return ((dot_value >> 4),bright_value)
+
+    def build_dot_lookup(self):
+        """Maps all 256 possible dot values to an atlas slot, and each slot to its rect - slot 0 is blank"""
+        size = self.pixel_size
+        slots = self.atlas.get_width() / size
+        self.dot_tiles = [None]
+        for slot in range(1,slots):
+            self.dot_tiles.append(pygame.Rect(slot * size,0,size,size))
+        self.dot_lookup = []
+        for dot_value in range(256):
+            spot = self.dot_for_value(dot_value)
+            slot = None
+            if spot:
+                slot = self.colors[spot[0]][spot[1]]
+            if slot == None:
+                self.dot_lookup.append(0)
+            else:
+                self.dot_lookup.append(slot)
+
+    def setup_vectorized(self):
+        """Builds the tile array used by the vectorized renderer and checks it against the per-dot renderer"""
+        self.vectorized = False
+        self.invalidate()
+        if numpy == None or self.screen == None:
+            print "Color desktop using per-dot renderer"
+            return
+        size = self.pixel_size
+        # the atlas is already composited onto black, so it splits right into tiles
+        atlas = pygame.surfarray.array3d(self.atlas)
+        self.tile_array = atlas.reshape(atlas.shape[0] / size,size,size,3)
+        self.lookup_array = numpy.array(self.dot_lookup,dtype=numpy.intp)
+        # run a test frame with every dot value through both renderers - only go vector if they match
+        test_data = ''.join(chr(value % 256) for value in range(128*32))
+        if self.renderers_match(test_data):
+            print "Color desktop using vectorized renderer"
+            self.vectorized = True
+        else:
+            print "Vectorized renderer output mismatch - using per-dot renderer"
+        self.screen.fill((0,0,0))
+        self.invalidate()
 
 
     def add_key_map(self, key, switch_number):
@@ -361,75 +316,162 @@ class EP_Desktop():
         # Use adjustment to add a one pixel border around each dot, if
         # the screen size is large enough to accomodate it.
         if not self.HD:
-
             frame_string = frame.get_data()
-
-            x = 0
-            y = 0
-            # fill the screen black
-            self.screen.fill((0,0,0))
-
-            for dot in frame_string:
-                dot_value = ord(dot)
-                image = None
-                # if we got something other than 0
-                if dot_value != 0:
-                    # set the brightness and color
-                    brightness = (dot_value&0xf)
-                    # if we have a brightness but no color - use white
-                    if brightness and (dot_value >>4) == 0:
-                        color = 16
-                        bright_value = brightness
-                        del brightness
-                    # otherwise, find the color and set the brightness
+            # nothing changed - nothing to do
+            if frame_string == self.last_frame:
+                self.frames_skipped += 1
+                return
+            runs = None
+            if self.last_frame != None:
+                runs = self.changed_runs(frame_string)
+                changed = 0
+                for run in runs:
+                    changed += run[2] - run[1]
+                if changed > self.full_repaint_dots:
+                    runs = None
+            # full repaint
+            if runs == None:
+                if self.vectorized:
+                    self.draw_vectorized(frame_string)
+                else:
+                    self.draw_per_dot(frame_string)
+                self.dots_repainted += 128*32
+                pygame.display.update()
+            # otherwise just the runs that changed
+            else:
+                rects = []
+                for y, x_start, x_end in runs:
+                    if self.vectorized:
+                        rect = self.draw_run_vectorized(frame_string, y, x_start, x_end)
                     else:
-                        if brightness <= 3:
-                            bright_value = 0
-                            del brightness
-                        elif brightness <= 8:
-                            bright_value = 1
-                            del brightness
-                        elif brightness <= 13:
-                            bright_value = 2
-                            del brightness
-                        else:
-                            bright_value = 3
-                            del brightness
-                        color = (dot_value >> 4)
-
-                    #print "Dot Value: " + str(derp) +" - color: " + str(color) + " - Brightness: " +str(brightness)
-                    # set the image based on color and brightness
-                    ##image = self.colors[color][bright_value]
-                    if self.colors[color][bright_value]:
-                        self.screen.blit(self.colors[color][bright_value],((x*self.pixel_size), (y*self.pixel_size)))
-                    del color
-                    del bright_value
-                del dot
-                del dot_value
-
-                #if image:
-                #    self.screen.blit(image, ((x*self.pixel_size), (y*self.pixel_size)))
-                x += 1
-                if x == 128:
-                    x = 0
-                    y += 1
-                #del image
-
-            del x
-            del y
-            del frame_string
-
-            pygame.display.update()
+                        rect = self.draw_run_per_dot(frame_string, y, x_start, x_end)
+                    rects.append(rect)
+                    self.dots_repainted += x_end - x_start
+                pygame.display.update(rects)
+            self.frames_drawn += 1
+            self.last_frame = frame_string
+
+    def changed_runs(self,frame_string):
+        """Compares the frame to the last one drawn and returns a list of (y, x start, x end) runs of changed dots"""
+        runs = []
+        if numpy != None:
+            new = numpy.frombuffer(frame_string,dtype=numpy.uint8).reshape(32,128)
+            old = numpy.frombuffer(self.last_frame,dtype=numpy.uint8).reshape(32,128)
+            diff = numpy.zeros((32,130),dtype=numpy.int8)
+            diff[:,1:129] = (new != old)
+            edges = numpy.diff(diff,axis=1)
+            for y in numpy.nonzero(diff.any(axis=1))[0]:
+                starts = numpy.nonzero(edges[y] == 1)[0]
+                ends = numpy.nonzero(edges[y] == -1)[0]
+                for x_start, x_end in zip(starts,ends):
+                    runs.append((int(y),int(x_start),int(x_end)))
+        else:
+            for y in range(32):
+                row = y * 128
+                if frame_string[row:row+128] == self.last_frame[row:row+128]:
+                    continue
+                x_start = None
+                for x in range(128):
+                    if frame_string[row+x] != self.last_frame[row+x]:
+                        if x_start == None:
+                            x_start = x
+                    elif x_start != None:
+                        runs.append((y,x_start,x))
+                        x_start = None
+                if x_start != None:
+                    runs.append((y,x_start,128))
+        return runs
+
+    def run_rect(self,y,x_start,x_end):
+        return pygame.Rect(x_start*self.pixel_size,y*self.pixel_size,(x_end-x_start)*self.pixel_size,self.pixel_size)
+
+    def draw_run_vectorized(self,frame_string,y,x_start,x_end):
+        """Repaints one run of changed dots on a row with array ops"""
+        rect = self.run_rect(y,x_start,x_end)
+        row = y * 128
+        values = numpy.frombuffer(frame_string[row+x_start:row+x_end],dtype=numpy.uint8)
+        # (x, tile x, tile y, rgb) -> run strip
+        tiles = self.tile_array[self.lookup_array[values]]
+        pixels = tiles.reshape((x_end-x_start)*self.pixel_size,self.pixel_size,3)
+        pygame.surfarray.blit_array(self.screen.subsurface(rect),pixels)
+        return rect
+
+    def draw_run_per_dot(self,frame_string,y,x_start,x_end):
+        """Repaints one run of changed dots on a row a dot at a time"""
+        rect = self.run_rect(y,x_start,x_end)
+        self.screen.fill((0,0,0),rect)
+        row = y * 128
+        for x in range(x_start,x_end):
+            tile = self.dot_tiles[self.dot_lookup[ord(frame_string[row+x])]]
+            if tile:
+                self.screen.blit(self.atlas,((x*self.pixel_size), (y*self.pixel_size)),tile)
+        return rect
+
+    def invalidate(self):
+        """Forget the last frame so the next draw repaints the whole window"""
+        self.last_frame = None
+
+    def reset_counters(self):
+        self.frames_drawn = 0
+        self.frames_skipped = 0
+        self.dots_repainted = 0
+
+    def get_counters(self):
+        """Returns the dirty region counters - handy for checking attract mode savings"""
+        return {'frames drawn':self.frames_drawn,
+                'frames skipped':self.frames_skipped,
+                'dots repainted':self.dots_repainted}
+
+    def draw_vectorized(self,frame_string):
+        """Decode the whole frame into tile indexes in one pass and composite it with array ops"""
+        size = self.pixel_size
+        values = numpy.frombuffer(frame_string,dtype=numpy.uint8).reshape(32,128)
+        # surfarray is x,y - so flip the frame over before looking up the tiles
+        tiles = self.tile_array[self.lookup_array[values.T]]
+        # (x, y, tile x, tile y, rgb) -> (x, tile x, y, tile y, rgb) -> full screen
+        pixels = tiles.transpose(0,2,1,3,4).reshape(128*size,32*size,3)
+        pygame.surfarray.blit_array(self.screen,pixels)
+
+    def draw_per_dot(self,frame_string):
+        """The original dot at a time renderer - used when numpy isn't available"""
+        x = 0
+        y = 0
+        # fill the screen black
+        self.screen.fill((0,0,0))
+
+        for dot in frame_string:
+            dot_value = ord(dot)
+            # if we got something other than 0
+            if dot_value != 0:
+                # set the image based on color and brightness
+                tile = self.dot_tiles[self.dot_lookup[dot_value]]
+                if tile:
+                    self.screen.blit(self.atlas,((x*self.pixel_size), (y*self.pixel_size)),tile)
+            x += 1
+            if x == 128:
+                x = 0
+                y += 1
+
+    def renderers_match(self,frame_string):
+        """Renders the given frame data with both renderers and compares the pixels"""
+        self.draw_per_dot(frame_string)
+        per_dot = pygame.surfarray.array3d(self.screen)
+        self.draw_vectorized(frame_string)
+        vectorized = pygame.surfarray.array3d(self.screen)
+        return numpy.array_equal(per_dot,vectorized)
 
     def clear_hd(self):
         self.HD = False
+        self.invalidate()
 
     def blit(self,image,x=0,y=0):
         self.HD = True
+        self.invalidate()
         self.screen.blit(image,(x,y))
         pygame.display.update()
 
     def blackout(self):
+        self.invalidate()
         self.screen.fill((0,0,0))
         pygame.display.update()
 
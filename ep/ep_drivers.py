@@ -0,0 +1,86 @@
+##   ____           _                ____
+##  / ___|__ _  ___| |_ _   _ ___   / ___|__ _ _ __  _   _  ___  _ __
+## | |   / _` |/ __| __| | | / __| | |   / _` | '_ \| | | |/ _ \| '_ \
+## | |__| (_| | (__| |_| |_| \__ \ | |__| (_| | | | | |_| | (_) | | | |
+##  \____\__,_|\___|\__|\__,_|___/  \____\__,_|_| |_|\__, |\___/|_| |_|
+##                                                   |___/
+##           ___ ___  _  _ _____ ___ _  _ _   _ ___ ___
+##          / __/ _ \| \| |_   _|_ _| \| | | | | __|   \
+##         | (_| (_) | .` | | |  | || .` | |_| | _|| |) |
+##          \___\___/|_|\_| |_| |___|_|\_|\___/|___|___/
+##
+## A P-ROC Project by Eric Priepke, Copyright 2012-2013
+## Built on the PyProcGame Framework from Adam Preble and Gerry Stellenberg
+## Original Cactus Canyon software by Matt Coriale
+##
+##
+## Driver command batching - lamp and coil commands made during a pass through the run loop
+## get held, and only the last one for each driver goes to the P-ROC when the mode queue
+## finishes its tick
+##
+
+import time
+
+__all__ = ['EP_DriverQueue']
+
+# the driver methods that change state - these get queued
+QUEUED_METHODS = ('enable', 'disable', 'schedule', 'pulse', 'future_pulse', 'patter', 'pulsed_patter')
+
+class EP_DriverQueue(object):
+    """Holds driver commands until flush - a later command for the same driver replaces the earlier one"""
+    def __init__(self):
+        self.drivers = []
+        # driver name -> (driver, method, args, kwargs, time it was asked for)
+        self.pending = {}
+        self.queued = 0
+        self.sent = 0
+        self.flushes = 0
+        self.started = time.time()
+
+    def attach(self, drivers):
+        """Routes the state changing methods of each driver through the queue"""
+        for driver in drivers:
+            for method in QUEUED_METHODS:
+                if hasattr(driver, method):
+                    setattr(driver, method, self.queued_method(driver, method))
+            self.drivers.append(driver)
+
+    def detach(self):
+        """Sends anything pending, and puts the drivers back to sending their own commands"""
+        self.flush()
+        for driver in self.drivers:
+            for method in QUEUED_METHODS:
+                # drop the instance override, back to the class method
+                driver.__dict__.pop(method, None)
+        self.drivers = []
+
+    def queued_method(self, driver, method):
+        def queued(*args, **kwargs):
+            self.command(driver, method, args, kwargs)
+        queued.__name__ = method
+        return queued
+
+    def command(self, driver, method, args, kwargs):
+        stamp = time.time()
+        self.pending[driver.name] = (driver, method, args, kwargs, stamp)
+        self.queued += 1
+        # same as the driver would do, so anybody checking sees the change right away
+        driver.last_time_changed = stamp
+
+    def flush(self):
+        """Sends the pending commands to the P-ROC"""
+        if not self.pending:
+            return
+        pending = self.pending
+        self.pending = {}
+        for driver, method, args, kwargs, stamp in pending.itervalues():
+            getattr(driver.__class__, method)(driver, *args, **kwargs)
+            # keep the time the command was asked for, not when it went out
+            driver.last_time_changed = stamp
+        self.sent += len(pending)
+        self.flushes += 1
+
+    def report(self):
+        elapsed = max(time.time() - self.started, 0.001)
+        saved = self.queued - self.sent - len(self.pending)
+        return "Driver commands: %d queued, %d sent (%.1f/sec), %d dropped as superseded, %d flushes" % (self.queued, self.sent, self.sent / elapsed, saved, self.flushes)
@@ -1,9 +1,18 @@
 import os
+import hashlib
+import collections
 from procgame.dmd import Animation, Frame
 from procgame import config
 from procgame import util
 import ep
 
+curr_file_path = os.path.dirname(os.path.abspath( __file__ ))
+# where the baked color font sheets get saved
+FONT_CACHE_PATH = curr_file_path + "/../cache/fonts/"
+# bump this if the colorizing changes, so old caches get ignored
+FONT_CACHE_VERSION = 1
+FONT_CACHE_MAGIC = "CCFONT%02d" % FONT_CACHE_VERSION
+
 # Anchor values are used by Font.draw_in_rect():
 AnchorN = 1
 AnchorW = 2
@@ -67,22 +76,60 @@ class ColorFont(object):
         return self
 
     def make_colors(self,colors):
+        """Builds a colored copy of the font bitmap for each of the given colors.
+        The baked sheets get cached on disk, keyed by the font bitmap and the color list."""
+        if self.load_cached_colors(colors):
+            return
+        data = self.bitmaps[0].get_data()
         for c in colors:
-            #print "Making " + str(c)
             frame = Frame(self.__anim.width,self.__anim.height)
-            for y in range(self.__anim.height):
-                for x in range(self.__anim.width):
-                    dot = self.bitmaps[0].get_dot(x,y)
-                    if dot > 1:
-                        newdot = ((c << 4) | (dot & 0xF))
-                        frame.set_dot(x, y, newdot)
-                    elif dot == 1:
-                        newdot = dot
-                        frame.set_dot(x,y, newdot)
-                    else:
-                        pass
-
+            frame.set_data(data.translate(color_table(c)))
             self.bitmaps[c] = frame
+        self.save_cached_colors(colors)
+
+    def color_cache_file(self,colors):
+        # keyed on the font bitmap itself, so any change to the font file makes a new entry
+        key = hashlib.sha1()
+        key.update(FONT_CACHE_MAGIC)
+        key.update(self.bitmaps[0].get_data())
+        key.update(','.join(str(c) for c in colors))
+        return os.path.join(FONT_CACHE_PATH, key.hexdigest() + '.bin')
+
+    def load_cached_colors(self,colors):
+        """Loads the baked colored sheets if we have them - returns True if it worked"""
+        try:
+            cache_file = self.color_cache_file(colors)
+            if not os.path.exists(cache_file):
+                return False
+            data = open(cache_file,'rb').read()
+        except (IOError, OSError):
+            return False
+        size = self.__anim.width * self.__anim.height
+        header = len(FONT_CACHE_MAGIC)
+        if data[:header] != FONT_CACHE_MAGIC or len(data) != header + (size * len(colors)):
+            return False
+        for index in range(len(colors)):
+            start = header + (index * size)
+            frame = Frame(self.__anim.width,self.__anim.height)
+            frame.set_data(data[start:start+size])
+            self.bitmaps[colors[index]] = frame
+        return True
+
+    def save_cached_colors(self,colors):
+        try:
+            cache_file = self.color_cache_file(colors)
+            if not os.path.exists(FONT_CACHE_PATH):
+                os.makedirs(FONT_CACHE_PATH)
+            # write to a temp file and swap it in, so a half written cache never gets loaded
+            temp_file = cache_file + '.tmp'
+            out = open(temp_file,'wb')
+            out.write(FONT_CACHE_MAGIC)
+            for c in colors:
+                out.write(self.bitmaps[c].get_data())
+            out.close()
+            os.rename(temp_file,cache_file)
+        except (IOError, OSError), e:
+            print "Could not save color font cache: " + str(e)
 
     def save(self, filename):
         """Save the font to the given path."""
@@ -96,6 +143,12 @@ class ColorFont(object):
 
     def draw(self, frame, text, x, y,color=0):
         """Uses this font's characters to draw the given string at the given position."""
+        # the whole string in one copy from the text cache - as long as that comes out the same
+        if text and self.tracking <= 0 and self.composite_op in CACHED_OPS:
+            run, advance, overhang = text_cache.run(self, text, color, self.composite_op)
+            if run != None and not overhang:
+                Frame.copy_rect(dst=frame, dst_x=x, dst_y=y, src=run, src_x=0, src_y=0, width=run.width, height=run.height, op=self.composite_op)
+                return x + advance
         for ch in text:
             char_offset = ord(ch) - ord(' ')
             if char_offset < 0 or char_offset >= 96:
@@ -157,6 +210,98 @@ class ColorFont(object):
 
         self.draw(frame=frame, text=text, x=x, y=y)
 
+# drawing a cached string in one go only matches drawing it a character at a time for these
+CACHED_OPS = ('copy', 'blacksrc')
+
+class EP_TextCache(object):
+    """Rendered strings, keyed by font, color, tracking, composite op and text - the least
+    recently used go once it's full.  The frames are shared, so draw them onto something, never on them."""
+    def __init__(self, limit=512):
+        self.limit = limit
+        self.frames = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color=0, op='copy', tracking=None):
+        """Returns a frame with text drawn in font, sized to fit - None if there's nothing to draw"""
+        return self.run(font, text, color, op, tracking)[0]
+
+    def run(self, font, text, color=0, op='copy', tracking=None):
+        """Same as render, along with how far along x the next character would go, and whether
+        any character started left of the first one and got cut off"""
+        if tracking == None:
+            tracking = font.tracking
+        key = (font, color, tracking, op, text)
+        entry = self.frames.pop(key, None)
+        if entry != None:
+            self.hits += 1
+            self.frames[key] = entry
+            return entry
+        self.misses += 1
+        entry = self.draw(font, text, color, op, tracking)
+        if entry[0] != None:
+            self.frames[key] = entry
+            while len(self.frames) > self.limit:
+                self.frames.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def draw(self, font, text, color, op, tracking):
+        # colored fonts have a sheet per color, plain ones just the one
+        bitmaps = getattr(font, 'bitmaps', None)
+        if bitmaps:
+            src = bitmaps[color]
+        else:
+            src = font.bitmap
+        glyphs = []
+        advance = 0
+        # with negative tracking a wide character can stick out past the ones after it,
+        # and a narrow one can leave the next starting left of the run
+        width = 0
+        overhang = False
+        for ch in text:
+            char_offset = ord(ch) - ord(' ')
+            if char_offset < 0 or char_offset >= 96:
+                continue
+            glyphs.append(char_offset)
+            overhang = overhang or advance < 0
+            width = max(width, advance + font.char_widths[char_offset])
+            advance += font.char_widths[char_offset] + tracking
+        if not glyphs or width <= 0:
+            return None, advance, overhang
+        frame = Frame(width, font.char_size)
+        x = 0
+        for char_offset in glyphs:
+            char_x = font.char_size * (char_offset % 10)
+            char_y = font.char_size * (char_offset / 10)
+            char_width = font.char_widths[char_offset]
+            Frame.copy_rect(dst=frame, dst_x=x, dst_y=0, src=src, src_x=char_x, src_y=char_y, width=char_width, height=font.char_size, op=op)
+            x += char_width + tracking
+        return frame, advance, overhang
+
+    def clear(self):
+        self.frames.clear()
+
+    def report(self):
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return "Text cache: no lookups"
+        return "Text cache: %d strings of %d, %d hits / %d lookups (%.1f%%), %d evictions" % (len(self.frames), self.limit, self.hits, lookups, self.hits * 100.0 / lookups, self.evictions)
+
+text_cache = EP_TextCache()
+
+__color_tables = {}
+def color_table(color):
+    """Returns a 256 entry translation table that colorizes font dots - 0 stays blank, 1 stays 1,
+    everything else keeps its brightness and gets the color in the high nibble."""
+    if color not in __color_tables:
+        table = [chr(0),chr(1)]
+        for dot in range(2,256):
+            table.append(chr((color << 4) | (dot & 0xF)))
+        __color_tables[color] = ''.join(table)
+    return __color_tables[color]
+
 font_path = []
 """Array of paths that will be searched by :meth:`~procgame.dmd.font_named` to locate fonts.
 
@@ -27,6 +27,24 @@ import copy
 import re
 import time
 import logging
+import os
+import marshal
+import ep_clock
+
+curr_file_path = os.path.dirname(os.path.abspath( __file__ ))
+LAMPSHOW_CACHE_PATH = curr_file_path + "/../cache/lampshows/"
+LAMPSHOW_CACHE_MAGIC = "CCSHOW02"
+
+# compiled shows keyed by file name - shared by the regular and GI controllers
+compiled_shows = {}
+
+# each step of a show is half a second - 16 of the 32 schedule slots
+STEP_TIME = 0.5
+STEP_SLOTS = 16
+
+# shows that are playing, lowest layer first, and which show gets each driver
+playing_shows = []
+claimed_drivers = {}
 
 # Pattern functions:
 def make_pattern(m, repeats):
@@ -147,24 +165,16 @@ class EP_LampShowTrack(object):
         if m == None:
             raise ValueError, "Regexp didn't match on track line: "+line
         self.name = m.group('name')
-        data = m.group('data')+(' '*32) # Pad it with 32 spaces so that the FIXME below doesn't cause a problem.
-        data = expand_line(data)
-        bits = 0
-        bit_count = 0
-        ignore_first = True
+        data = expand_line(m.group('data'))
+        # one schedule per half second step - the step's 16 slots, then the next step's 16 as a lead in.
+        # the last step gets spaces after the end of the data, so nothing gets cut off
         self.schedules = []
-        for ch in data:
-            bits >>= 1
-            bit_count += 1
-            if ch != " ":
-                bits |= 1 << 31
-            if bit_count % 16 == 0:
-                if not ignore_first:
-                    self.schedules.append(bits)
-                    #bits = 0
-                    #bit_count = 0
-                ignore_first = False
-        # FIXME: This lops off the last up to 31 bits of track data!
+        for start in range(0, len(data), STEP_SLOTS):
+            bits = 0
+            for slot, ch in enumerate(data[start:start + 32]):
+                if ch != " ":
+                    bits |= 1 << slot
+            self.schedules.append(bits)
         # Print out all of the data for debugging purposes:
         # print "Loaded %d schedules for %s:" % (len(self.schedules), self.name)
         # for sch in self.schedules:
@@ -173,12 +183,7 @@ class EP_LampShowTrack(object):
         # print "%s | %s" % (self.name, data)
 
     def resolve_driver_with_game(self, game):
-        if self.name.startswith('coil:'):
-            self.driver = game.coils[self.name[5:]]
-        elif self.name.startswith('lamp:'):
-            self.driver = game.lamps[self.name[5:]]
-        else: # lamps are the default:
-            self.driver = game.lamps[self.name]
+        self.driver = resolve_driver(game, self.name)
 
     def reset(self):
         """Clears the contents of this track."""
@@ -199,23 +204,180 @@ class EP_LampShowTrack(object):
         """True if this track's schedules have all been used."""
         return self.current_index >= len(self.schedules)
 
+def resolve_driver(game, name):
+    """Returns the driver for a track name - ``coil:`` or ``lamp:`` prefixed, lamps are the default"""
+    if name.startswith('coil:'):
+        return game.coils[name[5:]]
+    elif name.startswith('lamp:'):
+        return game.lamps[name[5:]]
+    else: # lamps are the default:
+        return game.lamps[name]
+
+def swap_halves(schedule):
+    # where a schedule's 1 second cycle is at, half a second after it was sent
+    return (schedule >> STEP_SLOTS) | ((schedule & 0xFFFF) << STEP_SLOTS)
+
+class EP_CompiledLampShow(object):
+    """A lamp show parsed down to the driver names and schedule values of each track.
+
+    Built once per file by :func:`compile_show` and shared by anything that plays it,
+    so nothing in here should be changed after it's made.
+    """
+    def __init__(self, filename, tracks):
+        self.filename = filename
+        self.names = tuple([name for name, schedules in tracks])
+        self.length = 0
+        for name, schedules in tracks:
+            self.length = max(self.length, len(schedules))
+        # short tracks are off for the rest of the show
+        self.schedules = tuple([tuple(schedules) + (0,) * (self.length - len(schedules)) for name, schedules in tracks])
+        # the tracks whose schedule changes at each step - the first step starts them all
+        everything = frozenset(range(len(self.schedules)))
+        self.changes = [everything]
+        for index in range(1, self.length):
+            self.changes.append(frozenset([i for i, schedules in enumerate(self.schedules) if schedules[index] != schedules[index - 1]]))
+        self.changes = tuple(self.changes)
+        # and the ones that need sending going from the last step back around to the first.  By then the
+        # P-ROC is half way through the last step's schedule - playing its lead in, then its own slots
+        # again - so a track can be left alone only if that's the first step with its halves swapped
+        if self.length:
+            self.wrap = frozenset([i for i, schedules in enumerate(self.schedules) if schedules[0] != swap_halves(schedules[-1])])
+        else:
+            self.wrap = everything
+        # (driver, schedules) pairs, filled in by resolve_drivers
+        self.tracks = None
+
+    def resolve_drivers(self, game):
+        if self.tracks == None:
+            drivers = [resolve_driver(game, name) for name in self.names]
+            self.tracks = tuple(zip(drivers, self.schedules))
+        return self.tracks
+
+def parse_show(filename):
+    """Reads a lampshow file and returns a list of (name, schedules) for its tracks"""
+    tracks = []
+    f = open(filename, 'r')
+    for line in f.readlines():
+        if line[0] != '#':
+            track = EP_LampShowTrack(line)
+            tracks.append((track.name, track.schedules))
+    f.close()
+    return tracks
+
+def compile_show(filename, use_cache=True):
+    """Returns the compiled show for the given file, parsing it (or reading the cache) the first time"""
+    if filename in compiled_shows:
+        return compiled_shows[filename]
+    tracks = None
+    if use_cache:
+        tracks = load_cached_show(filename)
+    if tracks == None:
+        tracks = parse_show(filename)
+        if use_cache:
+            save_cached_show(filename, tracks)
+    show = EP_CompiledLampShow(filename, tracks)
+    compiled_shows[filename] = show
+    return show
+
+def show_cache_file(filename):
+    return LAMPSHOW_CACHE_PATH + os.path.basename(filename) + ".cache"
+
+def load_cached_show(filename):
+    # the cache is only good if the show file hasn't changed since it was written
+    cache_file = show_cache_file(filename)
+    if not os.path.isfile(cache_file):
+        return None
+    try:
+        stat = os.stat(filename)
+        f = open(cache_file, 'rb')
+        magic, mtime, size, tracks = marshal.load(f)
+        f.close()
+    except Exception:
+        return None
+    if magic != LAMPSHOW_CACHE_MAGIC or mtime != stat.st_mtime or size != stat.st_size:
+        return None
+    return tracks
+
+def save_cached_show(filename, tracks):
+    try:
+        if not os.path.isdir(LAMPSHOW_CACHE_PATH):
+            os.makedirs(LAMPSHOW_CACHE_PATH)
+        stat = os.stat(filename)
+        cache_file = show_cache_file(filename)
+        # write to a temp file and move it into place so a half written cache never gets read
+        f = open(cache_file + ".tmp", 'wb')
+        marshal.dump((LAMPSHOW_CACHE_MAGIC, stat.st_mtime, stat.st_size, [(name, list(schedules)) for name, schedules in tracks]), f)
+        f.close()
+        os.rename(cache_file + ".tmp", cache_file)
+    except (IOError, OSError):
+        print "Couldn't write lampshow cache for " + str(filename)
+
+def claim_drivers():
+    # the highest layer show using a driver gets it - for the same layer, the last one started
+    claimed_drivers.clear()
+    for show in playing_shows:
+        for driver, schedules in show.tracks:
+            claimed_drivers[driver.name] = show
+
 class EP_LampShow(object):
     """Manages loading and playing a lamp show consisting of several lamps (or other drivers),
-    each of which is a track (:class:`LampShowTrack`, to be precise)."""
+    each of which is a track (:class:`LampShowTrack`, to be precise).
 
-    def __init__(self, game):
+    Each step only sends the tracks whose schedule changed, or that something else has set since.
+    Shows on a higher ``layer`` (GI shows are layer 1) take over any drivers they share with lower ones,
+    and hand them back when they finish.
+    """
+
+    def __init__(self, game, layer=0):
         super(EP_LampShow, self).__init__()
         self.myID = "Lamp Show"
         self.game = game
+        self.layer = layer
+        self.repeat = False
+        # driver updates sent and steps played, for checking what shows cost
+        self.updates = 0
+        self.steps = 0
+        self.tracks = ()
         self.reset()
 
     def reset(self):
         """Clears out all of the tracks in this lamp show."""
         #for tr in self.tracks:
         #	tr.reset()
-        self.tracks = []
-        self.t0 = None
-        self.last_time = -.5
+        self.release()
+        self.tracks = ()
+        self.changes = ()
+        self.wrap = frozenset()
+        self.wrapped = False
+        self.length = 0
+        self.index = 0
+        self.next_time = None
+        # each track's driver last_time_changed after we last sent it - if it's different, somebody else set it
+        self.stamps = []
+
+    def play(self, compiled):
+        """Sets up the lamp show to play the given :class:`EP_CompiledLampShow` from the start."""
+        self.release()
+        self.tracks = compiled.resolve_drivers(self.game)
+        self.changes = compiled.changes
+        self.wrap = compiled.wrap
+        self.length = compiled.length
+        self.index = 0
+        self.next_time = None
+        self.stamps = [None] * len(self.tracks)
+        self.claim()
+
+    def claim(self):
+        if self not in playing_shows:
+            playing_shows.append(self)
+            # stable sort, so the same layer stays in the order they started
+            playing_shows.sort(key=lambda show: show.layer)
+            claim_drivers()
+
+    def release(self):
+        if self in playing_shows:
+            playing_shows.remove(self)
+            claim_drivers()
 
     def load(self, filename):
         """Reads lines from the given ``filename`` in to create tracks within the lamp show.  A lamp show
@@ -230,39 +392,71 @@ class EP_LampShow(object):
 
         See :class:`LampShowTrack` for a complete description of the track line format.
         """
-        f = open(filename, 'r')
-        for line in f.readlines():
-            if line[0] != '#':
-                self.tracks.append(EP_LampShowTrack(line))
+        self.play(compile_show(filename))
 
     def tick(self):
-        """Instructs the lamp show to advance based on the system clock and update the drivers associated with its tracks."""
-        if self.t0 == None:
-            self.t0 = time.time()
-        new_time = (time.time() - self.t0)
-        seconds = int(new_time)
-        time_diff = new_time - self.last_time
-        if (time_diff > 0.500):
-            self.last_time = new_time
-            for tr in self.tracks:
-                if tr.driver == None: # Lazily set drivers.
-                    tr.resolve_driver_with_game(self.game)
-                sch = tr.next_schedule()
-                tr.driver.schedule(schedule=sch, cycle_seconds=1, now=True)
+        """Plays the next step when it's due - called every pass through the loop, so not due is the quick way out."""
+        now = ep_clock.now()
+        if self.next_time == None:
+            self.next_time = now
+        elif now < self.next_time:
+            return
+        if self.index >= self.length:
+            return
+        index = self.index
+        if self.wrapped:
+            changed = self.wrap
+            self.wrapped = False
+        else:
+            changed = self.changes[index]
+        # the last step of a show that isn't repeating goes out on a one second cycle, so the lamps still on run out
+        final = index == self.length - 1 and not self.repeat
+        stamps = self.stamps
+        for i, (driver, schedules) in enumerate(self.tracks):
+            if not (i in changed or driver.last_time_changed != stamps[i] or (final and schedules[index])):
+                continue
+            # a higher layer show has this one
+            if claimed_drivers.get(driver.name, self) is not self:
+                continue
+            if final:
+                driver.schedule(schedule=schedules[index], cycle_seconds=1, now=True)
+            else:
+                driver.schedule(schedule=schedules[index], cycle_seconds=0, now=True)
+            stamps[i] = driver.last_time_changed
+            self.updates += 1
+        self.steps += 1
+        self.index += 1
+        # stay on the half second grid, unless we've fallen a whole step behind
+        self.next_time += STEP_TIME
+        if self.next_time < now:
+            self.next_time = now + STEP_TIME
+        if final:
+            self.release()
+
+    def stop(self):
+        """Stops the show.  Lamps it was driving get turned off, unless something else has set them since."""
+        for i, (driver, schedules) in enumerate(self.tracks):
+            if self.stamps[i] != None and driver.last_time_changed == self.stamps[i] and claimed_drivers.get(driver.name) is self:
+                driver.disable()
+        self.release()
 
     def restart(self):
         """Restart the show from the beginning."""
-        for tr in self.tracks:
-            tr.restart()
+        # coming back around from the end only needs the tracks that differ - otherwise everything goes out
+        self.wrapped = self.length > 0 and self.index >= self.length
+        self.index = 0
+        self.claim()
         #self.t0 = None
         #self.last_seconds = -1
 
     def is_complete(self):
         """``True`` if each of the tracks has completed."""
-        for tr in self.tracks:
-            if tr.is_complete() == False:
-                return False
-        return True
+        return self.index >= self.length
+
+    def report(self):
+        if self.steps == 0:
+            return "Lamp show: no steps played"
+        return "Lamp show: %d steps, %d driver updates, %.1f per step" % (self.steps, self.updates, float(self.updates) / self.steps)
 
 class LampShowMode(ep.EP_Mode):
     """:class:`~procgame.game.Mode` subclass that manages a single :class:`LampShow`,
@@ -275,12 +469,16 @@ class LampShowMode(ep.EP_Mode):
         self.show_over = True
         self.logger = logging.getLogger('game.lamps')
 
-    def load(self, filename, repeat=False, callback='None'):
-        """Load a new lamp show."""
+    def load(self, show, repeat=False, callback='None'):
+        """Load a new lamp show - either a compiled show or a file name."""
         self.callback = callback
         self.repeat = repeat
         self.lampshow.reset()
-        self.lampshow.load(filename)
+        self.lampshow.repeat = repeat
+        if isinstance(show, EP_CompiledLampShow):
+            self.lampshow.play(show)
+        else:
+            self.lampshow.load(show)
         self.restart()
 
     def restart(self):
@@ -300,11 +498,15 @@ class LampShowMode(ep.EP_Mode):
         elif not self.show_over:
             self.lampshow.tick()
 
+    def mode_stopped(self):
+        super(LampShowMode, self).mode_stopped()
+        self.lampshow.stop()
+
 class EP_LampController(object):
     """Controller object that encapsulates a :class:`LampShow` and helps to restore lamp drivers to their prior state."""
 
     shows = {}
-    """Dictionary of :class:`LampShow` objects."""
+    """Dictionary of :class:`EP_CompiledLampShow` objects."""
 
     show = None
     """:class:`LampShowMode` that must be added to the mode queue."""
@@ -317,7 +519,10 @@ class EP_LampController(object):
         self.logger = logging.getLogger('game.lamps')
 
     def register_show(self, key, show_file):
-                self.shows[key] = show_file
+        # parse it now, so playing it later is just a lookup
+        show = compile_show(show_file, self.game.lampshow_cache)
+        show.resolve_drivers(self.game)
+        self.shows[key] = show
 
     def play_show(self, key, repeat=False, callback='None'):
         print "Playing regular lamp show - " + str(key)
@@ -338,6 +543,9 @@ class EP_LampController(object):
         self.show_playing = False
 
     def save_state(self, key):
+        # lamp states come from the P-ROC, so send anything batched up first
+        if self.game.driver_queue:
+            self.game.driver_queue.flush()
         state_dict = {}
         for lamp in self.game.lamps:
             state_dict[lamp.name] = {'time':lamp.last_time_changed, 'state':lamp.state()}
@@ -378,16 +586,21 @@ class GILampShowMode(ep.EP_Mode):
     def __init__(self, game):
         super(GILampShowMode, self).__init__(game, 3)
         self.myID = "GI Lamp Show Mode"
-        self.lampshow = EP_LampShow(self.game)
+        # GI shows ride on top of the regular ones
+        self.lampshow = EP_LampShow(self.game, layer=1)
         self.show_over = True
         self.logger = logging.getLogger('game.lamps')
 
-    def load(self, filename, repeat=False, callback='None'):
-        """Load a new lamp show."""
+    def load(self, show, repeat=False, callback='None'):
+        """Load a new lamp show - either a compiled show or a file name."""
         self.callback = callback
         self.repeat = repeat
         self.lampshow.reset()
-        self.lampshow.load(filename)
+        self.lampshow.repeat = repeat
+        if isinstance(show, EP_CompiledLampShow):
+            self.lampshow.play(show)
+        else:
+            self.lampshow.load(show)
         self.restart()
 
     def restart(self):
@@ -407,11 +620,15 @@ class GILampShowMode(ep.EP_Mode):
         elif not self.show_over:
             self.lampshow.tick()
 
+    def mode_stopped(self):
+        super(GILampShowMode, self).mode_stopped()
+        self.lampshow.stop()
+
 class EP_LampControllerGI(object):
     """Controller object that encapsulates a :class:`LampShow` and helps to restore lamp drivers to their prior state."""
 
     shows = {}
-    """Dictionary of :class:`LampShow` objects."""
+    """Dictionary of :class:`EP_CompiledLampShow` objects."""
 
     show = None
     """:class:`LampShowMode` that must be added to the mode queue."""
@@ -424,7 +641,10 @@ class EP_LampControllerGI(object):
         self.logger = logging.getLogger('game.lamps')
 
     def register_show(self, key, show_file):
-        self.shows[key] = show_file
+        # parse it now, so playing it later is just a lookup
+        show = compile_show(show_file, self.game.lampshow_cache)
+        show.resolve_drivers(self.game)
+        self.shows[key] = show
 
     def play_show(self, key, repeat=False, callback='None'):
         print "PLAYING GI LAMPSHOW - " + str(key)
@@ -446,6 +666,9 @@ class EP_LampControllerGI(object):
         self.show_playing = False
 
     def save_state(self, key):
+        # lamp states come from the P-ROC, so send anything batched up first
+        if self.game.driver_queue:
+            self.game.driver_queue.flush()
         state_dict = {}
         for lamp in self.game.lamps:
             state_dict[lamp.name] = {'time':lamp.last_time_changed, 'state':lamp.state()}
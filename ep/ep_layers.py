@@ -19,6 +19,8 @@
 ##
 from procgame import *
 import time
+import ep_clock
+from ep_font import text_cache
 
 class EP_UpdateLayer(dmd.Layer):
 
@@ -138,9 +140,10 @@ class EP_TextLayer(dmd.Layer):
                 self.draw_font(self.frame, text, self.x + x, self.y + y)
             else:
                 self.set_target_position(self.x, self.y)
-                (w, h) = self.font.size(text)
-                self.frame = dmd.Frame(w, h)
-                self.draw_font(self.frame, text, 0, 0,color)
+                # shared with every other layer showing the same text the same way
+                self.frame = text_cache.render(self.font, text, color, self.composite_op)
+                if self.frame == None:
+                    self.frame = dmd.Frame(w, h)
                 (self.target_x_offset, self.target_y_offset) = (x,y)
 
         return self
@@ -162,8 +165,8 @@ class EP_TextLayer(dmd.Layer):
 
     def next_frame(self):
         if self.started_at == None:
-            self.started_at = time.time()
-        if (self.seconds != None) and ((self.started_at + self.seconds) < time.time()):
+            self.started_at = ep_clock.now()
+        if (self.seconds != None) and ((self.started_at + self.seconds) < ep_clock.now()):
             self.frame = None
         elif self.blink_frames > 0:
             if self.blink_frames_counter == 0:
@@ -181,6 +184,60 @@ class EP_TextLayer(dmd.Layer):
         return self.frame != None
 
 
+class EP_BoundTextLayer(EP_TextLayer):
+    """Text layer that gets its text from a function - only redrawn when the text changes."""
+    def __init__(self, x, y, font, source, justify="left", blink_frames=None, color=0x0, opaque=False):
+        super(EP_BoundTextLayer, self).__init__(x, y, font, justify, opaque)
+        self.source = source
+        self.bound_blink = blink_frames
+        self.bound_color = color
+        self.text = None
+        self.drawn = False
+
+    def next_frame(self):
+        text = self.source()
+        if not self.drawn or text != self.text:
+            self.text = text
+            # after the first draw, leave the blink where it is
+            if self.drawn:
+                blink_frames = 999
+            else:
+                blink_frames = self.bound_blink
+            self.set_text(text, blink_frames=blink_frames, color=self.bound_color)
+            self.drawn = True
+        return super(EP_BoundTextLayer, self).next_frame()
+
+class EP_DisplayLayer(dmd.GroupedLayer):
+    """Grouped layer for a mode display that gets built once and kept.  Layers bound to a
+    position function get moved when the position changes."""
+    def __init__(self, layers, width=128, height=32):
+        super(EP_DisplayLayer, self).__init__(width, height, layers)
+        # [layer, position function, last position]
+        self.positions = []
+
+    def bind_position(self, layer, source):
+        self.positions.append([layer, source, None])
+        return layer
+
+    def next_frame(self):
+        for binding in self.positions:
+            position = binding[1]()
+            if position != binding[2]:
+                binding[2] = position
+                binding[0].set_target_position(position[0], position[1])
+        return super(EP_DisplayLayer, self).next_frame()
+
+def flatten_layer(layer, width=128, height=32):
+    """Renders a layer that never changes into a single frame layer, so it doesn't get composited again every frame"""
+    frame = dmd.GroupedLayer(width, height, [layer]).next_frame()
+    if frame == None:
+        frame = dmd.Frame(width, height)
+    else:
+        frame = frame.copy()
+    flat = dmd.FrameLayer(opaque=layer.opaque, frame=frame)
+    flat.composite_op = layer.composite_op
+    return flat
+
 class EP_PanningLayer(dmd.Layer):
     """Pans a frame about on a 128x32 buffer, bouncing when it reaches the boundaries."""
     # callback should use a sent callback when it hits the edge of the pan
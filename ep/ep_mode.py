@@ -15,15 +15,43 @@
 ##
 
 from procgame import dmd
+from procgame import game
 import time
+import copy
 import re
-import uuid
 import random
+import heapq
+import itertools
+import weakref
+import ep_clock
+import ep_layers
+from ep_profiler import profiler
 
 # Documented in game.rst:
 SwitchStop = True
 SwitchContinue = False
 
+PLAIN_TYPES = (int, long, float, bool, str, unicode, type(None))
+
+def is_plain(value):
+    # numbers, strings and containers of them - safe and cheap to copy all the way down
+    if isinstance(value, PLAIN_TYPES):
+        return True
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return all(is_plain(item) for item in value)
+    if isinstance(value, dict):
+        return all(is_plain(key) and is_plain(item) for key, item in value.iteritems())
+    return False
+
+def fresh_copy(value):
+    """A copy of a mode attribute that changing the original in place won't touch - layers
+    and other objects inside containers stay shared"""
+    if isinstance(value, (list, dict, set)):
+        if is_plain(value):
+            return copy.deepcopy(value)
+        return copy.copy(value)
+    return value
+
 class EP_Mode(object):
     """Abstraction of a game mode to be subclassed by the game
      programmer.
@@ -66,6 +94,10 @@ class EP_Mode(object):
      Modes can be programatically configured using :meth:`.add_switch_handler`.
      """
 
+    # shared counters for anonymous delay names and delay ordering
+    anon_delays = itertools.count()
+    delay_sequence = itertools.count()
+
     parent_mode = None
     #"""The parent mode for this mode.  Set by :meth:`add_child_mode` and cleared in :meth:`remove_child_mode`."""
     __children = None # child modes, managed with add_child_mode() and remove_child_mode()
@@ -75,7 +107,12 @@ class EP_Mode(object):
         self.game = game
         self.priority = priority
         self.__accepted_switches = []
+        # accepted switches indexed by (switch number, event type)
+        self.__switch_handlers = {}
+        # delays live in a min-heap ordered by (time, sequence), with a name index for cancelling
         self.__delayed = []
+        self.__delayed_names = {}
+        self.__cancelled = 0
         self.__children = []
         self.__scan_switch_handlers()
 
@@ -85,6 +122,10 @@ class EP_Mode(object):
         self.queued = 0
         self.myID = "Unknown"
         self.layer = None
+        # asset name prefixes to preload just before this mode starts
+        self.warm_up = []
+        # displays built by show_display, by name
+        self.displays = {}
 
     def __scan_switch_handlers(self):
         # Format: sw_popperL_open_for_200ms(self, sw):
@@ -151,7 +192,21 @@ class EP_Mode(object):
             return
         d = {'name':name, 'type':et, 'delay':delay, 'handler':handler, 'param':sw}
         if d not in self.__accepted_switches:
-            self.__accepted_switches.append(EP_Mode.AcceptedSwitch(name=name, event_type=et, delay=delay, handler=handler, param=sw))
+            accepted = EP_Mode.AcceptedSwitch(name=name, event_type=et, delay=delay, handler=handler, param=sw)
+            self.__accepted_switches.append(accepted)
+            key = (sw.number, et)
+            if key in self.__switch_handlers:
+                self.__switch_handlers[key].append(accepted)
+            else:
+                self.__switch_handlers[key] = [accepted]
+            # let the mode queue know this mode wants events from this switch
+            if isinstance(self.game.modes, EP_ModeQueue):
+                self.game.modes.index_switch(sw.number, self)
+
+    def handles_switch(self, number):
+        """Returns True if this mode has a handler for the given switch number"""
+        return (number, 1) in self.__switch_handlers or (number, 2) in self.__switch_handlers or \
+               (number, 3) in self.__switch_handlers or (number, 4) in self.__switch_handlers
 
     def status_str(self):
         return self.__class__.__name__
@@ -193,15 +248,15 @@ class EP_Mode(object):
         if type(event_type) == str:
             event_type = {'closed':1, 'open':2}[event_type]
         if name == None:
-            name = 'anon_delay'+str(uuid.uuid1())
-        self.__delayed.append(EP_Mode.Delayed(name=name, time=time.time()+delay, handler=handler, event_type=event_type, param=param))
-        try:
-            self.__delayed.sort(lambda x, y: int((x.time - y.time)*100))
-        except TypeError, ex:
-            # Debugging code:
-            for x in self.__delayed:
-                print(x)
-            raise ex
+            name = 'anon_delay' + str(EP_Mode.anon_delays.next())
+        item = EP_Mode.Delayed(name=name, time=ep_clock.now()+delay, handler=handler, event_type=event_type, param=param)
+        # the sequence number keeps delays due at the same time in the order they were added
+        item.sequence = EP_Mode.delay_sequence.next()
+        heapq.heappush(self.__delayed, (item.time, item.sequence, item))
+        if name in self.__delayed_names:
+            self.__delayed_names[name].append(item)
+        else:
+            self.__delayed_names[name] = [item]
         return name
 
     def cancel_delayed(self, name):
@@ -210,8 +265,30 @@ class EP_Mode(object):
         if type(name) == list:
             for n in name:
                 self.cancel_delayed(n)
-        else:
-            self.__delayed = filter(lambda x: x.name != name, self.__delayed)
+        elif name in self.__delayed_names:
+            # cancelled delays stay in the heap, and get skipped when they come up
+            for item in self.__delayed_names.pop(name):
+                item.cancelled = True
+                self.__cancelled += 1
+            self.__compact_delayed()
+
+    def __compact_delayed(self):
+        # if the heap is mostly cancelled delays, rebuild it with just the live ones
+        if self.__cancelled > 32 and self.__cancelled > len(self.__delayed) / 2:
+            self.__delayed = [entry for entry in self.__delayed if not entry[2].cancelled]
+            heapq.heapify(self.__delayed)
+            self.__cancelled = 0
+
+    def __forget_delayed(self, item):
+        # take a fired delay out of the name index
+        items = self.__delayed_names.get(item.name)
+        if items:
+            if items[0] is item:
+                del items[0]
+            elif item in items:
+                items.remove(item)
+            if not items:
+                del self.__delayed_names[item.name]
 
     def handle_event(self, event):
         # We want to turn this event into a function call.
@@ -222,13 +299,33 @@ class EP_Mode(object):
         # Remove all items that are for this switch (sw_name) but for a different state (type).
         # Put another way, keep delayed items pertaining to other switches, plus delayed items
         # pertaining to this switch for another state.
-        self.__delayed = filter(lambda x: not (sw_name == x.name and x.event_type != event['type']), self.__delayed)
-
-        filt = lambda accepted: (accepted.event_type == event['type']) and (accepted.name == sw_name)
-        for accepted in filter(filt, self.__accepted_switches):
+        if sw_name in self.__delayed_names:
+            keep = []
+            for item in self.__delayed_names[sw_name]:
+                if item.event_type != event['type']:
+                    item.cancelled = True
+                    self.__cancelled += 1
+                else:
+                    keep.append(item)
+            if keep:
+                self.__delayed_names[sw_name] = keep
+            else:
+                del self.__delayed_names[sw_name]
+            self.__compact_delayed()
+
+        handlers = self.__switch_handlers.get((event['value'], event['type']))
+        if not handlers:
+            return handled
+        # copy, in case a handler adds more handlers for this switch
+        for accepted in list(handlers):
             if accepted.delay == None or accepted.delay == 0:
                 handler = accepted.handler
-                result = handler(self.game.switches[accepted.name])
+                if profiler.enabled:
+                    start = time.time()
+                    result = handler(self.game.switches[accepted.name])
+                    profiler.record(profiler.handler_key(self, handler), start)
+                else:
+                    result = handler(self.game.switches[accepted.name])
                 if result == SwitchStop:
                     handled = True
             else:
@@ -263,15 +360,37 @@ class EP_Mode(object):
 
     def dispatch_delayed(self):
         """Called by the GameController to dispatch any delayed events."""
-        t = time.time()
-        for item in self.__delayed:
-            if item.time <= t:
-                handler = item.handler
-                if item.param != None:
-                    handler(item.param)
-                else:
-                    handler()
-        self.__delayed = filter(lambda x: x.time > t, self.__delayed)
+        delayed = self.__delayed
+        # nothing due - the common case
+        if not delayed:
+            return
+        t = ep_clock.now()
+        if delayed[0][0] > t:
+            return
+        # only run delays that were already scheduled when the dispatch started
+        last_sequence = EP_Mode.delay_sequence.next()
+        while self.__delayed and self.__delayed[0][0] <= t and self.__delayed[0][1] < last_sequence:
+            item = heapq.heappop(self.__delayed)[2]
+            if item.cancelled:
+                self.__cancelled -= 1
+                continue
+            self.__forget_delayed(item)
+            handler = item.handler
+            if profiler.enabled:
+                start = time.time()
+            if item.param != None:
+                handler(item.param)
+            else:
+                handler()
+            if profiler.enabled:
+                profiler.record(profiler.handler_key(self, handler), start)
+
+    def delayed_count(self):
+        """Returns the number of pending (not cancelled) delays"""
+        count = 0
+        for items in self.__delayed_names.values():
+            count += len(items)
+        return count
 
     def is_started(self):
         """Returns ``True`` if this mode is on the mode queue (:meth:`mode_started` has already been called)."""
@@ -395,14 +514,57 @@ class EP_Mode(object):
         self.cancel_delayed("Music On")
         self.delay("Music On", delay=wait, handler=self.music_on, param=song)
 
+    def bound_text(self, x, y, font, source, justify="left", blink_frames=None, color=0x0):
+        """Text layer that follows whatever source returns - for use in show_display"""
+        return ep_layers.EP_BoundTextLayer(x, y, font, source, justify, blink_frames, color)
+
+    def show_display(self, name, build):
+        """Shows the display called name.  The first time, build gets the new display and returns
+        its layers - after that the same display gets reused, and its bound text and positions
+        keep it current without the mode having to loop."""
+        display = self.displays.get(name)
+        if display == None:
+            display = self.displays[name] = ep_layers.EP_DisplayLayer([])
+            display.layers = build(display)
+        self.layer = display
+        return display
+
+    def drop_display(self, name):
+        """Forgets a display, so the next show_display builds it fresh"""
+        self.displays.pop(name, None)
+
     # if there's no layer, and it's wanted for a group, return a blank one
     def no_layer(self):
         blank = dmd.FrameLayer(opaque=False, frame=self.game.assets.dmd_blank.frames[0])
         blank.composite_op = "blacksrc"
         return blank
 
+    def save_game_state(self):
+        """Remembers the mode the way __init__ left it, for reset_game_state"""
+        self.__fresh_state = None
+        self.__fresh_state = dict((key, fresh_copy(value)) for key, value in self.__dict__.iteritems())
+
+    def reset_game_state(self):
+        """Puts the mode back the way __init__ left it, without building it again - for a soft reset.
+        Anything set on it since that wasn't there to begin with goes too."""
+        fresh = getattr(self, '_EP_Mode__fresh_state', None)
+        if fresh == None:
+            return
+        self.wipe_delays()
+        for key in self.__dict__.keys():
+            if key not in fresh:
+                del self.__dict__[key]
+        for key, value in fresh.iteritems():
+            self.__dict__[key] = fresh_copy(value)
+        self.__fresh_state = fresh
+
     def wipe_delays(self):
+        for items in self.__delayed_names.values():
+            for item in items:
+                item.cancelled = True
         self.__delayed = []
+        self.__delayed_names = {}
+        self.__cancelled = 0
 
     def lamp_update(self):
         print "Lamp Update Called!"
@@ -438,7 +600,7 @@ class EP_Mode(object):
         def __str__(self):
             return '<name=%s event_type=%s delay=%s>' % (self.name, self.event_type, self.delay)
 
-    # Data structure used by the __delayed array:
+    # Data structure used by the __delayed heap:
     class Delayed:
         def __init__(self, name, time, handler, event_type, param):
             self.name = name
@@ -446,6 +608,92 @@ class EP_Mode(object):
             self.handler = handler
             self.event_type = event_type
             self.param = param
+            self.sequence = 0
+            self.cancelled = False
         def __str__(self):
             return '<name=%s time=%s event_type=%s>' % (self.name, self.time, self.event_type)
 
+
+
+class EP_ModeQueue(game.ModeQueue):
+    """Mode queue that only hands switch events to the modes that handle that switch.
+
+    EP_Modes register their switches through add_switch_handler - any other kind
+    of mode still sees every event.  Keeps a running tally of switch dispatch times.
+    """
+    def __init__(self, game, modes=None):
+        super(EP_ModeQueue, self).__init__(game)
+        if modes:
+            self.modes = list(modes)
+        # switch number -> the modes with handlers for it
+        self.switch_index = {}
+        # set to False to hand every event to every mode, for comparing
+        self.indexed = True
+        # batched driver commands get sent at the end of each tick
+        self.driver_queue = None
+        # voice quote scheduler, ticked along with the modes
+        self.voice = None
+        self.reset_latency()
+
+    def index_switch(self, number, mode):
+        if number not in self.switch_index:
+            # weak, so modes thrown away on reset drop out of the index
+            self.switch_index[number] = weakref.WeakSet()
+        self.switch_index[number].add(mode)
+
+    def handle_event(self, event):
+        start = time.time()
+        interested = self.switch_index.get(event['value'], ())
+        # copy, so if a mode gets added we don't get into a loop
+        modes = list(self.modes)
+        for mode in modes:
+            if self.indexed and isinstance(mode, EP_Mode) and mode not in interested:
+                continue
+            if profiler.enabled:
+                mode_start = time.time()
+                handled = mode.handle_event(event)
+                profiler.record(mode.__class__.__name__ + ".handle_event", mode_start)
+            else:
+                handled = mode.handle_event(event)
+            if handled:
+                break
+        elapsed = time.time() - start
+        self.switch_events += 1
+        self.switch_time += elapsed
+        if elapsed > self.switch_time_max:
+            self.switch_time_max = elapsed
+
+    def tick(self):
+        if not profiler.enabled:
+            super(EP_ModeQueue, self).tick()
+        else:
+            # same as the regular tick, but timing each mode
+            modes = list(self.modes)
+            for mode in modes:
+                start = time.time()
+                mode.dispatch_delayed()
+                profiler.record(mode.__class__.__name__ + ".dispatch_delayed", start)
+                start = time.time()
+                mode.mode_tick()
+                profiler.record(mode.__class__.__name__ + ".mode_tick", start)
+        if self.voice:
+            self.voice.tick()
+        # everything the modes asked the drivers for this time through the loop goes out together
+        if self.driver_queue:
+            self.driver_queue.flush()
+
+    def reset_latency(self):
+        self.switch_events = 0
+        self.switch_time = 0.0
+        self.switch_time_max = 0.0
+
+    def latency_report(self):
+        """Returns a line summing up switch dispatch times so far"""
+        if self.switch_events == 0:
+            return "Switch dispatch: no events"
+        average = self.switch_time / self.switch_events * 1000000
+        if self.indexed:
+            method = "indexed"
+        else:
+            method = "all modes"
+        return "Switch dispatch (%s): %d events, avg %.1fus, max %.1fus" % (method, self.switch_events, average, self.switch_time_max * 1000000)
@@ -1662,12 +1662,15 @@ class NewServiceModeUtilities(NewServiceSkeleton):
 
     def mode_started(self):
         self.index = 0
-        self.section = ["CLEAR STD. AUDITS", "CLEAR FEAT. AUDITS", "RESET HIGH SCORES","RESTORE SETTINGS","RESET CUSTOM MSG","RESET SWITCH COUNT","EMPTY TROUGH"]
+        self.section = ["CLEAR STD. AUDITS", "CLEAR FEAT. AUDITS", "RESET HIGH SCORES","RESTORE SETTINGS","RESET CUSTOM MSG","RESET SWITCH COUNT","EMPTY TROUGH","PERFORMANCE"]
         self.update_display("Utilities",str(self.section[self.index]))
 
     def sw_enter_active(self,sw):
         selection = self.section[self.index]
-        mode_to_add = NewServiceModeUtility(game=self.game,priority=202,tool=selection)
+        if selection == "PERFORMANCE":
+            mode_to_add = NewServiceModePerformance(game=self.game,priority=202)
+        else:
+            mode_to_add = NewServiceModeUtility(game=self.game,priority=202,tool=selection)
         self.game.modes.add(mode_to_add)
         return game.SwitchStop
 
@@ -1795,6 +1798,91 @@ class NewServiceModeUtility(NewServiceSkeleton):
         layers.append(instruction_duo)
         self.layer = dmd.GroupedLayer(128,32,layers)
 
+#   ____            __
+#  |  _ \ ___ _ __ / _| ___  _ __ _ __ ___   __ _ _ __   ___ ___
+#  | |_) / _ \ '__| |_ / _ \| '__| '_ ` _ \ / _` | '_ \ / __/ _ \
+#  |  __/  __/ |  |  _| (_) | |  | | | | | | (_| | | | | (_|  __/
+#  |_|   \___|_|  |_|  \___/|_|  |_| |_| |_|\__,_|_| |_|\___\___|
+
+
+class NewServiceModePerformance(NewServiceSkeleton):
+    """Service Mode Performance readout - turn the profiler on and off, save it, and page through the worst offenders."""
+    def __init__(self, game, priority):
+        super(NewServiceModePerformance, self).__init__(game, priority)
+        self.myID = "Service Mode Performance"
+        self.index = 0
+        self.values = []
+
+    def mode_started(self):
+        self.load_stats()
+        self.update_display("Performance",self.section[self.index],self.values[self.index])
+
+    def load_stats(self):
+        # the two actions first, then the stats - most total time first
+        if ep.profiler.enabled:
+            self.section = ["PROFILING IS ON","SAVE REPORT"]
+            self.values = ["'ENTER' TO TURN OFF","'ENTER' TO SAVE"]
+        else:
+            self.section = ["PROFILING IS OFF","SAVE REPORT"]
+            self.values = ["'ENTER' TO TURN ON","'ENTER' TO SAVE"]
+        for stat in ep.profiler.top(20):
+            self.section.append(stat.key.upper())
+            self.values.append("%d X %.2fMS P99 %.2fMS" % (stat.count, stat.average() * 1000, stat.p99() * 1000))
+
+    def sw_enter_active(self,sw):
+        self.game.sound.play(self.game.assets.sfx_menuEnter)
+        if self.index == 0:
+            if ep.profiler.enabled:
+                ep.profiler.disable()
+            else:
+                ep.profiler.clear()
+                ep.profiler.enable(self.game)
+            self.load_stats()
+            self.selectionLine.set_text(self.section[self.index])
+            self.infoLine.set_text(self.values[self.index])
+        elif self.index == 1:
+            ep.profiler.dump()
+            self.infoLine.set_text("SAVED",blink_frames=15)
+        else:
+            # refresh the numbers
+            self.load_stats()
+            if self.index >= len(self.section):
+                self.index = 0
+            self.selectionLine.set_text(self.section[self.index])
+            self.infoLine.set_text(self.values[self.index])
+        return game.SwitchStop
+
+    def item_down(self):
+        self.index -= 1
+        # if we get below zero, loop around
+        if self.index < 0:
+            self.index = (len(self.section) - 1)
+        self.selectionLine.set_text(self.section[self.index])
+        self.infoLine.set_text(self.values[self.index])
+
+    def item_up(self):
+        self.index += 1
+        # if we get too high, go to zero
+        if self.index >= len(self.section):
+            self.index = 0
+        self.selectionLine.set_text(self.section[self.index])
+        self.infoLine.set_text(self.values[self.index])
+
+    # standard display structure - smaller type, the handler names are long
+    def update_display(self,titleString,selectionString,infoString="",blinkInfo = False):
+        layers = []
+        background = dmd.FrameLayer(opaque=True, frame=self.game.assets.dmd_testBackdrop.frames[0])
+        background.set_target_position(0,-4)
+        layers.append(background)
+        self.titleLine = dmd.TextLayer(1,3,self.game.assets.font_5px_AZ_inverted,"Left").set_text(titleString.upper())
+        self.titleLine.composite_op = "blacksrc"
+        layers.append(self.titleLine)
+        self.selectionLine = dmd.TextLayer(64,13,self.game.assets.font_5px_AZ,"center").set_text(selectionString)
+        layers.append(self.selectionLine)
+        self.infoLine = dmd.TextLayer(64,22,self.game.assets.font_5px_AZ,"center").set_text(infoString)
+        layers.append(self.infoLine)
+        self.layer = dmd.GroupedLayer(128,32,layers)
+
 #   _   _           _       _         ____            _   _
 #  | | | |_ __   __| | __ _| |_ ___  / ___|  ___  ___| |_(_) ___  _ __
 #  | | | | '_ \ / _` |/ _` | __/ _ \ \___ \ / _ \/ __| __| |/ _ \| '_ \
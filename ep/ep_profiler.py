@@ -0,0 +1,174 @@
+##   ____           _                ____
+##  / ___|__ _  ___| |_ _   _ ___   / ___|__ _ _ __  _   _  ___  _ __
+## | |   / _` |/ __| __| | | / __| | |   / _` | '_ \| | | |/ _ \| '_ \
+## | |__| (_| | (__| |_| |_| \__ \ | |__| (_| | | | | |_| | (_) | | | |
+##  \____\__,_|\___|\__|\__,_|___/  \____\__,_|_| |_|\__, |\___/|_| |_|
+##                                                   |___/
+##           ___ ___  _  _ _____ ___ _  _ _   _ ___ ___
+##          / __/ _ \| \| |_   _|_ _| \| | | | | __|   \
+##         | (_| (_) | .` | | |  | || .` | |_| | _|| |) |
+##          \___\___/|_|\_| |_| |___|_|\_|\___/|___|___/
+##
+## A P-ROC Project by Eric Priepke, Copyright 2012-2013
+## Built on the PyProcGame Framework from Adam Preble and Gerry Stellenberg
+## Original Cactus Canyon software by Matt Coriale
+##
+##
+## Per mode and per handler timing.  Off by default - when it's off the only cost is
+## checking profiler.enabled in a few places
+##
+
+import time
+import os
+from array import array
+
+__all__ = ['EP_Profiler', 'EP_ProfileStat', 'EP_ProfiledLayer', 'profiler']
+
+curr_file_path = os.path.dirname(os.path.abspath( __file__ ))
+PROFILE_PATH = curr_file_path + "/../cache/profile.txt"
+
+# how many of the most recent times each stat keeps for working out p99
+RING_SIZE = 512
+
+class EP_ProfileStat(object):
+    """Call count and total time for one thing, plus a ring of its most recent times"""
+    __slots__ = ('key', 'count', 'total', 'max', 'ring', 'position')
+
+    def __init__(self, key):
+        self.key = key
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.ring = array('d', [0.0]) * RING_SIZE
+        self.position = 0
+
+    def add(self, elapsed):
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        self.ring[self.position] = elapsed
+        self.position = (self.position + 1) % RING_SIZE
+
+    def average(self):
+        if self.count == 0:
+            return 0.0
+        return self.total / self.count
+
+    def p99(self):
+        samples = sorted(self.ring[:min(self.count, RING_SIZE)])
+        if not samples:
+            return 0.0
+        return samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+    def summary(self):
+        return "%d calls, total %.1fms, avg %.3fms, p99 %.3fms, max %.3fms" % (self.count, self.total * 1000, self.average() * 1000, self.p99() * 1000, self.max * 1000)
+
+class EP_ProfiledLayer(object):
+    """Wraps a mode's layer for one DMD update, to time building its frame"""
+    def __init__(self, layer, key):
+        self.layer = layer
+        self.key = key
+
+    def composite_next(self, target):
+        start = time.time()
+        frame = self.layer.composite_next(target)
+        profiler.record(self.key, start)
+        return frame
+
+    def next_frame(self):
+        start = time.time()
+        frame = self.layer.next_frame()
+        profiler.record(self.key, start)
+        return frame
+
+    def __getattr__(self, attr):
+        return getattr(self.layer, attr)
+
+class EP_Profiler(object):
+    """Collects the timing stats - there's one of these, ``profiler``"""
+    def __init__(self):
+        self.enabled = False
+        self.stats = {}
+        self.started = None
+        self.game = None
+        self.dmd_update = None
+
+    def enable(self, game=None):
+        if self.enabled:
+            return
+        self.enabled = True
+        self.started = time.time()
+        # time each mode's layer by wrapping the display update
+        if game and getattr(game, 'dmd', None):
+            self.game = game
+            self.dmd_update = game.dmd.update
+            game.dmd.update = self.profiled_dmd_update
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        if self.game:
+            # drop the instance override, back to the class method
+            del self.game.dmd.update
+            self.game = None
+            self.dmd_update = None
+
+    def clear(self):
+        self.stats = {}
+        self.started = time.time()
+
+    def record(self, key, start):
+        """Adds the time since ``start`` to the stat for ``key``"""
+        elapsed = time.time() - start
+        stat = self.stats.get(key)
+        if stat == None:
+            stat = self.stats[key] = EP_ProfileStat(key)
+        stat.add(elapsed)
+
+    def handler_key(self, mode, handler):
+        return mode.__class__.__name__ + "." + getattr(handler, '__name__', 'handler')
+
+    def profiled_dmd_update(self):
+        start = time.time()
+        swapped = []
+        for mode in self.game.modes.modes:
+            layer = getattr(mode, 'layer', None)
+            if layer != None:
+                mode.layer = EP_ProfiledLayer(layer, mode.__class__.__name__ + ".layer")
+                swapped.append((mode, mode.layer, layer))
+        try:
+            self.dmd_update()
+        finally:
+            for mode, wrapper, layer in swapped:
+                # leave it alone if the mode swapped its layer during the update
+                if mode.layer is wrapper:
+                    mode.layer = layer
+        self.record("DMD.update", start)
+
+    def top(self, count=20):
+        """Returns the stats that took the most total time, biggest first"""
+        stats = sorted(self.stats.values(), key=lambda stat: stat.total, reverse=True)
+        return stats[:count]
+
+    def report(self):
+        lines = []
+        if self.started:
+            lines.append("Profile over %.1f seconds" % (time.time() - self.started))
+        for stat in self.top(len(self.stats)):
+            lines.append("%-50s %s" % (stat.key, stat.summary()))
+        return lines
+
+    def dump(self, filename=PROFILE_PATH):
+        """Writes the report to a file, returns the file name"""
+        profile_dir = os.path.dirname(filename)
+        if not os.path.isdir(profile_dir):
+            os.makedirs(profile_dir)
+        f = open(filename, 'w')
+        f.write("\n".join(self.report()) + "\n")
+        f.close()
+        print "Profile saved to " + filename
+        return filename
+
+profiler = EP_Profiler()
@@ -0,0 +1,122 @@
+##   ____           _                ____
+##  / ___|__ _  ___| |_ _   _ ___   / ___|__ _ _ __  _   _  ___  _ __
+## | |   / _` |/ __| __| | | / __| | |   / _` | '_ \| | | |/ _ \| '_ \
+## | |__| (_| | (__| |_| |_| \__ \ | |__| (_| | | | | |_| | (_) | | | |
+##  \____\__,_|\___|\__|\__,_|___/  \____\__,_|_| |_|\__, |\___/|_| |_|
+##                                                   |___/
+##           ___ ___  _  _ _____ ___ _  _ _   _ ___ ___
+##          / __/ _ \| \| |_   _|_ _| \| | | | | __|   \
+##         | (_| (_) | .` | | |  | || .` | |_| | _|| |) |
+##          \___\___/|_|\_| |_| |___|_|\_|\___/|___|___/
+##
+## A P-ROC Project by Eric Priepke, Copyright 2012-2013
+## Built on the PyProcGame Framework from Adam Preble and Gerry Stellenberg
+## Original Cactus Canyon software by Matt Coriale
+##
+##
+## Switch event recording and playback - record a game on the real machine or the desktop,
+## then feed it back through fakepinproc to get the same game again
+##
+## Log format is one line per switch event - seconds since the start, event type, switch number
+## The first line has the random seed the game ran with
+##
+
+import time
+import ep_clock
+
+# switch event types - closed/open, debounced and not
+SWITCH_EVENTS = (1, 2, 3, 4)
+
+class EP_SwitchRecorder(object):
+    """Writes every switch event to a log file"""
+    def __init__(self, filename, seed):
+        self.filename = filename
+        self.file = open(filename, 'w')
+        self.file.write("seed %d\n" % seed)
+        self.start = time.time()
+        self.count = 0
+
+    def record(self, event):
+        if event['type'] in SWITCH_EVENTS:
+            self.file.write("%.4f %d %d\n" % (time.time() - self.start, event['type'], event['value']))
+            self.count += 1
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+            print "Recorded " + str(self.count) + " switch events to " + self.filename
+
+class EP_SwitchPlayback(object):
+    """Reads a switch log and hands the events back out when their time comes around.
+
+    ``speed`` above 1 plays the log back faster than it was recorded.
+    """
+    def __init__(self, filename, speed=1.0):
+        self.filename = filename
+        self.speed = float(speed)
+        self.seed = None
+        self.events = []
+        f = open(filename, 'r')
+        for line in f.readlines():
+            parts = line.split()
+            if not parts:
+                continue
+            if parts[0] == 'seed':
+                self.seed = int(parts[1])
+            else:
+                self.events.append((float(parts[0]), int(parts[1]), int(parts[2])))
+        f.close()
+        self.index = 0
+        self.start = None
+        # loop timing, to compare builds against each other
+        self.last_tick = None
+        self.ticks = 0
+        self.tick_time = 0.0
+        self.tick_max = 0.0
+
+    def elapsed(self):
+        """Seconds into the log - scaled by the playback speed"""
+        if self.start == None:
+            self.start = ep_clock.now()
+        return (ep_clock.now() - self.start) * self.speed
+
+    def get_events(self):
+        """Returns the events that are due, in the same form pinproc hands them over"""
+        now = self.elapsed()
+        events = []
+        while self.index < len(self.events) and self.events[self.index][0] <= now:
+            stamp, event_type, number = self.events[self.index]
+            events.append({'type':event_type, 'value':number})
+            self.index += 1
+        return events
+
+    def rewind(self):
+        """Start the log over from the top"""
+        self.index = 0
+        self.start = None
+
+    def is_complete(self, grace=5.0):
+        """True once every event is out, and the game has had ``grace`` seconds to settle after the last one"""
+        if self.index < len(self.events):
+            return False
+        if self.events:
+            return self.elapsed() > self.events[-1][0] + grace
+        return True
+
+    def tick(self):
+        now = time.time()
+        if self.last_tick != None:
+            interval = now - self.last_tick
+            self.ticks += 1
+            self.tick_time += interval
+            if interval > self.tick_max:
+                self.tick_max = interval
+        self.last_tick = now
+
+    def report(self):
+        if self.ticks == 0:
+            average = 0
+        else:
+            average = self.tick_time / self.ticks * 1000
+        return "Playback of %s: %d of %d events at %.1fx, %d loops, avg %.2fms, max %.2fms" % (self.filename, self.index, len(self.events), self.speed, self.ticks, average, self.tick_max * 1000)
@@ -0,0 +1,103 @@
+##   ____           _                ____
+##  / ___|__ _  ___| |_ _   _ ___   / ___|__ _ _ __  _   _  ___  _ __
+## | |   / _` |/ __| __| | | / __| | |   / _` | '_ \| | | |/ _ \| '_ \
+## | |__| (_| | (__| |_| |_| \__ \ | |__| (_| | | | | |_| | (_) | | | |
+##  \____\__,_|\___|\__|\__,_|___/  \____\__,_|_| |_|\__, |\___/|_| |_|
+##                                                   |___/
+##           ___ ___  _  _ _____ ___ _  _ _   _ ___ ___
+##          / __/ _ \| \| |_   _|_ _| \| | | | | __|   \
+##         | (_| (_) | .` | | |  | || .` | |_| | _|| |) |
+##          \___\___/|_|\_| |_| |___|_|\_|\___/|___|___/
+##
+## A P-ROC Project by Eric Priepke, Copyright 2012-2013
+## Built on the PyProcGame Framework from Adam Preble and Gerry Stellenberg
+## Original Cactus Canyon software by Matt Coriale
+##
+##
+## Writes the settings and game data yaml files off the game loop.  A save takes a copy
+## of the data and hands it to a writer thread - if more saves of the same file come in
+## before it gets written, only the last one hits the SD card
+##
+
+import os
+import copy
+import time
+import threading
+import yaml
+
+def write_yaml(filename, data):
+    """Dumps data to a temp file next to filename, then moves it into place - the file is never half written"""
+    temp_filename = filename + ".tmp"
+    stream = open(temp_filename, 'w')
+    yaml.dump(data, stream)
+    stream.flush()
+    os.fsync(stream.fileno())
+    stream.close()
+    os.rename(temp_filename, filename)
+
+class EP_SaveWriter(object):
+    """Background writer for yaml files"""
+    def __init__(self, coalesce=0.5):
+        # how long to wait for more saves before writing
+        self.coalesce = coalesce
+        self.pending = {}
+        self.writing = False
+        # set by flush, to skip the wait for more saves
+        self.hurry = False
+        self.condition = threading.Condition()
+        self.saves = 0
+        self.writes = 0
+        self.thread = threading.Thread(target=self.run, name="Save Writer")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def save(self, filename, data):
+        """Queues a copy of data to be written to filename"""
+        snapshot = copy.deepcopy(data)
+        self.condition.acquire()
+        self.pending[filename] = snapshot
+        self.saves += 1
+        self.condition.notify_all()
+        self.condition.release()
+
+    def run(self):
+        while True:
+            self.condition.acquire()
+            while not self.pending:
+                self.condition.wait()
+            # give any burst of saves a moment to finish - unless somebody is waiting on a flush
+            deadline = time.time() + self.coalesce
+            while not self.hurry and time.time() < deadline:
+                self.condition.wait(deadline - time.time())
+            pending = self.pending
+            self.pending = {}
+            self.writing = True
+            self.hurry = False
+            self.condition.release()
+            for filename, data in pending.iteritems():
+                try:
+                    write_yaml(filename, data)
+                    self.writes += 1
+                except Exception, e:
+                    print "Save of " + filename + " failed: " + str(e)
+            self.condition.acquire()
+            self.writing = False
+            self.condition.notify_all()
+            self.condition.release()
+
+    def flush(self, timeout=10.0):
+        """Waits for everything queued to be written - returns False if it ran out of time"""
+        end = time.time() + timeout
+        self.condition.acquire()
+        try:
+            self.hurry = True
+            self.condition.notify_all()
+            while self.pending or self.writing:
+                remaining = end - time.time()
+                if remaining <= 0:
+                    return False
+                self.condition.wait(remaining)
+            return True
+        finally:
+            self.hurry = False
+            self.condition.release()
@@ -18,6 +18,7 @@
 from procgame import *
 #import ep
 import os
+from ep_font import text_cache
 
 curr_file_path = os.path.dirname(os.path.abspath( __file__ ))
 DMD_PATH = curr_file_path + "/../dmd/"
@@ -55,46 +56,51 @@ class EP_Showcase(object):
 
 
     def make_string(self,ll,ur,fill,x=64,y=0,align="center",isOpaque=False,text="",isTransparent=False,condensed=False):
-        #print "MY TEXT: " + text
-        #print "ALIGN: " + str(align)
+        # outline and fill all drawn into one frame, instead of three text layers composited every frame
+        tracking = 0
         if condensed:
-            self.LL_FONT[ll].tracking = -1
-            self.UR_FONT[ur].tracking = -1
-            self.FILL_FONT[fill].tracking = -1
-        lowerLeftLayer = dmd.TextLayer(x, y, self.LL_FONT[ll], align, opaque=False).set_text(text)
-        lowerLeftLayer.composite_op = "blacksrc"
-        upperRightLayer = dmd.TextLayer(x,y, self.UR_FONT[ur], align, opaque=False).set_text(text)
-        upperRightLayer.composite_op = "blacksrc"
-        fillLayer = dmd.TextLayer(x, y, self.FILL_FONT[fill], align, opaque=False).set_text(text)
-        fillLayer.composite_op="blacksrc"
-        myLayer = dmd.GroupedLayer(128,32,[lowerLeftLayer,upperRightLayer,fillLayer])
-        myLayer.opaque = isOpaque
+            tracking = -1
+        frame = self.render([self.LL_FONT[ll],self.UR_FONT[ur],self.FILL_FONT[fill]],x,y,align,text,tracking)
+        myLayer = dmd.FrameLayer(opaque=isOpaque, frame=frame)
         if isTransparent:
             myLayer.composite_op = "blacksrc"
-        # reset the tracking if we shifted it ?
-        if condensed:
-            self.LL_FONT[ll].tracking = 0
-            self.UR_FONT[ur].tracking = 0
-            self.FILL_FONT[fill].tracking = 0
         return myLayer
 
     def make_thin_string(self,fill,x=64,y=0,align="center",isOpaque=False,text="",isTransparent=False,condensed=False):
         # set the spacing
-        self.FILL_FONT[fill].tracking = -2
+        tracking = -2
         # if condensed, make it even bigger
         if condensed:
-            self.FILL_FONT[fill].tracking = -3
-        # make the string
-        myLayer = dmd.TextLayer(x, y, self.FILL_FONT[fill], align, opaque=False).set_text(text)
-        # unset the tracking
-        self.FILL_FONT[fill].tracking = 0
+            tracking = -3
+        # make the string - just the text, placed where a text layer would put it
+        font = self.FILL_FONT[fill]
+        run, advance, overhang = text_cache.run(font, text, 0, font.composite_op, tracking)
+        myLayer = dmd.FrameLayer(opaque=isOpaque, frame=run)
+        if run != None:
+            myLayer.set_target_position(x + self.align_offset(align,advance - tracking), y)
         if isTransparent:
             myLayer.composite_op = "blacksrc"
-        # set the opaque as requested
-        myLayer.opaque = isOpaque
         # return the layer
         return myLayer
 
+    def render(self,fonts,x,y,align,text,tracking):
+        """Draws the text in each font in turn, lined up the way a text layer would, onto one 128x32 frame"""
+        frame = dmd.Frame(128,32)
+        for font in fonts:
+            run, advance, overhang = text_cache.run(font, text, 0, font.composite_op, tracking)
+            if run == None:
+                continue
+            dmd.Frame.copy_rect(dst=frame, dst_x=x+self.align_offset(align,advance - tracking), dst_y=y, src=run, src_x=0, src_y=0, width=run.width, height=run.height, op="blacksrc")
+        return frame
+
+    def align_offset(self,align,width):
+        # same as a text layer lines up its text - width being what font.size would say
+        if align == "right":
+            return -width
+        elif align == "center":
+            return -width/2
+        return 0
+
     def chase_outline(self,outline_start,outline_fin,fill,speed,x=64,y=0,align="center",isOpaque=False,text="",isTransparent=False,condensed=False,hold=0):
         # emtpy script
         script = []
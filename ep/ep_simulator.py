@@ -0,0 +1,66 @@
+##   ____           _                ____
+##  / ___|__ _  ___| |_ _   _ ___   / ___|__ _ _ __  _   _  ___  _ __
+## | |   / _` |/ __| __| | | / __| | |   / _` | '_ \| | | |/ _ \| '_ \
+## | |__| (_| | (__| |_| |_| \__ \ | |__| (_| | | | | |_| | (_) | | | |
+##  \____\__,_|\___|\__|\__,_|___/  \____\__,_|_| |_|\__, |\___/|_| |_|
+##                                                   |___/
+##           ___ ___  _  _ _____ ___ _  _ _   _ ___ ___
+##          / __/ _ \| \| |_   _|_ _| \| | | | | __|   \
+##         | (_| (_) | .` | | |  | || .` | |_| | _|| |) |
+##          \___\___/|_|\_| |_| |___|_|\_|\___/|___|___/
+##
+## A P-ROC Project by Eric Priepke, Copyright 2012-2013
+## Built on the PyProcGame Framework from Adam Preble and Gerry Stellenberg
+## Original Cactus Canyon software by Matt Coriale
+##
+##
+## Headless simulator - no window, no sound, and a virtual clock that moves one DMD frame
+## every time through the run loop, so games go by as fast as the CPU can manage
+##
+
+import time
+import pinproc
+import ep_clock
+
+class EP_NullDesktop(object):
+    """Stands in for the desktop when there's no window - takes any call and does nothing"""
+    def get_keyboard_events(self):
+        return []
+
+    def draw(self, frame):
+        pass
+
+    def __getattr__(self, attr):
+        return self.ignore
+
+    def ignore(self, *args, **kwargs):
+        pass
+
+class EP_Simulator(object):
+    """Drives the game on a virtual clock.
+
+    Every pass through the run loop moves the clock ``step`` seconds and hands the game one DMD
+    frame event - fakepinproc's own frame events run on the wall clock, so those get dropped.
+    Delays still come due in order, they just don't wait around for it.
+    """
+    def __init__(self, step=1/60.0):
+        self.step = step
+        self.clock = ep_clock.EP_VirtualClock()
+        ep_clock.set_clock(self.clock)
+        self.virtual_start = self.clock.time()
+        self.wall_start = time.time()
+        self.loops = 0
+        self.switch_events = 0
+
+    def next_events(self, events):
+        self.clock.advance(self.step)
+        self.loops += 1
+        events = [event for event in events if event['type'] != pinproc.EventTypeDMDFrameDisplayed]
+        self.switch_events += len(events)
+        events.append({'type':pinproc.EventTypeDMDFrameDisplayed, 'value':0})
+        return events
+
+    def report(self):
+        wall = max(time.time() - self.wall_start, 0.000001)
+        virtual = self.clock.time() - self.virtual_start
+        return "Simulated %.1fs in %.1fs (%.1fx) - %d loops, %.0f loops/s, %.0f switch events/s" % (virtual, wall, virtual / wall, self.loops, self.loops / wall, self.switch_events / wall)
@@ -0,0 +1,216 @@
+##   ____           _                ____
+##  / ___|__ _  ___| |_ _   _ ___   / ___|__ _ _ __  _   _  ___  _ __
+## | |   / _` |/ __| __| | | / __| | |   / _` | '_ \| | | |/ _ \| '_ \
+## | |__| (_| | (__| |_| |_| \__ \ | |__| (_| | | | | |_| | (_) | | | |
+##  \____\__,_|\___|\__|\__,_|___/  \____\__,_|_| |_|\__, |\___/|_| |_|
+##                                                   |___/
+##           ___ ___  _  _ _____ ___ _  _ _   _ ___ ___
+##          / __/ _ \| \| |_   _|_ _| \| | | | | __|   \
+##         | (_| (_) | .` | | |  | || .` | |_| | _|| |) |
+##          \___\___/|_|\_| |_| |___|_|\_|\___/|___|___/
+##
+## A P-ROC Project by Eric Priepke, Copyright 2012-2013
+## Built on the PyProcGame Framework from Adam Preble and Gerry Stellenberg
+## Original Cactus Canyon software by Matt Coriale
+##
+##
+##
+## Lazy sound bank - registering a sound just notes the file, it gets decoded the first time
+## it plays.  Decoded sounds are kept up to a memory budget, least recently played go first,
+## but never one that's still playing or one that's been pinned
+##
+
+import os
+import time
+import wave
+import logging
+import collections
+import pygame
+from procgame import sound
+
+__all__ = ['EP_LazySound', 'EP_SoundBank', 'EP_SoundController']
+
+class EP_LazySound(object):
+    """Stands in for a pygame Sound in the sounds lists - decodes its file on first play"""
+    __slots__ = ('bank', 'path', 'length', 'sound', 'volume')
+
+    def __init__(self, bank, path):
+        self.bank = bank
+        self.path = path
+        # seconds, read from the file header the first time somebody asks
+        self.length = None
+        # the decoded pygame Sound, when it's loaded
+        self.sound = None
+        # volume set on this sound - None goes with the bank's
+        self.volume = None
+
+    def play(self, loops=0, maxtime=0, fade_ms=0):
+        return self.bank.load(self).play(loops, maxtime, fade_ms)
+
+    def get_length(self):
+        if self.length == None:
+            self.length = self.bank.length_of(self)
+        return self.length
+
+    def stop(self):
+        if self.sound:
+            self.sound.stop()
+
+    def fadeout(self, time):
+        if self.sound:
+            self.sound.fadeout(time)
+
+    def set_volume(self, volume):
+        # just remember it - the sound gets it when it's decoded
+        self.volume = volume
+        if self.sound:
+            self.sound.set_volume(volume)
+
+    def get_volume(self):
+        if self.volume == None:
+            return self.bank.volume
+        return self.volume
+
+    def get_num_channels(self):
+        if self.sound:
+            return self.sound.get_num_channels()
+        return 0
+
+    def __getattr__(self, attr):
+        # anything else needs the real sound
+        return getattr(self.bank.load(self), attr)
+
+class EP_SoundBank(object):
+    """The decoded sounds, most recently played last, kept under a byte budget"""
+    def __init__(self, budget):
+        self.budget = budget
+        # volume for sounds that haven't had their own set
+        self.volume = 1.0
+        self.cache = collections.OrderedDict()
+        self.sizes = {}
+        self.pinned = set()
+        self.bytes = 0
+        self.hits = 0
+        self.decodes = 0
+        self.decode_time = 0.0
+        self.evictions = 0
+        self.header_reads = 0
+
+    def load(self, lazy):
+        """Returns the decoded sound for a lazy sound, decoding it if need be"""
+        if lazy.sound != None:
+            # bump it to the most recently used end
+            self.cache.pop(lazy.path, None)
+            self.cache[lazy.path] = lazy
+            self.hits += 1
+            return lazy.sound
+        start = time.time()
+        lazy.sound = pygame.mixer.Sound(lazy.path)
+        lazy.sound.set_volume(lazy.get_volume())
+        self.decode_time += time.time() - start
+        self.decodes += 1
+        if lazy.length == None:
+            lazy.length = lazy.sound.get_length()
+        size = self.size_of(lazy.sound)
+        self.cache[lazy.path] = lazy
+        self.sizes[lazy.path] = size
+        self.bytes += size
+        self.trim(lazy)
+        return lazy.sound
+
+    def size_of(self, decoded):
+        # decoded sounds are stored in the mixer's format
+        init = pygame.mixer.get_init()
+        if not init:
+            return 0
+        frequency, format, channels = init
+        return int(decoded.get_length() * frequency * channels * abs(format) / 8)
+
+    def trim(self, keep=None):
+        # drop the oldest sounds until we're under budget - skipping pinned ones, anything still
+        # playing, and the one that's about to play
+        if self.bytes <= self.budget:
+            return
+        for path in self.cache.keys():
+            if self.bytes <= self.budget:
+                break
+            lazy = self.cache[path]
+            if lazy is keep or path in self.pinned or lazy.sound.get_num_channels() > 0:
+                continue
+            del self.cache[path]
+            lazy.sound = None
+            self.bytes -= self.sizes.pop(path)
+            self.evictions += 1
+
+    def length_of(self, lazy):
+        """Length in seconds from the wav header, so asking doesn't mean decoding"""
+        if lazy.sound != None:
+            return lazy.sound.get_length()
+        try:
+            header = wave.open(lazy.path, 'rb')
+            try:
+                length = header.getnframes() / float(header.getframerate())
+            finally:
+                header.close()
+            self.header_reads += 1
+            return length
+        except (wave.Error, EOFError, IOError):
+            # not a plain wav - have to decode it to find out
+            return self.load(lazy).get_length()
+
+    def pin(self, lazy):
+        """Decodes a sound now and keeps it loaded for good"""
+        self.pinned.add(lazy.path)
+        self.load(lazy)
+
+    def report(self):
+        lines = []
+        lines.append("Sounds: %d decoded, %d pinned, %d KB of %d KB budget" % (len(self.cache), len(self.pinned), self.bytes / 1024, self.budget / 1024))
+        lines.append("Decodes: %d (%.1f ms) Hits: %d Evictions: %d Header reads: %d" % (self.decodes, self.decode_time * 1000, self.hits, self.evictions, self.header_reads))
+        return lines
+
+class EP_SoundController(sound.SoundController):
+    """Sound controller that registers lazy sounds instead of decoding everything at boot"""
+    def __init__(self, delegate, budget):
+        super(EP_SoundController, self).__init__(delegate)
+        self.bank = EP_SoundBank(budget)
+        self.bank.volume = getattr(self, 'volume', 1.0)
+        # one lazy sound per file - the same quote can be registered under a few keys,
+        # and the bank keeps track of them by file
+        self.lazy_sounds = {}
+        self.sound_logger = logging.getLogger('game.sound')
+
+    def register_sound(self, key, sound_file):
+        self.sound_logger.info("Registering sound - key: %s, file: %s", key, sound_file)
+        if not self.enabled:
+            return
+        if not os.path.isfile(sound_file):
+            self.sound_logger.error("Sound file not found: %s", sound_file)
+            return
+        sound_file = str(sound_file)
+        sounds = self.sounds.setdefault(key, [])
+        for lazy in sounds:
+            if lazy.path == sound_file:
+                return
+        lazy = self.lazy_sounds.get(sound_file)
+        if lazy == None:
+            lazy = self.lazy_sounds[sound_file] = EP_LazySound(self.bank, sound_file)
+        sounds.append(lazy)
+
+    def set_volume(self, new_volume):
+        # the lazy sounds only pass it on to the ones that are decoded - nothing gets loaded for this
+        self.bank.volume = new_volume
+        super(EP_SoundController, self).set_volume(new_volume)
+
+    def pin(self, keys):
+        """Keeps every sound under the given keys decoded - for the ones that play all the time"""
+        if not self.enabled:
+            return
+        for key in keys:
+            for lazy in self.sounds.get(key, []):
+                self.bank.pin(lazy)
+
+    def report(self):
+        lines = ["Sound keys: %d registered, %d files" % (len(self.sounds), len(self.lazy_sounds))]
+        lines += self.bank.report()
+        return lines
@@ -22,6 +22,20 @@
 from procgame import dmd
 import ep
 import sys
+import time
+
+# blank data for clearing the transition buffers
+BLANK_FRAME = chr(0) * (128 * 32)
+
+class EP_TransitionLayer(dmd.Layer):
+    """The layer a transition is shown through.  Made once per transition - each frame it
+    just asks the transition for the next one."""
+    def __init__(self, transition):
+        super(EP_TransitionLayer, self).__init__(False)
+        self.transition = transition
+
+    def next_frame(self):
+        return self.transition.update()
 
 class EP_Transition(object):
 
@@ -49,6 +63,10 @@ class EP_Transition(object):
         self.layerB = layerB
         self.callback = callback
 
+        # the two layers get drawn into these every frame, instead of into new ones
+        self.bufferA = dmd.Frame(128,32)
+        self.bufferB = dmd.Frame(128,32)
+
         transition_class = self.get_class("procgame.dmd.transitions." + transitionType)
         if transitionParameter:
             self.transition = transition_class(transitionParameter)
@@ -58,7 +76,9 @@ class EP_Transition(object):
         self.transition.completed_handler = self.finished
         self.transition.start()
 
-        self.update()
+        self.layer = EP_TransitionLayer(self)
+        self.layer.composite_op = self.layerB.composite_op
+        self.mode.layer = self.layer
 
     def get_class(self, class_path):
         paths = class_path.split('.')
@@ -67,18 +87,16 @@ class EP_Transition(object):
         return getattr(sys.modules[modulename], classname)
 
     def update(self):
-        #Wrapping the layers in group layers, to maintain the positioning of text layers
-        layer_A_wrapped = dmd.GroupedLayer(128, 32, [self.layerA])
-        layer_A_wrapped.composite_op = self.layerA.composite_op
-        layer_B_wrapped = dmd.GroupedLayer(128, 32, [self.layerB])
-        layer_B_wrapped.composite_op = self.layerB.composite_op
-
-        layers = [
-            dmd.FrameLayer(False,self.transition.next_frame(layer_A_wrapped.next_frame(),layer_B_wrapped.next_frame())),
-            ep.EP_UpdateLayer(self.update)
-        ]
-        self.mode.layer = dmd.GroupedLayer(128, 32, layers)
-        self.mode.layer.composite_op = self.layerB.composite_op
+        """Advances the transition and returns the frame to show"""
+        return self.transition.next_frame(self.draw_layer(self.layerA, self.bufferA), self.draw_layer(self.layerB, self.bufferB))
+
+    def draw_layer(self, layer, buffer):
+        # Same as wrapping the layer in a group layer, to maintain the positioning of text layers,
+        # but it draws into our own buffer
+        buffer.set_data(BLANK_FRAME)
+        if layer.enabled and layer.composite_next(buffer) != None:
+            return buffer
+        return None
 
     def finished(self):
         # The transition keeps calling the completed_handler, which we probably don't want, so we clear the reference
@@ -88,4 +106,41 @@ class EP_Transition(object):
         self.mode.layer = self.layerB
 
         if self.callback:
-            self.callback()
\ No newline at end of file
+            self.callback()
+
+def grouped_transition_frame(transition, layerA, layerB):
+    # how transitions used to make each frame - a new set of wrapper layers every time.  Kept for benchmark()
+    layer_A_wrapped = dmd.GroupedLayer(128, 32, [layerA])
+    layer_A_wrapped.composite_op = layerA.composite_op
+    layer_B_wrapped = dmd.GroupedLayer(128, 32, [layerB])
+    layer_B_wrapped.composite_op = layerB.composite_op
+    layers = [
+        dmd.FrameLayer(False,transition.next_frame(layer_A_wrapped.next_frame(),layer_B_wrapped.next_frame())),
+        ep.EP_UpdateLayer(None)
+    ]
+    layer = dmd.GroupedLayer(128, 32, layers)
+    layer.composite_op = layerB.composite_op
+    return layer.next_frame()
+
+def benchmark(frames=2000, transitionType=EP_Transition.TYPE_PUSH, transitionParameter=EP_Transition.PARAM_NORTH):
+    """Times the old per frame layer building against the reusable transition layer, returns frames per second for each"""
+    class Holder(object):
+        layer = None
+    layerA = dmd.FrameLayer(False,dmd.Frame(128,32))
+    layerB = dmd.FrameLayer(False,dmd.Frame(128,32))
+    # long enough that the transition is still running for the whole test
+    transition = EP_Transition(Holder(), layerA, layerB, transitionType, transitionParameter, lengthInFrames=frames * 2)
+    start = time.time()
+    for i in range(frames):
+        grouped_transition_frame(transition.transition, layerA, layerB)
+    old_fps = frames / max(time.time() - start, 0.000001)
+    transition.transition.progress = 0.0
+    start = time.time()
+    for i in range(frames):
+        transition.layer.next_frame()
+    new_fps = frames / max(time.time() - start, 0.000001)
+    print "Transition frames per second - old: %.0f new: %.0f" % (old_fps, new_fps)
+    return old_fps, new_fps
+
+if __name__ == '__main__':
+    benchmark()
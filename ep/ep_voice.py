@@ -0,0 +1,188 @@
+##   ____           _                ____
+##  / ___|__ _  ___| |_ _   _ ___   / ___|__ _ _ __  _   _  ___  _ __
+## | |   / _` |/ __| __| | | / __| | |   / _` | '_ \| | | |/ _ \| '_ \
+## | |__| (_| | (__| |_| |_| \__ \ | |__| (_| | | | | |_| | (_) | | | |
+##  \____\__,_|\___|\__|\__,_|___/  \____\__,_|_| |_|\__, |\___/|_| |_|
+##                                                   |___/
+##           ___ ___  _  _ _____ ___ _  _ _   _ ___ ___
+##          / __/ _ \| \| |_   _|_ _| \| | | | | __|   \
+##         | (_| (_) | .` | | |  | || .` | |_| | _|| |) |
+##          \___\___/|_|\_| |_| |___|_|\_|\___/|___|___/
+##
+## A P-ROC Project by Eric Priepke, Copyright 2012-2013
+## Built on the PyProcGame Framework from Adam Preble and Gerry Stellenberg
+## Original Cactus Canyon software by Matt Coriale
+##
+##
+##
+## Voice quote scheduler - one voice at a time on its own mixer channel.  Quotes that come in
+## while the voice is busy wait in a short queue by priority, and get dropped if they go stale.
+## Also owns the music squelch, with one restore time instead of a delay per quote
+##
+
+import sys
+import random
+import pygame
+from ep_clock import now
+from ep_sound import EP_LazySound
+
+__all__ = ['EP_VoiceScheduler', 'VOICE_NORMAL', 'VOICE_OVERRIDE', 'VOICE_PRIORITY']
+
+# regular quotes wait their turn, override quotes cut in, priority quotes cut in and can't be cut
+VOICE_NORMAL = 1
+VOICE_OVERRIDE = 2
+VOICE_PRIORITY = 3
+
+# most quotes that can be waiting at once
+QUEUE_SIZE = 4
+
+class EP_VoiceRequest(object):
+    __slots__ = ('key', 'priority', 'expires', 'loops', 'max_time', 'fade_ms', 'squelch', 'nr', 'caller')
+
+    def __init__(self, key, priority, expires, loops, max_time, fade_ms, squelch, nr, caller):
+        self.key = key
+        self.priority = priority
+        self.expires = expires
+        self.loops = loops
+        self.max_time = max_time
+        self.fade_ms = fade_ms
+        self.squelch = squelch
+        self.nr = nr
+        self.caller = caller
+
+class EP_VoiceScheduler(object):
+    """Plays voice quotes one at a time - ticked by the mode queue"""
+    def __init__(self, game, wait=1.0, channel=True):
+        self.game = game
+        # how long a quote can sit in the queue before it's too late to say it
+        self.wait = wait
+        self.queue = []
+        self.current = None
+        self.current_priority = 0
+        self.end_time = 0
+        # when to put the music volume back, 0 if it's not squelched by us
+        self.restore_time = 0
+        self.channel = None
+        if channel and self.game.sound.enabled and pygame.mixer.get_init():
+            # add a channel and keep it for the voice, so the effects can't take it over.  Counted
+            # here, since set_reserved only says how many it got from pygame 2 on
+            pygame.mixer.set_num_channels(pygame.mixer.get_num_channels() + 1)
+            pygame.mixer.set_reserved(1)
+            self.channel = pygame.mixer.Channel(0)
+        # mode name -> [queued, dropped, played]
+        self.stats = {}
+
+    def caller_name(self):
+        # the mode that asked - the first frame up from play that isn't one of the base quote helpers
+        frame = sys._getframe(2)
+        while frame.f_back != None and frame.f_code.co_name in ('play_quote', 'priority_quote'):
+            frame = frame.f_back
+        mode = frame.f_locals.get('self')
+        if mode == None:
+            return frame.f_code.co_name
+        return mode.__class__.__name__
+
+    def count(self, caller, column):
+        counts = self.stats.get(caller)
+        if counts == None:
+            counts = self.stats[caller] = [0, 0, 0]
+        counts[column] += 1
+
+    def busy(self, current_time):
+        return self.current != None and current_time < self.end_time
+
+    def play(self, key, priority=VOICE_NORMAL, loops=0, max_time=0, fade_ms=0, squelch=False, nr=999):
+        """Plays the quote now, queues it, or drops it - returns the duration if it played now, otherwise 0"""
+        if not self.game.sound.enabled or key not in self.game.sound.sounds:
+            return 0
+        caller = self.caller_name()
+        current_time = now()
+        if self.busy(current_time) and (priority == VOICE_NORMAL or priority < self.current_priority):
+            request = EP_VoiceRequest(key, priority, current_time + self.wait, loops, max_time, fade_ms, squelch, nr, caller)
+            self.enqueue(request)
+            return 0
+        return self.start(key, priority, loops, max_time, fade_ms, squelch, nr, caller, current_time)
+
+    def enqueue(self, request):
+        if self.wait <= 0:
+            self.count(request.caller, 1)
+            return
+        self.count(request.caller, 0)
+        self.queue.append(request)
+        if len(self.queue) > QUEUE_SIZE:
+            # full up - lose the least important, oldest first
+            loser = min(self.queue, key=lambda item: (item.priority, -item.expires))
+            self.queue.remove(loser)
+            self.count(loser.caller, 1)
+
+    def start(self, key, priority, loops, max_time, fade_ms, squelch, nr, caller, current_time):
+        sounds = self.game.sound.sounds[key]
+        # allow the code to pick specific items out of batches of quotes if specified
+        if nr != 999:
+            n = nr
+        elif len(sounds) > 0:
+            n = random.randrange(len(sounds))
+        else:
+            n = 0
+        quote = sounds[n]
+        if self.channel:
+            if isinstance(quote, EP_LazySound):
+                quote = quote.bank.load(quote)
+            self.channel.play(quote, loops, max_time, fade_ms)
+        else:
+            if self.busy(current_time):
+                self.current.stop()
+            quote.play(loops, max_time, fade_ms)
+        duration = quote.get_length() * (loops + 1)
+        self.current = quote
+        self.current_priority = priority
+        self.end_time = current_time + duration
+        if squelch:
+            self.game.squelch_music()
+            self.restore_time = self.end_time + 0.2
+        self.count(caller, 2)
+        return duration
+
+    def stop(self):
+        """Cuts off the current quote"""
+        if self.current != None:
+            if self.channel:
+                self.channel.stop()
+            else:
+                self.current.stop()
+            self.current = None
+            self.end_time = 0
+
+    def clear(self):
+        """Stops the voice and forgets anything waiting - for tilts and resets"""
+        self.stop()
+        self.queue = []
+        self.current_priority = 0
+        # and the music comes back up now, instead of when the quote would have ended
+        if self.restore_time:
+            self.restore_time = 0
+            self.game.restore_music()
+
+    def tick(self):
+        if not self.queue and not self.restore_time:
+            return
+        current_time = now()
+        if self.restore_time and current_time >= self.restore_time:
+            self.restore_time = 0
+            self.game.restore_music()
+        if self.queue and not self.busy(current_time):
+            # drop the ones that waited too long, then say the most important one left
+            for request in [item for item in self.queue if item.expires <= current_time]:
+                self.queue.remove(request)
+                self.count(request.caller, 1)
+            if self.queue:
+                request = max(self.queue, key=lambda item: (item.priority, -item.expires))
+                self.queue.remove(request)
+                self.start(request.key, request.priority, request.loops, request.max_time, request.fade_ms, request.squelch, request.nr, request.caller, current_time)
+
+    def report(self):
+        lines = ["Voice quotes by mode: queued / dropped / played"]
+        for caller in sorted(self.stats):
+            queued, dropped, played = self.stats[caller]
+            lines.append("  %-30s %5d %5d %5d" % (caller, queued, dropped, played))
+        return lines
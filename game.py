@@ -34,7 +34,6 @@ import time
 import datetime
 import os
 import shutil
-import yaml
 import copy
 import random
 
@@ -48,10 +47,17 @@ settings_defaults_path = curr_file_path + "/config/settings_template.yaml"
 user_settings_path = curr_file_path + "/config/user_settings.yaml"
 dots_path = curr_file_path + "/dots/"
 images_path = curr_file_path + "/images/"
+switch_log_path = curr_file_path + "/cache/switch_record.log"
 
 # Subclass BasicGame to create the main game
 class CCGame(game.BasicGame):
-    def __init__(self,machineType, fakePinProc = False):
+    def __init__(self,machineType, fakePinProc = False, headless = False):
+        # headless runs on fakepinproc with no window, no sound, and a virtual clock
+        self.headless = headless
+        self.simulator = None
+        if headless:
+            fakePinProc = True
+            self.simulator = ep.EP_Simulator()
         if (fakePinProc):
             self.fakePinProc = True
             config.values['pinproc_class'] = 'procgame.fakepinproc.FakePinPROC'
@@ -74,10 +80,44 @@ class CCGame(game.BasicGame):
         self.moonlightFlag = False
         # new flag for not counting flips when flippers are inactive in flip ct party mode
         self.flippers_active = False
+        # switch event recording and playback - set up by cc.py
+        self.recorder = None
+        self.playback = None
+        # how many times to run through the playback log
+        self.playback_runs = 1
+        # settings and game data get written by a background thread, unless turned off
+        if config.value_for_key_path(keypath='async_saves', default=True):
+            self.save_writer = ep.EP_SaveWriter()
+        else:
+            self.save_writer = None
+        # how long saves hold up the game loop
+        self.save_count = 0
+        self.save_stall = 0.0
+        self.save_stall_max = 0.0
+        # per mode timing - can also be turned on from the service menu
+        self.profiling = config.value_for_key_path(keypath='profiling', default=False)
+        # keep parsed lampshows on disk so startup can skip parsing them
+        self.lampshow_cache = config.value_for_key_path(keypath='lampshow_cache', default=True)
+        # same for the merged settings and game data
+        self.config_cache = config.value_for_key_path(keypath='config_cache', default=True)
+        # resets after the first only rebuild the per game state, if the settings haven't changed
+        self.soft_reset = config.value_for_key_path(keypath='soft_reset', default=True)
+        # the settings the assets and modes were last built with
+        self.resource_settings = None
+        # sounds get decoded on first play, and kept up to this many megabytes - 0 decodes everything at boot like before
+        self.sound_cache_mb = config.value_for_key_path(keypath='sound_cache_mb', default=24)
+        # how long a voice quote can wait for the one before it to finish, before it gets dropped
+        self.voice_queue_wait = config.value_for_key_path(keypath='voice_queue_wait', default=1.0)
+        # how many rendered strings the text cache keeps
+        ep.text_cache.limit = config.value_for_key_path(keypath='text_cache_size', default=512)
 
         use_desktop = config.value_for_key_path(keypath='use_desktop', default=True)
         self.color_desktop = config.value_for_key_path(keypath='color_desktop', default=False)
-        if use_desktop:
+        if headless:
+            print "Headless - No Desktop"
+            self.color_desktop = False
+            self.desktop = ep.EP_NullDesktop()
+        elif use_desktop:
             # if not color, run the old style pygame
             if not self.color_desktop:
                 print "Standard Desktop"
@@ -91,8 +131,20 @@ class CCGame(game.BasicGame):
 
         super(CCGame, self).__init__(machineType)
 
+        # swap in the mode queue that only sends switch events to the modes that want them
+        self.modes = ep.EP_ModeQueue(self, self.modes.modes)
+        self.modes.indexed = config.value_for_key_path(keypath='indexed_switches', default=True)
+
         self.load_config('cc_machine.yaml')
 
+        # lamp and coil commands get held and sent once per loop, unless turned off
+        self.driver_queue = None
+        if config.value_for_key_path(keypath='batch_drivers', default=True):
+            self.driver_queue = ep.EP_DriverQueue()
+            self.driver_queue.attach(self.lamps)
+            self.driver_queue.attach(self.coils)
+            self.modes.driver_queue = self.driver_queue
+
     def setup(self):
         # Instead of resetting everything here as well as when a user
         # initiated reset occurs, do everything in self.reset() and call it
@@ -101,12 +153,90 @@ class CCGame(game.BasicGame):
         self.proc.set_dmd_color_mapping([0,0,2,3,4,5,6,7,8,9,10,11,12,13,14,15])
 
         self.reset()
-
-    def reset(self):
+        if self.profiling:
+            ep.profiler.enable(self)
+
+    def start_recording(self, filename=switch_log_path):
+        """Record every switch event to a log, for playing the game back later"""
+        seed = int(time.time())
+        # seed random so playback makes the same choices
+        random.seed(seed)
+        log_dir = os.path.dirname(filename)
+        if not os.path.isdir(log_dir):
+            os.makedirs(log_dir)
+        self.recorder = ep.EP_SwitchRecorder(filename, seed)
+        print "Recording switch events to " + filename
+
+    def start_playback(self, filename=switch_log_path, speed=1.0, runs=1):
+        """Play back a recorded switch log - call before setup so random gets seeded first"""
+        self.playback = ep.EP_SwitchPlayback(filename, speed)
+        self.playback_runs = runs
+        if self.playback.seed != None:
+            random.seed(self.playback.seed)
+        print "Playing back " + str(len(self.playback.events)) + " switch events from " + filename
+
+    def stop_recording(self):
+        if self.recorder:
+            self.recorder.close()
+            self.recorder = None
+
+    def get_events(self):
+        events = super(CCGame, self).get_events()
+        if self.simulator:
+            events = self.simulator.next_events(events)
+        if self.playback:
+            events.extend(self.playback.get_events())
+            if self.playback.is_complete():
+                print self.playback.report()
+                self.playback_runs -= 1
+                if self.playback_runs > 0:
+                    # go again from a fresh game, with the same seed
+                    self.playback.rewind()
+                    if self.playback.seed != None:
+                        random.seed(self.playback.seed)
+                    self.reset()
+                else:
+                    # once the log is done, so is the run
+                    if self.simulator:
+                        print self.simulator.report()
+                    print self.save_report()
+                    if self.driver_queue:
+                        print self.driver_queue.report()
+                    print "\n".join(self.voice.report())
+                    if ep.profiler.enabled:
+                        ep.profiler.dump()
+                    self.playback = None
+                    self.end_run_loop()
+        return events
+
+    def process_event(self, event):
+        if self.recorder:
+            self.recorder.record(event)
+        super(CCGame, self).process_event(event)
+
+    def tick(self):
+        super(CCGame, self).tick()
+        if self.playback:
+            self.playback.tick()
+
+    def reset(self, hard=False):
         # run the reset from proc.game.BasicGame
         #super(CCGame,self).reset()
         # game reset stuff - copied in
-        """Reset the game state as a slam tilt might."""
+        """Reset the game state as a slam tilt might.
+
+        The heavy stuff - sound, assets, lamp controllers, displays and modes - only gets built again
+        if the settings have changed since last time, ``hard`` is set, or soft resets are turned off.
+        Otherwise just the per game state is reset.
+        """
+        start = time.time()
+        if self.resource_settings != None:
+            # stop the lampshows while they're still in the queue
+            self.lampctrl.stop_show()
+            self.GI_lampctrl.stop_show()
+            # nothing said before the reset gets said after it
+            self.voice.clear()
+        old_modes = self.modes.modes
         self.dejected = True
         self.ball = 0
         # used to prevent music start during slam tilt
@@ -133,6 +263,8 @@ class CCGame(game.BasicGame):
         # and settings Game settings
         print "Loading game settings"
         self.load_settings(settings_defaults_path, user_settings_path)
+        # the modes and assets read the settings when they're built - if anything changed, build them again
+        hard = hard or not self.soft_reset or self.user_settings != self.resource_settings
         # Party Mode
         self.party_setting = self.user_settings['Gameplay (Feature)']['Party Mode']
         print "Party Setting: " + str(self.party_setting)
@@ -142,22 +274,14 @@ class CCGame(game.BasicGame):
         self.enable_flippers(False)
 
 
-        # init the sound
-        self.sound = sound.SoundController(self)
-        # init the lamp controller
-        self.lampctrl = ep.EP_LampController(self)
-        # and a separate one for GI
-        self.GI_lampctrl = ep.EP_LampControllerGI(self)
-        # load all the assets (sound/dots)
-        self.assets = Assets(self)
+        if hard:
+            self.load_resources()
+        else:
+            # the score display caches its layers - make sure they get rebuilt
+            self.score_display.invalidate()
         # Set the current song for use with the music method
         self.current_music = self.assets.music_mainTheme
 
-        # reset score display to mine
-        self.score_display = cc_modes.ScoreDisplay(self,0)
-
-        self.showcase = ep.EP_Showcase(self)
-
         # last switch variable for tracking
         self.lastSwitch = None
         # last ramp for combo tracking
@@ -231,6 +355,73 @@ class CCGame(game.BasicGame):
         #          |___/                                                        |_|
 
 
+        if hard:
+            self.create_highscore_categories()
+        for category in self.highscore_categories:
+            category.load_from_game(self)
+
+        #  __  __           _             ___       _ _
+        # |  \/  | ___   __| | ___  ___  |_ _|_ __ (_) |_
+        # | |\/| |/ _ \ / _` |/ _ \/ __|  | || '_ \| | __|
+        # | |  | | (_) | (_| |  __/\__ \  | || | | | | |_
+        # |_|  |_|\___/ \__,_|\___||___/ |___|_| |_|_|\__|
+
+        if hard:
+            self.create_modes()
+        else:
+            self.refresh_modes(old_modes)
+        # Party Mode - if it's enabled
+        if self.party_setting != 'Disabled':
+            print "PARTY ON DUDES"
+            self.modes.add(self.party_mode)
+
+        if hard:
+            self.setup_desktop()
+
+        # Add in the base modes that are active at start
+        self.modes.add(self.lamp_control)
+        self.modes.add(self.trough)
+        self.modes.add(self.ball_search)
+        self.modes.add(self.attract_mode)
+        self.modes.add(self.train)
+        self.modes.add(self.mountain)
+        self.modes.add(self.badge)
+        self.modes.add(self.interrupter)
+        self.modes.add(self.switch_tracker)
+        self.modes.add(self.score_display)
+
+        if hard:
+            self.resource_settings = copy.deepcopy(self.user_settings)
+            print "Hard reset took %.2f seconds" % (time.time() - start)
+        else:
+            print "Soft reset took %.2f seconds" % (time.time() - start)
+
+    def load_resources(self):
+        """Builds the things that only need building once - sound, lamp controllers, assets and displays"""
+        # init the sound
+        if self.sound_cache_mb:
+            self.sound = ep.EP_SoundController(self, self.sound_cache_mb * 1024 * 1024)
+        else:
+            self.sound = sound.SoundController(self)
+        # headless runs with the sound off
+        if self.headless:
+            self.sound.enabled = False
+        # one voice quote at a time, on its own channel
+        self.voice = ep.EP_VoiceScheduler(self, self.voice_queue_wait)
+        self.modes.voice = self.voice
+        # init the lamp controller
+        self.lampctrl = ep.EP_LampController(self)
+        # and a separate one for GI
+        self.GI_lampctrl = ep.EP_LampControllerGI(self)
+        # load all the assets (sound/dots)
+        self.assets = Assets(self)
+
+        # reset score display to mine
+        self.score_display = cc_modes.ScoreDisplay(self,0)
+
+        self.showcase = ep.EP_Showcase(self)
+
+    def create_highscore_categories(self):
         self.highscore_categories = []
 
         cat = highscore.HighScoreCategory()
@@ -315,15 +506,8 @@ class CCGame(game.BasicGame):
         cat.titles = ['Moonlight Champ']
         self.highscore_categories.append(cat)
 
-        for category in self.highscore_categories:
-            category.load_from_game(self)
-
-        #  __  __           _             ___       _ _
-        # |  \/  | ___   __| | ___  ___  |_ _|_ __ (_) |_
-        # | |\/| |/ _ \ / _` |/ _ \/ __|  | || '_ \| | __|
-        # | |  | | (_) | (_| |  __/\__ \  | || | | | | |_
-        # |_|  |_|\___/ \__,_|\___||___/ |___|_| |_|_|\__|
-
+    def create_modes(self):
+        """Creates all the mode objects - these get reused from one reset to the next"""
         # franks and beans display mode rides above the score display, but below everything else
         self.franks_display = cc_modes.FranksDisplay(game=self, priority=1)
         # Create the objects for the basic modes
@@ -415,9 +599,6 @@ class CCGame(game.BasicGame):
         self.switch_tracker = cc_modes.SwitchTracker(game=self, priority=250)
         # Party Mode - if it's enabled
         self.party_mode = cc_modes.PartyMode(game=self, priority=251)
-        if self.party_setting != 'Disabled':
-            print "PARTY ON DUDES"
-            self.modes.add(self.party_mode)
 
         # new service mode test
         self.new_service = ep.ep_new_service.NewServiceMode(game=self, priority=200)
@@ -459,7 +640,23 @@ class CCGame(game.BasicGame):
 
         self.ep_modes.sort(lambda x, y: y.priority - x.priority)
 
-
+        # everything built above gets reused by soft resets - remember how each one starts out
+        rebuilt = (getattr(self, 'trough', None), getattr(self, 'ball_search', None), self.score_display)
+        self.reusable_modes = [mode for mode in self.__dict__.values() if isinstance(mode, ep.EP_Mode) and mode not in rebuilt]
+        for mode in self.reusable_modes:
+            mode.save_game_state()
+
+    def refresh_modes(self, old_modes):
+        """Gets the existing modes ready to go again after a soft reset"""
+        # anything that was running when the reset hit gets its delays stopped
+        for mode in old_modes:
+            if isinstance(mode, ep.EP_Mode):
+                mode.wipe_delays()
+        # and every mode goes back to how it was built - per game flags, counters, displays and all
+        for mode in self.reusable_modes:
+            mode.reset_game_state()
+
+    def setup_desktop(self):
         # set up the color desktop if we're using that
         if self.color_desktop:
             self.desktop.draw_window(self.user_settings['Machine (Standard)']['Color Display Pixel Size'],
@@ -474,19 +671,6 @@ class CCGame(game.BasicGame):
                 dotsToUse = dots_path
             self.desktop.load_images(dotsToUse,images_path)
 
-
-        # Add in the base modes that are active at start
-        self.modes.add(self.lamp_control)
-        self.modes.add(self.trough)
-        self.modes.add(self.ball_search)
-        self.modes.add(self.attract_mode)
-        self.modes.add(self.train)
-        self.modes.add(self.mountain)
-        self.modes.add(self.badge)
-        self.modes.add(self.interrupter)
-        self.modes.add(self.switch_tracker)
-        self.modes.add(self.score_display)
-
     def start_game(self,forceMoonlight=False):
         # dejected quote flag - resets at game start
         self.dejected = True
@@ -1000,44 +1184,57 @@ class CCGame(game.BasicGame):
     #                                   |___/
     # Player stats and progress tracking
 
-    def set_tracking(self,item,amount,key="foo"):
-        p = self.current_player()
-        if key != "foo":
-            p.player_stats[item][key] = amount
+    def set_tracking(self,item,amount,key=None):
+        stats = self.current_player().player_stats
+        if key != None:
+            stats[item][key] = amount
         else:
-            p.player_stats[item] = amount
+            stats[item] = amount
 
     # call from other modes to set a value
-    def increase_tracking(self,item,amount=1,key="foo"):
+    def increase_tracking(self,item,amount=1,key=None):
         # tick up a stat by a declared amount
-        p = self.current_player()
-        if key != "foo":
-            p.player_stats[item][key] += amount
-            return p.player_stats[item][key]
-        else:
-            p.player_stats[item] += amount
-            # send back the new value for use
-            return p.player_stats[item]
+        stats = self.current_player().player_stats
+        if key != None:
+            stats[item][key] += amount
+            return stats[item][key]
+        index = tracking.STAT_IDS.get(item)
+        if index == None:
+            stats[item] += amount
+            return stats[item]
+        values = stats.values
+        values[index] += amount
+        # send back the new value for use
+        return values[index]
 
      # call from other modes to set a value
-    def decrease_tracking(self,item,amount=1,key="foo"):
-        # tick up a stat by a declared amount
-        p = self.current_player()
-        if key != "foo":
-            p.player_stats[item][key] -= amount
-            return p.player_stats[item][key]
-        else:
-            p.player_stats[item] -= amount
-            # send back the new value for use
-            return p.player_stats[item]
+    def decrease_tracking(self,item,amount=1,key=None):
+        # tick down a stat by a declared amount
+        return self.increase_tracking(item,-amount,key)
 
     # return values to wherever
-    def show_tracking(self,item,key="foo"):
-      p = self.current_player()
-      if key != "foo":
-            return p.player_stats[item][key]
-      else:
-            return p.player_stats[item]
+    def show_tracking(self,item,key=None):
+        stats = self.current_player().player_stats
+        index = tracking.STAT_IDS.get(item)
+        if index == None:
+            value = stats[item]
+        else:
+            value = stats.values[index]
+        if key != None:
+            return value[key]
+        return value
+
+    # faster versions for hot spots - use an id from tracking.STAT_IDS instead of the name
+    def show_stat(self,stat_id):
+        return self.current_player().player_stats.values[stat_id]
+
+    def set_stat(self,stat_id,amount):
+        self.current_player().player_stats.values[stat_id] = amount
+
+    def increase_stat(self,stat_id,amount=1):
+        values = self.current_player().player_stats.values
+        values[stat_id] += amount
+        return values[stat_id]
 
     # invert tracking only used for bonus lanes, wise? dunno
     def invert_tracking(self,item):
@@ -1392,12 +1589,24 @@ class CCGame(game.BasicGame):
 
        See also: :meth:`save_settings`
        """
+        # make sure any queued save is on disk before reading it back
+        self.flush_saves()
+        start = time.time()
+        snapshot_sources = [template_filename, user_filename]
+        if not restore and self.config_cache:
+            snapshot = ep.load_snapshot('settings', snapshot_sources)
+            if snapshot:
+                self.settings, self.user_settings = snapshot
+                # the user file was good when the snapshot was made - back it up like a normal load would
+                shutil.copyfile(user_settings_path, user_settings_backup)
+                print "Settings loaded from snapshot in %.1fms" % ((time.time() - start) * 1000)
+                return
         self.user_settings = {}
         force_save = False
-        self.settings = yaml.load(open(template_filename, 'r'))
+        self.settings = ep.load_yaml(template_filename)
         if os.path.exists(user_filename):
             print "Settings file found, trying to load"
-            self.user_settings = yaml.load(open(user_filename, 'r'))
+            self.user_settings = ep.load_yaml(user_filename)
                 # check that we got something
             if self.user_settings:
                 print "Found settings. All good - Updating Backup"
@@ -1410,7 +1619,7 @@ class CCGame(game.BasicGame):
                     print "Found backup file, making copy"
                     # copy the backup to the main file and try again - the intent is to never open the backup
                     shutil.copy(user_settings_backup, user_settings_path)
-                    self.user_settings = yaml.load(open(user_filename, 'r'))
+                    self.user_settings = ep.load_yaml(user_filename)
                     # check now if we got something
                     if self.user_settings:
                         print "Backup settings loaded. All good"
@@ -1430,7 +1639,7 @@ class CCGame(game.BasicGame):
                 print "Found backup file, making copy"
                 # copy the backup to the main file and try again - the intent is to never open the backup
                 shutil.copy(user_settings_backup, user_settings_path)
-                self.user_settings = yaml.load(open(user_filename, 'r'))
+                self.user_settings = ep.load_yaml(user_filename)
                 # check now if we got something
                 if self.user_settings:
                     print "Backup settings loaded. All good"
@@ -1484,11 +1693,16 @@ class CCGame(game.BasicGame):
             print "Restore - Saving settings"
             self.save_settings()
             if not os.path.exists(user_settings_backup):
+                self.flush_saves()
                 print "Backup settings file not found - making one"
                 shutil.copyfile(user_settings_path, user_settings_backup)
+        elif self.config_cache:
+            # what we ended up with matches the files on disk - keep it for next time
+            ep.save_snapshot('settings', snapshot_sources, (self.settings, self.user_settings))
+        print "Settings parsed in %.1fms" % ((time.time() - start) * 1000)
 
     def save_settings(self, filename=None):
-        super(CCGame,self).save_settings(user_settings_path)
+        self.save_yaml(user_settings_path, self.user_settings)
 
     def remote_load_settings(self, restore=False, type="settings"):
         self.load_settings(settings_defaults_path, user_settings_path, restore, type=type)
@@ -1501,12 +1715,24 @@ class CCGame(game.BasicGame):
 
         See also: :meth:`save_game_data`
         """
+        # make sure any queued save is on disk before reading it back
+        self.flush_saves()
+        start = time.time()
+        snapshot_sources = [template_filename, user_filename]
+        if not restore and self.config_cache:
+            snapshot = ep.load_snapshot('game_data', snapshot_sources)
+            if snapshot:
+                self.game_data = snapshot
+                # the user file was good when the snapshot was made - back it up like a normal load would
+                shutil.copyfile(user_game_data_path, user_game_data_backup)
+                print "Game data loaded from snapshot in %.1fms" % ((time.time() - start) * 1000)
+                return
         self.game_data = {}
         force_save = False
-        template = yaml.load(open(template_filename, 'r'))
+        template = ep.load_yaml(template_filename)
         if os.path.exists(user_filename):
             print "Trying to load data from user file"
-            self.game_data = yaml.load(open(user_filename, 'r'))
+            self.game_data = ep.load_yaml(user_filename)
             # check that we got something
             if self.game_data:
                 print "Found data. All good - updating backup"
@@ -1519,7 +1745,7 @@ class CCGame(game.BasicGame):
                     # copy the backup to the main file and try again - the intent is to never open the backup
                     print "Backup file found, restoring"
                     shutil.copy(user_game_data_backup, user_game_data_path)
-                    self.game_data = yaml.load(open(user_game_data_path, 'r'))
+                    self.game_data = ep.load_yaml(user_game_data_path)
                     if self.game_data:
                         print "Backup data loaded. All good"
                     # If even the backup failed, default everything
@@ -1539,7 +1765,7 @@ class CCGame(game.BasicGame):
                 # copy the backup to the main file and try again - the intent is to never open the backup
                 print "Backup file found, restoring"
                 shutil.copy(user_game_data_backup, user_game_data_path)
-                self.game_data = yaml.load(open(user_game_data_path, 'r'))
+                self.game_data = ep.load_yaml(user_game_data_path)
                 if self.game_data:
                     print "Backup data loaded. All good"
                 # If even the backup failed, default everything
@@ -1565,14 +1791,48 @@ class CCGame(game.BasicGame):
         if restore or force_save:
             self.save_game_data()
             if not os.path.exists(user_game_data_backup):
+                self.flush_saves()
                 print "No backup found - making one"
                 shutil.copyfile(user_game_data_path, user_game_data_backup)
+        elif self.config_cache:
+            # what we ended up with matches the files on disk - keep it for next time
+            ep.save_snapshot('game_data', snapshot_sources, self.game_data)
+        print "Game data parsed in %.1fms" % ((time.time() - start) * 1000)
 
     def remote_load_game_data(self, restore=None):
         self.load_game_data(game_data_defaults_path, user_game_data_path, restore)
 
     def save_game_data(self, filename=None):
-        super(CCGame, self).save_game_data(user_game_data_path)
+        self.save_yaml(user_game_data_path, self.game_data)
+
+    def save_yaml(self, filename, data):
+        start = time.time()
+        if self.save_writer:
+            self.save_writer.save(filename, data)
+        else:
+            ep.write_yaml(filename, data)
+        stall = time.time() - start
+        self.save_count += 1
+        self.save_stall += stall
+        if stall > self.save_stall_max:
+            self.save_stall_max = stall
+        if ep.profiler.enabled:
+            ep.profiler.record("CCGame.save_yaml", start)
+
+    def flush_saves(self):
+        """Waits for any queued saves to hit the disk - for shutdown, or before reading the files back"""
+        if self.save_writer:
+            if not self.save_writer.flush():
+                print "Timed out waiting on saves"
+
+    def save_report(self):
+        if self.save_count == 0:
+            return "Saves: none"
+        if self.save_writer:
+            method = "background, %d writes" % self.save_writer.writes
+        else:
+            method = "direct"
+        return "Saves: %d (%s), loop stall avg %.2fms, max %.2fms" % (self.save_count, method, self.save_stall / self.save_count * 1000, self.save_stall_max * 1000)
 
     def load_doubler(self):
         if self.user_settings['Gameplay (Feature)']['2X Scoring Feature'] == 'Enabled':
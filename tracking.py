@@ -23,6 +23,251 @@
 ## All the tracking defaults piggybacked onto the player object
 ##
 from procgame import game
+from array import array
+
+# All the player stats and their starting values, in slot order
+STATS = (
+    ('bonus', 0),
+    ('greeted', False),
+    ('bozoBall', False),
+
+    ('bumperHits', 0),
+
+    ('adventureCompleteValue', 20000),
+
+    ('extraBallsTotal', 0),
+    # allows for stacking of extra balls - if pending > 0 then extra ball is lit
+    ('extraBallsPending', 0),
+
+    ('beerMugHitsTotal', 0),
+    ('beerMugHits', 0),
+    # drunk multiball - OPEN, READY, RUNNING
+    ('drunkMultiballStatus', "OPEN"),
+    ('drunkBonusValue', 500000),
+    # these two get set by the game settings
+    ('mug_shots', 0),
+    ('tumbleweedShots', 0),
+
+    ('rightRampShots', 0),
+    ('rightRampStage', 1),
+
+    ('leftRampShots', 0),
+    ('leftRampStage', 1),
+
+    ('centerRampShots', 0),
+    ('centerRampStage', 1),
+
+    ('leftLoopShots', 0),
+    ('leftLoopStage', 1),
+
+    ('rightLoopShots', 0),
+    ('rightLoopStage', 1),
+
+    ('fullLoops', 0),
+
+    ('saloonShots', 0),
+
+    ('mineShotsTotal', 0),
+    # mine status - OPEN, LOCK, READY, (RUNNING == Gold mine multiball)
+    ('mineStatus', "OPEN"),
+    ('goldMineStarted', 0),
+    ('banditAttacks', 0),
+    # used for progression to lock
+    ('mineHits', 0),
+    # balls currently locked
+    ('ballsLocked', 0),
+    ## running tally of locked balls
+    ('ballsLockedTotal', 0),
+    ('jackpotsCollected', 0),
+    ('motherlodeMultiplier', 1),
+    ('motherlodesCollected', 0),
+    ('motherlodesCollectedTotal', 0),
+    ('motherlodeValue', 0),
+    ('motherlodeLit', False),
+
+    # lit status for jackpots: Left Loop, Left Ramp, Center Ramp, Right Loop, Right Ramp
+    ('jackpotStatus', [True,True,True,True,True]),
+
+    ('bonusX', 1),
+    # bonus lane status OFF/ON - left is 0 right is 1
+    ('bonusLaneStatus', ["OFF","OFF"]),
+
+    ('bountyCollected', 0),
+    ('isBountyLit', False),
+
+    ('rank', 0),
+    ('combos', 0),
+    # needed for being able to reset the star
+    ('combosTotal', 0),
+    ('bigChain', 0),
+
+    # Quickdraw status - OPEN, TOP/BOT (for hard difficulty), READY, RUNNING-- 0 is left, 1 is right
+    ('quickdrawStatus', ["OPEN","OPEN"]),
+    ('quickdrawsStarted', 0),
+    ('quickdrawsWon', 0),
+    ('badGuysDead', [False,False,False,False]),
+    # these are separate because the bad guy can be dead (quickdraw) but also up (showdown/gunfight)
+    ('badGuyUp', [False,False,False,False]),
+    # showdown status - OPEN, READY, RUNNING, OVER (to hold until ambush)
+    ('showdownStatus', "OPEN"),
+    ('showdownTotal', 0),
+    ('showdownPoints', 0),
+    # ambush status - OPEN, READY, RUNNING, OVER (for switching between showdown and ambush)
+    ('ambushStatus', "OVER"),
+    ('ambushTotal', 0),
+    ('ambushPoints', 0),
+    # total kills for high noon
+    ('kills', 0),
+
+    # bartStatus: OPEN, RUNNING, LAST, DEAD
+    ('bartStatus', "OPEN"),
+    ('bartHits', 0),
+    # defeated since last badge reset
+    ('bartsDefeated', 0),
+    # total defeated including boss barts
+    ('bartsDefeatedTotal', 0),
+    # total regular barts defeated for finding spot
+    ('regularBartsDefeated', 0),
+    ('currentBart', 0),
+    ('gunfightsStarted', 0),
+    ('gunfightsWon', 0),
+    # gunfight status, OPEN, READY, RUNNING
+    ('gunfightStatus', "OPEN"),
+
+    # highNoonStatus = OPEN, READY, RUNNING
+    ('highNoonStatus', "OPEN"),
+    # list to store the lit items for the star ?
+    # Starts at the top of the star with 0, goes clockwise. 0 = motherlode, 1=combo, 2=barts, 3=showdown, 4=stampede
+    ('starStatus', [False, False, False, False, False]),
+    # Bionic Bart - OPEN / READY / RUNNING / DEAD
+    ('bionicStatus', "OPEN"),
+
+    # Move your train - OPEN / READY / RUNNING
+    ('mytStatus', "OPEN"),
+
+    ('tiltStatus', 0),
+    # used to disable the playfield lights in an update lamps pass
+    # lamp status modes: ON, OFF
+    ('lampStatus', "ON"),
+
+    # a new idea - stack level for tracking what can or can not start
+    # Level 0 is Gunfight, Quick Draw only one of these can run at a time, and can finish even if a higher level starts
+    # Level 1 is Ambush & Showdown
+    # Level 2 is Save Polly modes - only one of these can run at a time, and they are allowed to run with level 0
+    # Level 3 is drunk multiball
+    # Level 4 is goldmine multiball, stampede
+    # Level 5 is cva,marshall,boss bart,tribute
+    # level 6 is bionic bart,high noon
+    ('stackLevel', [False,False,False,False,False,False,False]),
+
+    # ramp values for after they're finished
+    ('leftRampValue', 2000),
+    ('rightRampValue', 2000),
+    ('centerRampValue', 2000),
+    # Tumbleweed increases 5000 per shot - so the first one is actually 25000 when scored
+    ('tumbleweedValue', 20000),
+    ('tumbleweedHits', 0),
+    ('tumbleweedHitsTotal', 0),
+    # cva OPEN, READY, RUNNING
+    ('cvaStatus', "OPEN"),
+
+    ('marshallBest', 0),
+    ('marshallMultiballRun', False),
+
+    # collect points for last call
+    ('lastCallTotal', 0),
+
+    # track if player already did moonlight madness within this game
+    ('moonlightStatus', False),
+    ('moonlightTotal', 0),
+
+    # track if player already did franks and beans within this game
+    ('farted', False),
+    ('fartTotal', 0),
+
+    # player earned replay
+    ('replay_earned', False),
+    ('replay_hint', False),
+
+    # bounty index for tournament mode
+    ('bountyIndex', 0),
+
+    # flip counts for party mode
+    ('Total Flips', 0),
+    ('Left Flips', 0),
+    ('Right Flips', 0),
+    ('Flip Limit', 0),
+
+    # jackpot value for stampede
+    ('Stampede Value', 250000),
+    ('Stampede Addon', 0),
+    ('Stampede Total', 0),
+    ('Stampede Best', 0),
+)
+
+# the on/off lists that get a fixed size flag array instead of a list
+FLAG_STATS = ('jackpotStatus', 'badGuyUp', 'starStatus', 'stackLevel')
+
+STAT_NAMES = tuple([name for name, default in STATS])
+# integer id for each stat - for the hot spots, use with PlayerStats.values or CCGame.show_stat
+STAT_IDS = dict([(name, index) for index, name in enumerate(STAT_NAMES)])
+
+class PlayerStats(object):
+    """Player stats stored by slot instead of a dict per player.  Works like the old dict for
+    the string keys - anything that isn't in STATS ends up in extra."""
+    __slots__ = ('values', 'extra')
+
+    def __init__(self):
+        values = []
+        for name, default in STATS:
+            if name in FLAG_STATS:
+                values.append(array('b', default))
+            elif isinstance(default, list):
+                values.append(list(default))
+            else:
+                values.append(default)
+        self.values = values
+        self.extra = {}
+
+    def __getitem__(self, name):
+        index = STAT_IDS.get(name)
+        if index == None:
+            return self.extra[name]
+        return self.values[index]
+
+    def __setitem__(self, name, value):
+        index = STAT_IDS.get(name)
+        if index == None:
+            self.extra[name] = value
+        elif name in FLAG_STATS and not isinstance(value, array):
+            self.values[index] = array('b', value)
+        else:
+            self.values[index] = value
+
+    def __contains__(self, name):
+        return name in STAT_IDS or name in self.extra
+
+    def get(self, name, default=None):
+        if name in self:
+            return self[name]
+        return default
+
+    def keys(self):
+        return list(STAT_NAMES) + self.extra.keys()
+
+    def snapshot(self):
+        """Returns a copy of the stats that restore can put back later"""
+        values = []
+        for value in self.values:
+            if isinstance(value, (array, list)):
+                value = value[:]
+            values.append(value)
+        return (values, dict(self.extra))
+
+    def restore(self, snapshot):
+        values, extra = snapshot
+        self.values = [value[:] if isinstance(value, (array, list)) else value for value in values]
+        self.extra = dict(extra)
 
 class Tracking(game.Player):
     """Object for tracking player stats - instantiates with add player"""
@@ -30,183 +275,5 @@ class Tracking(game.Player):
     # modes could set their own values?
     def __init__(self, name):
         super(Tracking, self).__init__(name)
-
-        self.player_stats = {}
-
-        # load up tracking stats for the player
-        self.player_stats['bonus'] = 0
-        self.player_stats['greeted'] = False
-        self.player_stats['bozoBall'] = False
-
-        self.player_stats['bumperHits'] = 0
-
-        self.player_stats['adventureCompleteValue'] = 20000
-
-        self.player_stats['extraBallsTotal'] = 0
-        # allows for stacking of extra balls - if pending > 0 then extra ball is lit
-        self.player_stats['extraBallsPending'] = 0
-
-        self.player_stats['beerMugHitsTotal'] = 0
-        self.player_stats['beerMugHits'] = 0
-        # drunk multiball - OPEN, READY, RUNNING
-        self.player_stats['drunkMultiballStatus'] = "OPEN"
-        self.player_stats['drunkBonusValue'] = 500000
-        # these two get set by the game settings
-        self.player_stats['mug_shots'] = 0
-        self.player_stats['tumbleweedShots'] = 0
-
-        self.player_stats['rightRampShots'] = 0
-        self.player_stats['rightRampStage'] = 1
-
-        self.player_stats['leftRampShots'] = 0
-        self.player_stats['leftRampStage'] = 1
-
-        self.player_stats['centerRampShots'] = 0
-        self.player_stats['centerRampStage'] = 1
-
-        self.player_stats['leftLoopShots'] = 0
-        self.player_stats['leftLoopStage'] = 1
-
-        self.player_stats['rightLoopShots'] = 0
-        self.player_stats['rightLoopStage'] = 1
-
-        self.player_stats['fullLoops'] = 0
-
-        self.player_stats['saloonShots'] = 0
-
-        self.player_stats['mineShotsTotal'] = 0
-        # mine status - OPEN, LOCK, READY, (RUNNING == Gold mine multiball)
-        self.player_stats['mineStatus'] = "OPEN"
-        self.player_stats['goldMineStarted'] = 0
-        self.player_stats['banditAttacks'] = 0
-        # used for progression to lock
-        self.player_stats['mineHits'] = 0
-        # balls currently locked
-        self.player_stats['ballsLocked'] = 0
-        ## running tally of locked balls
-        self.player_stats['ballsLockedTotal'] = 0
-        self.player_stats['jackpotsCollected'] = 0
-        self.player_stats['motherlodeMultiplier'] = 1
-        self.player_stats['motherlodesCollected'] = 0
-        self.player_stats['motherlodesCollectedTotal'] = 0
-        self.player_stats['motherlodeValue'] = 0
-        self.player_stats['motherlodeLit'] = False
-
-        # lit status for jackpots: Left Loop, Left Ramp, Center Ramp, Right Loop, Right Ramp
-        self.player_stats['jackpotStatus'] = [True,True,True,True,True]
-
-        self.player_stats['bonusX'] = 1
-        # bonus lane status OFF/ON - left is 0 right is 1
-        self.player_stats['bonusLaneStatus'] = ["OFF","OFF"]
-
-        self.player_stats['bountyCollected'] = 0
-        self.player_stats['isBountyLit'] = False
-
-        self.player_stats['rank'] = 0
-        self.player_stats['combos'] = 0
-        # needed for being able to reset the star
-        self.player_stats['combosTotal'] = 0
-        self.player_stats['bigChain'] = 0
-
-        # Quickdraw status - OPEN, TOP/BOT (for hard difficulty), READY, RUNNING-- 0 is left, 1 is right
-        self.player_stats['quickdrawStatus'] = ["OPEN","OPEN"]
-        self.player_stats['quickdrawsStarted'] = 0
-        self.player_stats['quickdrawsWon'] = 0
-        self.player_stats['badGuysDead'] = [False,False,False,False]
-        # these are separate because the bad guy can be dead (quickdraw) but also up (showdown/gunfight)
-        self.player_stats['badGuyUp'] = [False,False,False,False]
-        # showdown status - OPEN, READY, RUNNING, OVER (to hold until ambush)
-        self.player_stats['showdownStatus'] = "OPEN"
-        self.player_stats['showdownTotal'] = 0
-        self.player_stats['showdownPoints'] = 0
-        # ambush status - OPEN, READY, RUNNING, OVER (for switching between showdown and ambush)
-        self.player_stats['ambushStatus'] = "OVER"
-        self.player_stats['ambushTotal'] = 0
-        self.player_stats['ambushPoints'] = 0
-        # total kills for high noon
-        self.player_stats['kills'] = 0
-
-        # bartStatus: OPEN, RUNNING, LAST, DEAD
-        self.player_stats['bartStatus'] = "OPEN"
-        self.player_stats['bartHits'] = 0
-        # defeated since last badge reset
-        self.player_stats['bartsDefeated'] = 0
-        # total defeated including boss barts
-        self.player_stats['bartsDefeatedTotal'] = 0
-        # total regular barts defeated for finding spot
-        self.player_stats['regularBartsDefeated'] = 0
-        self.player_stats['currentBart'] = 0
-        self.player_stats['gunfightsStarted'] = 0
-        self.player_stats['gunfightsWon'] = 0
-        # gunfight status, OPEN, READY, RUNNING
-        self.player_stats['gunfightStatus'] = "OPEN"
-
-        # highNoonStatus = OPEN, READY, RUNNING
-        self.player_stats['highNoonStatus'] = "OPEN"
-        # list to store the lit items for the star ?
-        # Starts at the top of the star with 0, goes clockwise. 0 = motherlode, 1=combo, 2=barts, 3=showdown, 4=stampede
-        self.player_stats['starStatus'] = [False, False, False, False, False]
-        # Bionic Bart - OPEN / READY / RUNNING / DEAD
-        self.player_stats['bionicStatus'] = "OPEN"
-
-        # Move your train - OPEN / READY / RUNNING
-        self.player_stats['mytStatus'] = "OPEN"
-
-        self.player_stats['tiltStatus'] = 0
-        # used to disable the playfield lights in an update lamps pass
-        # lamp status modes: ON, OFF
-        self.player_stats['lampStatus'] = "ON"
-
-        # a new idea - stack level for tracking what can or can not start
-        # Level 0 is Gunfight, Quick Draw only one of these can run at a time, and can finish even if a higher level starts
-        # Level 1 is Ambush & Showdown
-        # Level 2 is Save Polly modes - only one of these can run at a time, and they are allowed to run with level 0
-        # Level 3 is drunk multiball
-        # Level 4 is goldmine multiball, stampede
-        # Level 5 is cva,marshall,boss bart,tribute
-        # level 6 is bionic bart,high noon
-        self.player_stats['stackLevel'] = [False,False,False,False,False,False,False]
-
-        # ramp values for after they're finished
-        self.player_stats['leftRampValue'] = 2000
-        self.player_stats['rightRampValue'] = 2000
-        self.player_stats['centerRampValue'] = 2000
-        # Tumbleweed increases 5000 per shot - so the first one is actually 25000 when scored
-        self.player_stats['tumbleweedValue'] = 20000
-        self.player_stats['tumbleweedHits'] = 0
-        self.player_stats['tumbleweedHitsTotal'] = 0
-        # cva OPEN, READY, RUNNING
-        self.player_stats['cvaStatus'] = "OPEN"
-
-        self.player_stats['marshallBest'] = 0
-        self.player_stats['marshallMultiballRun'] = False
-
-        # collect points for last call
-        self.player_stats['lastCallTotal'] = 0
-
-        # track if player already did moonlight madness within this game
-        self.player_stats['moonlightStatus'] = False
-        self.player_stats['moonlightTotal'] = 0
-
-        # track if player already did franks and beans within this game
-        self.player_stats['farted'] = False
-        self.player_stats['fartTotal'] = 0
-
-        # player earned replay
-        self.player_stats['replay_earned'] = False
-        self.player_stats['replay_hint'] = False
-
-        # bounty index for tournament mode
-        self.player_stats['bountyIndex'] = 0
-
-        # flip counts for party mode
-        self.player_stats['Total Flips'] = 0
-        self.player_stats['Left Flips'] = 0
-        self.player_stats['Right Flips'] = 0
-        self.player_stats['Flip Limit'] = 0
-
-        # jackpot value for stampede
-        self.player_stats['Stampede Value'] = 250000
-        self.player_stats['Stampede Addon'] = 0
-        self.player_stats['Stampede Total'] = 0
-        self.player_stats['Stampede Best'] = 0
\ No newline at end of file
+        # load up tracking stats for the player - the defaults are in STATS
+        self.player_stats = PlayerStats()